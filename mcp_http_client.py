@@ -5,11 +5,75 @@ Provides HTTP request capabilities for API calls
 
 import logging
 import requests
-from typing import Dict, Any, Optional
+import urllib3
+from urllib3.exceptions import (
+    HTTPError as URLLib3Error,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    SSLError,
+    TimeoutError as URLLib3Timeout,
+)
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+from urllib.parse import urlencode, urljoin
+from functools import lru_cache
+from urllib3.util import parse_url
+
+# Optional: orjson for faster request/response bodies
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json as _stdlib_json
+
+    _json_loads = _stdlib_json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj).encode('utf-8')
+
+# Optional: httpx for HTTP/2 multiplexing (needs the h2 extra: pip install 'httpx[http2]')
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+    _HTTPX_TIMEOUT_ERRORS = (httpx.TimeoutException,)
+    _HTTPX_CONNECT_ERRORS = (httpx.NetworkError, httpx.RemoteProtocolError)
+    _HTTPX_ERRORS = (httpx.HTTPError,)
+except ImportError:
+    HTTPX_AVAILABLE = False
+    _HTTPX_TIMEOUT_ERRORS = _HTTPX_CONNECT_ERRORS = _HTTPX_ERRORS = ()
 
 logger = logging.getLogger(__name__)
 
+ALLOWED_SCHEMES = ('http://', 'https://')
+
+# Errors are retried by _request itself; urllib3 only follows redirects
+_POOL_RETRIES = urllib3.Retry(total=None, connect=0, read=0, other=0, status=0,
+                              redirect=30, raise_on_redirect=False)
+# Credentials urllib3 strips when a redirect leaves the original host
+_CROSS_HOST_STRIP = frozenset(h.lower() for h in urllib3.Retry.DEFAULT_REMOVE_HEADERS_ON_REDIRECT)
+
+
+@lru_cache(maxsize=512)
+def _split_url(url: str):
+    """Parse a request URL once; repeat calls to the same URL skip urllib3's regex parsing"""
+    return parse_url(url)
+
+
+def _decode_text(body: bytes, content_type: str) -> str:
+    """Decode a response body using the charset from its Content-Type header"""
+    charset = 'utf-8'
+    if 'charset=' in content_type:
+        charset = content_type.split('charset=', 1)[1].split(';', 1)[0].strip().strip('"\'')
+    try:
+        return body.decode(charset, errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
 
 class MCPHTTPClient:
     """
@@ -17,21 +81,60 @@ class MCPHTTPClient:
     Provides safe HTTP client functionality for API calls
     """
 
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, timeout: int = 30, max_retries: int = 3,
+                 warmup_hosts: Optional[List[str]] = None,
+                 include_timestamps: bool = False, http2: bool = False):
         """
         Initialize HTTP client
 
         Args:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
+            warmup_hosts: Base URLs to open pooled connections to up front
+            include_timestamps: Add a 'requested_at' ISO timestamp to each result
+            http2: Send API calls over one multiplexed HTTP/2 connection per host (requires httpx)
         """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.include_timestamps = include_timestamps
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Parallax-Voice-Office/1.0'
+            'User-Agent': 'Parallax-Voice-Office/1.0',
+            'Connection': 'keep-alive'
         })
-        logger.info(f"HTTP client initialized (timeout: {timeout}s, retries: {max_retries})")
+        # Read bodies eagerly so connections go straight back to the pool
+        self.session.stream = False
+        # API calls go through urllib3 directly; the session is kept for downloads and HEAD requests
+        self._pool = urllib3.PoolManager(num_pools=32, maxsize=64)
+        self._default_headers = dict(self.session.headers)
+        # Last-seen validators and bodies per GET URL, used for conditional requests
+        self._validators: Dict[str, Dict[str, Any]] = {}
+
+        self._client = None
+        if http2:
+            if HTTPX_AVAILABLE:
+                try:
+                    self._client = httpx.Client(
+                        http2=True,
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32,
+                                            keepalive_expiry=30.0),
+                        timeout=self.timeout
+                    )
+                except ImportError:
+                    logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+            else:
+                logger.warning("HTTP/2 requested but httpx is not installed, using HTTP/1.1")
+
+        # Pay the TCP/TLS handshake for known hosts now rather than on the first real call
+        for host in warmup_hosts or []:
+            try:
+                self._send('HEAD', host, None, self._default_headers, self.timeout)
+            except (URLLib3Error,) + _HTTPX_ERRORS as e:
+                logger.debug(f"Warmup request to {host} failed: {e}")
+
+        logger.info(f"HTTP client initialized (timeout: {timeout}s, retries: {max_retries}, "
+                    f"http2: {self._client is not None})")
 
     def get(self, url: str, params: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -46,7 +149,41 @@ class MCPHTTPClient:
         Returns:
             Response data
         """
-        return self._request('GET', url, params=params, headers=headers)
+        cache_key = f"{url}?{urlencode(sorted(params.items()), doseq=True)}" if params else url
+        cached = self._validators.get(cache_key)
+
+        if cached:
+            conditional = {}
+            if cached['etag']:
+                conditional['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                conditional['If-Modified-Since'] = cached['last_modified']
+            headers = {**conditional, **(headers or {})}
+
+        result = self._request('GET', url, params=params, headers=headers)
+
+        status_code = result.get('status_code')
+        if status_code == 304 and cached:
+            # Unchanged on the server - serve the body we already have
+            result['data'] = cached['body']
+            result['content_type'] = cached['content_type']
+            result['from_cache'] = True
+        elif status_code is not None and 200 <= status_code < 300:
+            response_headers = {k.lower(): v for k, v in result['headers'].items()}
+            etag = response_headers.get('etag')
+            last_modified = response_headers.get('last-modified')
+            if etag or last_modified:
+                self._validators[cache_key] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'body': result['data'],
+                    'content_type': result['content_type'],
+                    'headers': result['headers']
+                }
+            else:
+                self._validators.pop(cache_key, None)
+
+        return result
 
     def post(self, url: str, data: Optional[Dict[str, Any]] = None,
              json: Optional[Dict[str, Any]] = None,
@@ -95,6 +232,44 @@ class MCPHTTPClient:
         """
         return self._request('DELETE', url, headers=headers)
 
+    def _send(self, method: str, url: str, body: Any, headers: Dict[str, str],
+              timeout: float) -> Tuple[int, str, Dict[str, str], bytes]:
+        """
+        Send a single request on the active transport
+
+        Returns:
+            Tuple of (status code, reason phrase, response headers, body bytes)
+        """
+        if self._client is not None:
+            response = self._client.request(method, url, content=body, headers=headers, timeout=timeout)
+            return response.status_code, response.reason_phrase, dict(response.headers), response.content
+
+        # Go straight to the host's connection pool with the pre-parsed URL
+        parts = _split_url(url)
+        pool = self._pool.connection_from_host(parts.host, port=parts.port, scheme=parts.scheme)
+        response = pool.urlopen(
+            method, parts.request_uri, body=body, headers=headers, timeout=timeout,
+            retries=_POOL_RETRIES, redirect=False, assert_same_host=False
+        )
+
+        location = response.get_redirect_location()
+        if location:
+            # Hand redirects to the PoolManager, which handles cross-host hops
+            location = urljoin(url, location)
+            if response.status == 303:
+                method, body = 'GET', None
+                headers = {k: v for k, v in headers.items()
+                           if k.lower() not in ('content-type', 'content-length')}
+            if _split_url(location).host != parts.host:
+                headers = {k: v for k, v in headers.items()
+                           if k.lower() not in _CROSS_HOST_STRIP}
+            response = self._pool.urlopen(
+                method, location, body=body, headers=headers,
+                timeout=timeout, retries=_POOL_RETRIES
+            )
+
+        return response.status, response.reason, dict(response.headers), response.data
+
     def _request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         """
         Perform HTTP request with retries
@@ -109,23 +284,46 @@ class MCPHTTPClient:
         """
         try:
             # Validate URL
-            if not url.startswith(('http://', 'https://')):
+            if not url.startswith(ALLOWED_SCHEMES):
                 return {
                     "status": "error",
                     "message": "URL must start with http:// or https://"
                 }
 
-            # Prepare request
-            request_kwargs = {
-                'timeout': self.timeout,
-                **kwargs
-            }
+            timeout = kwargs.get('timeout', self.timeout)
+
+            # Build the request the way requests would: query string, form or JSON body
+            request_url = url
+            params = kwargs.get('params')
+            if params:
+                request_url = f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+
+            request_headers = self._default_headers
+            body = None
+            data = kwargs.get('data')
+            json_body = kwargs.get('json')
+            extra_headers = kwargs.get('headers')
+            if data is not None or json_body is not None or extra_headers:
+                request_headers = dict(request_headers)
+                if data is not None:
+                    if isinstance(data, dict):
+                        body = urlencode(data, doseq=True)
+                        request_headers['Content-Type'] = 'application/x-www-form-urlencoded'
+                    else:
+                        body = data
+                elif json_body is not None:
+                    body = _json_dumps(json_body)
+                    request_headers['Content-Type'] = 'application/json'
+                if extra_headers:
+                    request_headers.update(extra_headers)
 
             # Perform request with retries
             last_error = None
             for attempt in range(self.max_retries):
                 try:
-                    response = self.session.request(method, url, **request_kwargs)
+                    status_code, reason, response_headers, content = self._send(
+                        method, request_url, body, request_headers, timeout
+                    )
 
                     # Parse response
                     result = {
@@ -133,39 +331,55 @@ class MCPHTTPClient:
                         "operation": "http_request",
                         "method": method,
                         "url": url,
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "requested_at": datetime.now().isoformat()
+                        "status_code": status_code,
+                        "headers": response_headers
                     }
+                    if self.include_timestamps:
+                        result['requested_at'] = datetime.now().isoformat()
 
                     # Try to parse as JSON
                     try:
-                        result['data'] = response.json()
+                        result['data'] = _json_loads(content)
                         result['content_type'] = 'json'
-                    except:
-                        result['data'] = response.text
+                    except ValueError:
+                        content_type = next((v for k, v in response_headers.items()
+                                             if k.lower() == 'content-type'), '')
+                        result['data'] = _decode_text(content, content_type)
                         result['content_type'] = 'text'
 
                     # Add success flag
-                    result['success'] = response.status_code < 400
+                    result['success'] = status_code < 400
 
                     if not result['success']:
-                        result['error'] = f"HTTP {response.status_code}: {response.reason}"
+                        result['error'] = f"HTTP {status_code}: {reason}"
 
                     return result
 
-                except requests.exceptions.Timeout:
-                    last_error = f"Request timeout after {self.timeout}s (attempt {attempt + 1}/{self.max_retries})"
+                except URLLib3Error as e:
+                    # urllib3 reports the underlying failure as the reason of a MaxRetryError
+                    error = e.reason if isinstance(e, MaxRetryError) and e.reason else e
+
+                    if isinstance(error, (NewConnectionError, ProtocolError, SSLError)):
+                        last_error = f"Connection error: {str(error)} (attempt {attempt + 1}/{self.max_retries})"
+                        logger.warning(last_error)
+                    elif isinstance(error, URLLib3Timeout):
+                        last_error = f"Request timeout after {timeout}s (attempt {attempt + 1}/{self.max_retries})"
+                        logger.warning(last_error)
+                    else:
+                        last_error = f"Request error: {str(error)}"
+                        logger.error(last_error)
+                        break  # Don't retry on general request errors
+
+                except _HTTPX_TIMEOUT_ERRORS:
+                    last_error = f"Request timeout after {timeout}s (attempt {attempt + 1}/{self.max_retries})"
                     logger.warning(last_error)
-
-                except requests.exceptions.ConnectionError as e:
+                except _HTTPX_CONNECT_ERRORS as e:
                     last_error = f"Connection error: {str(e)} (attempt {attempt + 1}/{self.max_retries})"
                     logger.warning(last_error)
-
-                except requests.exceptions.RequestException as e:
+                except _HTTPX_ERRORS as e:
                     last_error = f"Request error: {str(e)}"
                     logger.error(last_error)
-                    break  # Don't retry on general request errors
+                    break
 
             # All retries failed
             return {
@@ -247,8 +461,11 @@ class MCPHTTPClient:
             }
 
     def shutdown(self):
-        """Close the HTTP session"""
+        """Close the HTTP session and connection pools"""
         self.session.close()
+        self._pool.clear()
+        if self._client is not None:
+            self._client.close()
 
 
 # Import Path for download method
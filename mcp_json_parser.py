@@ -3,13 +3,169 @@ MCP JSON/YAML Parser Server
 Provides JSON and YAML parsing and manipulation tools
 """
 
+import io
 import json
 import yaml
 import logging
+from decimal import Decimal
 from typing import Dict, Any, Union, List
 
+# Optional: ijson lets large JSON documents be converted without building the object tree
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional: fast validate-only JSON parsing (simdjson, then orjson, then stdlib)
+try:
+    import simdjson
+    _simdjson_parser = simdjson.Parser()
+
+    def _fast_validate(json_string: str) -> None:
+        _simdjson_parser.parse(json_string.encode('utf-8') if isinstance(json_string, str) else json_string)
+except ImportError:
+    try:
+        import orjson
+
+        def _fast_validate(json_string: str) -> None:
+            orjson.loads(json_string)
+    except ImportError:
+        _fast_validate = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Inputs at least this large are converted event-by-event instead of via a full object tree
+STREAM_THRESHOLD = 64 * 1024
+
+
+class _StreamFallback(Exception):
+    """Raised when a document uses features the streaming converters can't express"""
+
+
+def _json_to_yaml_stream(json_string: str) -> str:
+    """Translate ijson parse events directly into YAML emitter events"""
+    out = io.StringIO()
+    emitter = yaml.emitter.Emitter(out, allow_unicode=True)
+    representer = yaml.representer.SafeRepresenter()
+    resolver = yaml.resolver.Resolver()
+
+    def emit_scalar(value):
+        if isinstance(value, Decimal):
+            value = float(value)
+        node = representer.represent_data(value)
+        implicit = (node.tag == resolver.resolve(yaml.ScalarNode, node.value, (True, False)),
+                    node.tag == resolver.resolve(yaml.ScalarNode, node.value, (False, True)))
+        emitter.emit(yaml.ScalarEvent(None, None, implicit, node.value, style=node.style))
+
+    emitter.emit(yaml.StreamStartEvent())
+    emitter.emit(yaml.DocumentStartEvent(explicit=False))
+
+    for _, event, value in ijson.parse(io.BytesIO(json_string.encode('utf-8'))):
+        if event == 'start_map':
+            emitter.emit(yaml.MappingStartEvent(None, None, True, flow_style=False))
+        elif event == 'end_map':
+            emitter.emit(yaml.MappingEndEvent())
+        elif event == 'start_array':
+            emitter.emit(yaml.SequenceStartEvent(None, None, True, flow_style=False))
+        elif event == 'end_array':
+            emitter.emit(yaml.SequenceEndEvent())
+        else:
+            # map_key, string, number, boolean and null events all carry a scalar
+            emit_scalar(value)
+
+    emitter.emit(yaml.DocumentEndEvent(explicit=False))
+    emitter.emit(yaml.StreamEndEvent())
+    return out.getvalue()
+
+
+def _yaml_to_json_stream(yaml_string: str, pretty: bool = True) -> str:
+    """Translate YAML parser events directly into JSON text"""
+    loader = yaml.SafeLoader(yaml_string)
+    out = io.StringIO()
+    write = out.write
+    indent = '  ' if pretty else None
+    item_sep = ',' if pretty else ', '
+    # Each frame: [is_mapping, item_count, expecting_key, seen_keys]
+    stack = []
+
+    def before_value():
+        if not stack:
+            return
+        frame = stack[-1]
+        if frame[0] and not frame[2]:
+            # Value half of a key/value pair - the key already wrote the separator
+            frame[2] = True
+            return
+        if frame[1]:
+            write(item_sep)
+        if indent:
+            write('\n' + indent * len(stack))
+        frame[1] += 1
+
+    def write_key(value):
+        frame = stack[-1]
+        if not isinstance(value, str):
+            if value is None or isinstance(value, (bool, int, float)):
+                value = json.dumps(value)
+            else:
+                raise TypeError(f"keys must be str, int, float, bool or None, not {type(value).__name__}")
+        if value in frame[3]:
+            raise _StreamFallback("duplicate mapping key")
+        frame[3].add(value)
+        before_value()
+        write(json.dumps(value, ensure_ascii=False) + ': ')
+        frame[2] = False
+
+    def open_container(is_mapping):
+        before_value()
+        write('{' if is_mapping else '[')
+        stack.append([is_mapping, 0, True, set() if is_mapping else None])
+
+    def close_container():
+        frame = stack.pop()
+        if frame[1] and indent:
+            write('\n' + indent * len(stack))
+        write('}' if frame[0] else ']')
+
+    try:
+        while loader.check_event():
+            event = loader.get_event()
+            if isinstance(event, yaml.AliasEvent) or getattr(event, 'anchor', None):
+                raise _StreamFallback("anchors and aliases")
+            if isinstance(event, yaml.ScalarEvent):
+                tag = event.tag
+                if tag is None or tag == '!':
+                    tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+                if tag == 'tag:yaml.org,2002:merge':
+                    raise _StreamFallback("merge keys")
+                constructor = loader.yaml_constructors.get(tag)
+                if constructor is None:
+                    raise _StreamFallback(f"unsupported tag {tag}")
+                value = constructor(loader, yaml.ScalarNode(tag, event.value, style=event.style))
+                if stack and stack[-1][0] and stack[-1][2]:
+                    write_key(value)
+                else:
+                    before_value()
+                    write(json.dumps(value, ensure_ascii=False))
+            elif isinstance(event, yaml.MappingStartEvent):
+                if stack and stack[-1][0] and stack[-1][2]:
+                    raise _StreamFallback("complex mapping keys")
+                open_container(True)
+            elif isinstance(event, yaml.SequenceStartEvent):
+                if stack and stack[-1][0] and stack[-1][2]:
+                    raise _StreamFallback("complex mapping keys")
+                open_container(False)
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                close_container()
+            elif isinstance(event, yaml.DocumentStartEvent) and out.tell():
+                raise _StreamFallback("multiple documents")
+    finally:
+        loader.dispose()
+
+    # An empty stream loads as None
+    return out.getvalue() or 'null'
+
 
 class MCPJSONParser:
     """
@@ -130,14 +286,23 @@ class MCPJSONParser:
         Returns:
             Validation result
         """
+        valid = {
+            "status": "success",
+            "operation": "validate_json",
+            "valid": True,
+            "message": "JSON is valid"
+        }
+        try:
+            _fast_validate(json_string)
+            return valid
+        except Exception:
+            pass
+
+        # Rare path: re-parse with the stdlib for line/column details. This also
+        # accepts documents the fast parsers are stricter about (e.g. NaN).
         try:
             json.loads(json_string)
-            return {
-                "status": "success",
-                "operation": "validate_json",
-                "valid": True,
-                "message": "JSON is valid"
-            }
+            return valid
         except json.JSONDecodeError as e:
             return {
                 "status": "success",
@@ -159,8 +324,11 @@ class MCPJSONParser:
             YAML string
         """
         try:
-            data = json.loads(json_string)
-            yaml_string = yaml.dump(data, default_flow_style=False, allow_unicode=True)
+            if IJSON_AVAILABLE and len(json_string) >= STREAM_THRESHOLD:
+                yaml_string = _json_to_yaml_stream(json_string)
+            else:
+                data = json.loads(json_string)
+                yaml_string = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
             return {
                 "status": "success",
@@ -185,11 +353,19 @@ class MCPJSONParser:
             JSON string
         """
         try:
-            data = yaml.safe_load(yaml_string)
-            if pretty:
-                json_string = json.dumps(data, indent=2, ensure_ascii=False)
-            else:
-                json_string = json.dumps(data, ensure_ascii=False)
+            json_string = None
+            if len(yaml_string) >= STREAM_THRESHOLD:
+                try:
+                    json_string = _yaml_to_json_stream(yaml_string, pretty)
+                except _StreamFallback as e:
+                    logger.debug(f"Streaming YAML conversion not possible ({e}), loading full document")
+
+            if json_string is None:
+                data = yaml.safe_load(yaml_string)
+                if pretty:
+                    json_string = json.dumps(data, indent=2, ensure_ascii=False)
+                else:
+                    json_string = json.dumps(data, ensure_ascii=False)
 
             return {
                 "status": "success",
@@ -4,25 +4,56 @@ Manages lifecycle and execution of MCP servers for Parallax Voice Office
 """
 
 import json
+import inspect
 import logging
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _format_timestamp(ns: Optional[int]) -> Optional[str]:
+    """Render a time.time_ns() value as ISO-8601 for API output"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _tools_for(cls: type) -> Tuple[str, ...]:
+    """
+    Public callables defined on a server class (including inherited ones), computed once per class.
+    Coroutine methods are left out since execute_tool calls tools synchronously.
+    """
+    names = set()
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name in vars(klass):
+            attr = getattr(cls, name, None)
+            if not name.startswith('_') and callable(attr) and not inspect.iscoroutinefunction(attr):
+                names.add(name)
+    return tuple(sorted(names))
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MCPServerInfo:
-    """Information about an MCP server"""
+    """Information about an MCP server (slotted: no per-instance __dict__)"""
     name: str
     enabled: bool
     type: str
     description: str
     config: Dict[str, Any]
     status: str = "stopped"  # stopped, running, error
-    last_used: Optional[str] = None
+    last_used: Optional[int] = None  # ns since epoch, see _format_timestamp
     error_message: Optional[str] = None
 
 
@@ -36,6 +67,8 @@ class MCPManager:
         self.config_path = Path(config_path)
         self.servers: Dict[str, MCPServerInfo] = {}
         self.server_instances: Dict[str, Any] = {}
+        # Immutable view of self.servers for readers; replaced wholesale on every change
+        self._snapshot: Tuple[Tuple[str, MCPServerInfo], ...] = ()
 
         # Load configuration
         self.load_config()
@@ -43,11 +76,16 @@ class MCPManager:
         # Initialize enabled servers
         self.initialize_servers()
 
+    def _refresh_snapshot(self):
+        """Publish the current server set to lock-free readers"""
+        self._snapshot = tuple(self.servers.items())
+
     def load_config(self):
         """Load MCP configuration from JSON file"""
         if not self.config_path.exists():
             logger.warning(f"MCP config file not found: {self.config_path}")
             self.config = {"mcpServers": {}, "global_settings": {}}
+            self._refresh_snapshot()
             return
 
         try:
@@ -70,6 +108,8 @@ class MCPManager:
             logger.error(f"Failed to load MCP config: {e}")
             self.config = {"mcpServers": {}, "global_settings": {}}
 
+        self._refresh_snapshot()
+
     def initialize_servers(self):
         """Initialize all enabled MCP servers"""
         for name, server_info in self.servers.items():
@@ -98,7 +138,9 @@ class MCPManager:
                     provider=server_info.config.get('provider', 'auto'),
                     max_results=server_info.config.get('max_results', 10),
                     cache_enabled=server_info.config.get('cache_enabled', True),
-                    cache_ttl=server_info.config.get('cache_ttl_seconds', 3600)
+                    cache_ttl=server_info.config.get('cache_ttl_seconds', 3600),
+                    disk_cache_path=server_info.config.get('disk_cache_path'),
+                    disk_cache_ttl=server_info.config.get('disk_cache_ttl_seconds', 86400)
                 )
                 server_info.status = "running"
                 logger.info(f"✅ Initialized web-search MCP server")
@@ -113,7 +155,10 @@ class MCPManager:
                 from mcp_http_client import MCPHTTPClient
                 self.server_instances[name] = MCPHTTPClient(
                     timeout=server_info.config.get('timeout_seconds', 30),
-                    max_retries=server_info.config.get('max_retries', 3)
+                    max_retries=server_info.config.get('max_retries', 3),
+                    warmup_hosts=server_info.config.get('warmup_hosts'),
+                    include_timestamps=server_info.config.get('include_timestamps', False),
+                    http2=server_info.config.get('http2', False)
                 )
                 server_info.status = "running"
                 logger.info(f"✅ Initialized http-client MCP server")
@@ -169,7 +214,7 @@ class MCPManager:
             server_instance = self.server_instances[server_name]
 
             # Update last used timestamp
-            server_info.last_used = datetime.now().isoformat()
+            server_info.last_used = time.time_ns()
 
             # Call the tool method
             if hasattr(server_instance, tool_name):
@@ -200,19 +245,16 @@ class MCPManager:
             Dictionary mapping server names to list of available tools
         """
         available_tools = {}
+        snapshot = self._snapshot
 
-        servers_to_check = [server_name] if server_name else self.server_instances.keys()
-
-        for name in servers_to_check:
-            if name in self.server_instances and self.servers[name].status == "running":
-                server_instance = self.server_instances[name]
+        if server_name:
+            snapshot = tuple(item for item in snapshot if item[0] == server_name)
 
-                # Get available methods (tools) from the server instance
-                tools = [
-                    method for method in dir(server_instance)
-                    if not method.startswith('_') and callable(getattr(server_instance, method))
-                ]
-                available_tools[name] = tools
+        for name, info in snapshot:
+            server_instance = self.server_instances.get(name)
+            if server_instance is not None and info.status == "running":
+                # Get available methods (tools) from the server class
+                available_tools[name] = list(_tools_for(type(server_instance)))
 
         return available_tools
 
@@ -226,7 +268,7 @@ class MCPManager:
                     "enabled": info.enabled,
                     "status": info.status,
                     "description": info.description,
-                    "last_used": info.last_used,
+                    "last_used": _format_timestamp(info.last_used),
                     "error": info.error_message
                 }
             return {"error": f"Server '{server_name}' not found"}
@@ -237,9 +279,9 @@ class MCPManager:
                 "enabled": info.enabled,
                 "status": info.status,
                 "description": info.description,
-                "last_used": info.last_used
+                "last_used": _format_timestamp(info.last_used)
             }
-            for name, info in self.servers.items()
+            for name, info in self._snapshot
         }
 
     def shutdown(self):
@@ -259,5 +301,6 @@ class MCPManager:
         logger.info("Reloading MCP configuration")
         self.shutdown()
         self.servers.clear()
+        self._refresh_snapshot()
         self.load_config()
         self.initialize_servers()
@@ -5,45 +5,283 @@ Provides web search capabilities using Serper or Tavily APIs
 
 import os
 import json
+import sqlite3
+import asyncio
 import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import Future
 import requests
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Optional: aiohttp for the async search API (asearch / aget_answer)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional: orjson for faster parsing of provider responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Optional: msgpack + zstandard for compact cache entries (JSON + zlib otherwise)
+try:
+    import msgpack
+    import zstandard
+
+    def _pack_entry(obj: Dict[str, Any]) -> bytes:
+        return msgpack.packb(obj)
+
+    def _unpack_entry(blob: bytes) -> Dict[str, Any]:
+        return msgpack.unpackb(zstandard.decompress(blob), raw=False)
+
+    def _compress(data: bytes) -> bytes:
+        return zstandard.compress(data, 3)
+except ImportError:
+    def _pack_entry(obj: Dict[str, Any]) -> bytes:
+        return _json_dumps(obj)
+
+    def _unpack_entry(blob: bytes) -> Dict[str, Any]:
+        return _json_loads(zlib.decompress(blob))
+
+    def _compress(data: bytes) -> bytes:
+        return zlib.compress(data, 6)
+
+# Optional: cachetools for the bounded TTL search cache
+try:
+    from cachetools import TLRUCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+# Optional: psutil to shorten cache TTLs under memory pressure
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# (epoch second, 'YYYY-MM-DDTHH:MM:SS') for the last formatted timestamp
+_second_prefix = (None, '')
+
+
+def _iso_now() -> str:
+    """Local ISO-8601 timestamp with microseconds, reusing the formatted second across calls"""
+    global _second_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        _second_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}"
+
+# Separate connect/read timeouts for provider API calls
+REQUEST_TIMEOUT = (3.05, 27)
+
+# Serper endpoint per search type; anything else uses the general search endpoint
+SERPER_ENDPOINTS = {
+    "general": "https://google.serper.dev/search",
+    "news": "https://google.serper.dev/news",
+    "images": "https://google.serper.dev/images",
+}
+
+# Result fields get_answer actually reads
+ANSWER_FIELDS = frozenset({"answer_box", "knowledge_graph", "answer", "results"})
+
+# Cache lifetimes by search type; 'general' uses the configured cache_ttl
+SEARCH_TYPE_TTL = {
+    "news": 300,       # News goes stale within minutes
+    "images": 86400,   # Image results barely change
+}
+
+
+class DiskSearchCache:
+    """
+    SQLite-backed search cache shared across restarts and worker processes
+    """
+
+    PURGE_EVERY = 100  # Drop expired rows once per this many writes
+
+    def __init__(self, path: str, ttl_seconds: int = 86400):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache "
+            "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, result BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an unexpired result, or None"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Get an unexpired result with its remaining lifetime in seconds, or None"""
+        try:
+            now = time.time()
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT result, expires_at FROM search_cache WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+            return (_json_loads(row[0]), row[1] - now) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Disk search cache read failed: {e}")
+            return None
+
+    def set(self, key: str, result: Dict[str, Any], ttl: Optional[float] = None):
+        """Store a result for ttl seconds (default: ttl_seconds)"""
+        try:
+            with self._lock:
+                now = time.time()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, expires_at, result) VALUES (?, ?, ?)",
+                    (key, now + (ttl if ttl is not None else self.ttl_seconds), _json_dumps(result))
+                )
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    self._conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk search cache write failed: {e}")
+
+    def clear(self):
+        """Remove all stored results"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
 
 class SearchCache:
-    """Simple in-memory cache for search results"""
+    """Bounded in-memory LRU cache for search results with a per-entry TTL"""
+
+    # Results that serialize to at least this many bytes are stored compressed
+    COMPRESS_MIN_BYTES = 2048
+
+    # Process RSS range over which TTLs shrink linearly to zero (needs psutil)
+    MEMORY_LOW_BYTES = 512 * 1024 * 1024
+    MEMORY_HIGH_BYTES = 2048 * 1024 * 1024
 
-    def __init__(self, ttl_seconds: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, ttl_seconds: int = 3600, maxsize: int = 1024,
+                 disk_cache: Optional[DiskSearchCache] = None):
         self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        # Optional second tier consulted on memory misses
+        self.disk_cache = disk_cache
+        self._lock = threading.RLock()
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+        if CACHETOOLS_AVAILABLE:
+            # Values are (ttl, result) so each entry expires on its own schedule
+            self.cache = TLRUCache(maxsize=maxsize, ttu=lambda _key, value, now: now + value[0],
+                                   timer=time.monotonic)
+        else:
+            # query -> (monotonic expiry, result), least recently used first
+            self.cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
     def get(self, query: str) -> Optional[Dict[str, Any]]:
-        """Get cached result for query"""
-        if query in self.cache:
-            entry = self.cache[query]
-            # Check if expired
-            cached_time = datetime.fromisoformat(entry['cached_at'])
-            if datetime.now() - cached_time < timedelta(seconds=self.ttl_seconds):
-                logger.info(f"Cache hit for query: {query}")
-                return entry['result']
+        """Get cached result for query, falling back to the disk tier"""
+        result = self._get_memory(query)
+        if result is None and self.disk_cache is not None:
+            entry = self.disk_cache.get_entry(query)
+            if entry is not None:
+                result, remaining = entry
+                self._set_memory(query, result, min(remaining, self.ttl_seconds))
+        if result is not None:
+            logger.info(f"Cache hit for query: {query}")
+        return result
+
+    def _get_memory(self, query: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if CACHETOOLS_AVAILABLE:
+                entry = self.cache.get(query)
+                result = entry[1] if entry is not None else None
             else:
-                # Expired, remove from cache
-                del self.cache[query]
-        return None
+                result = None
+                entry = self.cache.get(query)
+                if entry is not None:
+                    if time.monotonic() < entry[0]:
+                        self.cache.move_to_end(query)
+                        result = entry[1]
+                    else:
+                        # Expired, remove from cache
+                        del self.cache[query]
+        if isinstance(result, bytes):
+            result = _unpack_entry(result)
+        return result
 
-    def set(self, query: str, result: Dict[str, Any]):
-        """Cache a search result"""
-        self.cache[query] = {
-            'result': result,
-            'cached_at': datetime.now().isoformat()
-        }
+    def set(self, query: str, result: Dict[str, Any], ttl: Optional[float] = None):
+        """
+        Cache a search result in memory and on disk
+
+        Args:
+            query: Cache key
+            result: Search result
+            ttl: Lifetime in seconds for this entry (default: ttl_seconds). Entries
+                 shorter-lived than the default keep that lifetime on disk too.
+        """
+        memory_ttl = (ttl if ttl is not None else self.ttl_seconds) * self._memory_headroom()
+        if memory_ttl > 0:
+            self._set_memory(query, result, memory_ttl)
+        if self.disk_cache is not None:
+            volatile = ttl is not None and ttl < self.ttl_seconds
+            self.disk_cache.set(query, result, ttl if volatile else None)
+
+    def _set_memory(self, query: str, result: Dict[str, Any], ttl: float):
+        packed = _pack_entry(result)
+        if len(packed) >= self.COMPRESS_MIN_BYTES:
+            result = _compress(packed)
+        with self._lock:
+            if CACHETOOLS_AVAILABLE:
+                self.cache[query] = (ttl, result)
+                return
+            self.cache[query] = (time.monotonic() + ttl, result)
+            self.cache.move_to_end(query)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+    def _memory_headroom(self) -> float:
+        """1.0 below MEMORY_LOW_BYTES of RSS, falling linearly to 0.0 at MEMORY_HIGH_BYTES"""
+        if self._process is None:
+            return 1.0
+        rss = self._process.memory_info().rss
+        pressure = (rss - self.MEMORY_LOW_BYTES) / (self.MEMORY_HIGH_BYTES - self.MEMORY_LOW_BYTES)
+        return 1.0 - min(1.0, max(0.0, pressure))
 
     def clear(self):
         """Clear all cached results"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.clear()
 
 
 class MCPWebSearchServer:
@@ -53,7 +291,8 @@ class MCPWebSearchServer:
     """
 
     def __init__(self, provider: str = "auto", max_results: int = 10,
-                 cache_enabled: bool = True, cache_ttl: int = 3600):
+                 cache_enabled: bool = True, cache_ttl: int = 3600,
+                 disk_cache_path: Optional[str] = None, disk_cache_ttl: int = 86400):
         """
         Initialize web search server
 
@@ -62,11 +301,16 @@ class MCPWebSearchServer:
             max_results: Maximum number of results to return
             cache_enabled: Whether to cache search results
             cache_ttl: Cache time-to-live in seconds
+            disk_cache_path: SQLite file for a persistent second cache tier (None disables it)
+            disk_cache_ttl: Disk cache time-to-live in seconds
         """
         self.provider = provider
         self.max_results = max_results
         self.cache_enabled = cache_enabled
-        self.cache = SearchCache(ttl_seconds=cache_ttl) if cache_enabled else None
+        self.cache = None
+        if cache_enabled:
+            disk_cache = DiskSearchCache(disk_cache_path, ttl_seconds=disk_cache_ttl) if disk_cache_path else None
+            self.cache = SearchCache(ttl_seconds=cache_ttl, disk_cache=disk_cache)
 
         # Get API keys from environment
         self.serper_api_key = os.getenv('SERPER_API_KEY')
@@ -74,6 +318,35 @@ class MCPWebSearchServer:
 
         # Determine which provider to use
         self.active_provider = self._determine_provider()
+        # Bind the provider's search function once instead of branching on every call
+        self._do_search = {
+            "serper": self._search_serper,
+            "tavily": self._search_tavily,
+        }.get(self.active_provider)
+
+        # Pooled keep-alive session so repeat searches reuse the provider's TLS connection
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['POST']),  # search calls are safe to repeat
+                raise_on_status=False
+            )
+        ))
+        self._http.headers.update({"Content-Type": "application/json"})
+
+        # Searches currently on the wire, so concurrent identical queries share one API call
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._ainflight: Dict[Tuple[Any, str], asyncio.Future] = {}
+
+        # Shared aiohttp session for the async API, created lazily on the running loop
+        self._session = None
+        self._session_loop = None
 
         if self.active_provider:
             logger.info(f"✅ Initialized web search server (provider: {self.active_provider})")
@@ -95,7 +368,7 @@ class MCPWebSearchServer:
         return None
 
     def search(self, query: str, num_results: Optional[int] = None,
-               search_type: str = "general") -> Dict[str, Any]:
+               search_type: str = "general", fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Perform web search
 
@@ -103,6 +376,8 @@ class MCPWebSearchServer:
             query: Search query string
             num_results: Number of results (default: uses max_results from config)
             search_type: Type of search - 'general', 'news', 'images'
+            fields: Result fields the caller needs (default: all); leaving out
+                    'results' skips building the per-result list
 
         Returns:
             Search results dictionary
@@ -113,140 +388,276 @@ class MCPWebSearchServer:
                 "message": "No web search API key configured. Please set SERPER_API_KEY or TAVILY_API_KEY in .env file"
             }
 
+        num_results = num_results or self.max_results
+        fields = self._normalize_fields(fields)
+        cache_key = self._cache_key(query, num_results, search_type, fields)
+
         # Check cache first
         if self.cache_enabled:
-            cache_key = f"{query}:{num_results or self.max_results}:{search_type}"
             cached_result = self.cache.get(cache_key)
             if cached_result:
-                cached_result['from_cache'] = True
-                return cached_result
+                return {**cached_result, 'from_cache': True}
 
-        # Perform search
-        num_results = num_results or self.max_results
+        # Join an identical search that is already in flight instead of paying for another
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[cache_key] = Future()
+        if not is_owner:
+            return future.result()
 
-        if self.active_provider == "serper":
-            result = self._search_serper(query, num_results, search_type)
-        elif self.active_provider == "tavily":
-            result = self._search_tavily(query, num_results, search_type)
-        else:
-            result = {
+        try:
+            # Perform search
+            result = self._do_search(query, num_results, search_type, fields)
+
+            # Cache successful results
+            if self.cache_enabled and result.get('status') == 'success':
+                self.cache.set(cache_key, result, ttl=self._cache_ttl(search_type))
+
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    async def asearch(self, query: str, num_results: Optional[int] = None,
+                      search_type: str = "general", fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Perform web search without blocking the event loop (requires aiohttp)
+
+        Same arguments and result format as search(); connections are reused
+        across calls through a shared aiohttp.ClientSession.
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.search, query, num_results, search_type, fields
+            )
+
+        if not self.active_provider:
+            return {
                 "status": "error",
-                "message": f"Unknown provider: {self.active_provider}"
+                "message": "No web search API key configured. Please set SERPER_API_KEY or TAVILY_API_KEY in .env file"
             }
 
-        # Cache successful results
+        num_results = num_results or self.max_results
+        fields = self._normalize_fields(fields)
+        cache_key = self._cache_key(query, num_results, search_type, fields)
+
+        if self.cache_enabled:
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return {**cached_result, 'from_cache': True}
+
+        # Join an identical search already running on this event loop
+        key = (asyncio.get_running_loop(), cache_key)
+        future = self._ainflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = self._ainflight[key] = key[0].create_future()
+        try:
+            result = await self._asearch_uncached(query, num_results, search_type, cache_key, fields)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters (if any) re-raise it
+            raise
+        finally:
+            self._ainflight.pop(key, None)
+
+    async def _asearch_uncached(self, query: str, num_results: int, search_type: str,
+                                cache_key: str, fields: Optional[frozenset] = None) -> Dict[str, Any]:
+        """Run one async provider call and cache the result"""
+        result = await self._afetch(self.active_provider, query, num_results, search_type, fields)
+
         if self.cache_enabled and result.get('status') == 'success':
-            cache_key = f"{query}:{num_results}:{search_type}"
-            self.cache.set(cache_key, result)
+            self.cache.set(cache_key, result, ttl=self._cache_ttl(search_type))
 
         return result
 
-    def _search_serper(self, query: str, num_results: int, search_type: str) -> Dict[str, Any]:
-        """Search using Serper API"""
-        try:
-            url = "https://google.serper.dev/search"
+    async def _afetch(self, provider: str, query: str, num_results: int,
+                      search_type: str, fields: Optional[frozenset] = None) -> Dict[str, Any]:
+        """Query one provider over the shared aiohttp session"""
+        if provider == "serper":
+            url, payload, headers = self._serper_request(query, num_results, search_type)
+        else:
+            url, payload, headers = self._tavily_request(query, num_results, search_type)
 
-            payload = {
-                "q": query,
-                "num": num_results
+        try:
+            session = await self._get_session()
+            async with session.post(url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"{provider.capitalize()} API error: {e}")
+            return {
+                "status": "error",
+                "message": f"Search failed: {str(e)}"
             }
 
-            # Add search type specific parameters
-            if search_type == "news":
-                url = "https://google.serper.dev/news"
-            elif search_type == "images":
-                url = "https://google.serper.dev/images"
+        if provider == "serper":
+            return self._format_serper(data, query, num_results, fields)
+        return self._format_tavily(data, query, fields)
+
+    @staticmethod
+    def _normalize_fields(fields: Optional[Iterable[str]]) -> Optional[frozenset]:
+        """None when fields don't restrict anything; only leaving out 'results'
+        changes the output, so e.g. ANSWER_FIELDS shares the unrestricted cache entry"""
+        if not fields:
+            return None
+        fields = frozenset(fields)
+        return None if 'results' in fields else fields
+
+    @staticmethod
+    def _cache_key(query: str, num_results: int, search_type: str,
+                   fields: Optional[frozenset] = None) -> str:
+        """Cache/in-flight key; field-restricted results are kept apart from full ones"""
+        key = f"{query}:{num_results}:{search_type}"
+        return f"{key}:{','.join(sorted(fields))}" if fields else key
+
+    def _cache_ttl(self, search_type: str) -> float:
+        """Cache lifetime for a result of the given search type"""
+        return SEARCH_TYPE_TTL.get(search_type, self.cache.ttl_seconds)
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, recreating it if the event loop changed"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self):
+        """Close the shared aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _serper_request(self, query: str, num_results: int,
+                        search_type: str) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Build the Serper endpoint, payload and headers for a query"""
+        url = SERPER_ENDPOINTS.get(search_type, SERPER_ENDPOINTS["general"])
+        payload = {
+            "q": query,
+            "num": num_results
+        }
+        return url, payload, {"X-API-KEY": self.serper_api_key}
+
+    def _format_serper(self, data: Dict[str, Any], query: str, num_results: int,
+                       fields: Optional[frozenset] = None) -> Dict[str, Any]:
+        """Turn a Serper API response into a search result"""
+        # Parse results (skipped when the caller didn't ask for them)
+        want_results = fields is None or 'results' in fields
+        results = []
+        if want_results and 'organic' in data:
+            for item in islice(data['organic'], num_results):
+                results.append({
+                    "title": item.get('title', ''),
+                    "link": item.get('link', ''),
+                    "snippet": item.get('snippet', ''),
+                    "position": item.get('position', 0)
+                })
+        elif want_results and 'news' in data:
+            for item in islice(data['news'], num_results):
+                results.append({
+                    "title": item.get('title', ''),
+                    "link": item.get('link', ''),
+                    "snippet": item.get('snippet', ''),
+                    "date": item.get('date', '')
+                })
+
+        return {
+            "status": "success",
+            "operation": "search",
+            "provider": "serper",
+            "query": query,
+            "result_count": len(results),
+            "results": results,
+            "answer_box": data.get('answerBox'),
+            "knowledge_graph": data.get('knowledgeGraph'),
+            "searched_at": _iso_now()
+        }
 
-            headers = {
-                "X-API-KEY": self.serper_api_key,
-                "Content-Type": "application/json"
-            }
+    def _search_serper(self, query: str, num_results: int, search_type: str,
+                       fields: Optional[frozenset] = None) -> Dict[str, Any]:
+        """Search using Serper API"""
+        try:
+            url, payload, headers = self._serper_request(query, num_results, search_type)
 
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._http.post(url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
-
-            # Parse results
-            results = []
-            if 'organic' in data:
-                for item in data['organic'][:num_results]:
-                    results.append({
-                        "title": item.get('title', ''),
-                        "link": item.get('link', ''),
-                        "snippet": item.get('snippet', ''),
-                        "position": item.get('position', 0)
-                    })
-            elif 'news' in data:
-                for item in data['news'][:num_results]:
-                    results.append({
-                        "title": item.get('title', ''),
-                        "link": item.get('link', ''),
-                        "snippet": item.get('snippet', ''),
-                        "date": item.get('date', '')
-                    })
+            return self._format_serper(_json_loads(response.content), query, num_results, fields)
 
-            return {
-                "status": "success",
-                "operation": "search",
-                "provider": "serper",
-                "query": query,
-                "result_count": len(results),
-                "results": results,
-                "answer_box": data.get('answerBox'),
-                "knowledge_graph": data.get('knowledgeGraph'),
-                "searched_at": datetime.now().isoformat()
-            }
-
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Serper API error: {e}")
             return {
                 "status": "error",
                 "message": f"Search failed: {str(e)}"
             }
 
-    def _search_tavily(self, query: str, num_results: int, search_type: str) -> Dict[str, Any]:
+    def _tavily_request(self, query: str, num_results: int,
+                        search_type: str) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        """Build the Tavily endpoint, payload and headers for a query"""
+        payload = {
+            "api_key": self.tavily_api_key,
+            "query": query,
+            "max_results": num_results,
+            "search_depth": "advanced" if search_type == "general" else "basic",
+            "include_answer": True,
+            "include_raw_content": False
+        }
+        return "https://api.tavily.com/search", payload, {}
+
+    def _format_tavily(self, data: Dict[str, Any], query: str,
+                       fields: Optional[frozenset] = None) -> Dict[str, Any]:
+        """Turn a Tavily API response into a search result"""
+        # Parse results
+        results = []
+        if 'results' in data and (fields is None or 'results' in fields):
+            for item in data['results']:
+                results.append({
+                    "title": item.get('title', ''),
+                    "link": item.get('url', ''),
+                    "snippet": item.get('content', ''),
+                    "score": item.get('score', 0.0)
+                })
+
+        return {
+            "status": "success",
+            "operation": "search",
+            "provider": "tavily",
+            "query": query,
+            "result_count": len(results),
+            "results": results,
+            "answer": data.get('answer'),
+            "searched_at": _iso_now()
+        }
+
+    def _search_tavily(self, query: str, num_results: int, search_type: str,
+                       fields: Optional[frozenset] = None) -> Dict[str, Any]:
         """Search using Tavily API"""
         try:
-            url = "https://api.tavily.com/search"
-
-            payload = {
-                "api_key": self.tavily_api_key,
-                "query": query,
-                "max_results": num_results,
-                "search_depth": "advanced" if search_type == "general" else "basic",
-                "include_answer": True,
-                "include_raw_content": False
-            }
+            url, payload, headers = self._tavily_request(query, num_results, search_type)
 
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._http.post(url, json=payload, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            data = response.json()
-
-            # Parse results
-            results = []
-            if 'results' in data:
-                for item in data['results']:
-                    results.append({
-                        "title": item.get('title', ''),
-                        "link": item.get('url', ''),
-                        "snippet": item.get('content', ''),
-                        "score": item.get('score', 0.0)
-                    })
+            return self._format_tavily(_json_loads(response.content), query, fields)
 
-            return {
-                "status": "success",
-                "operation": "search",
-                "provider": "tavily",
-                "query": query,
-                "result_count": len(results),
-                "results": results,
-                "answer": data.get('answer'),
-                "searched_at": datetime.now().isoformat()
-            }
-
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Tavily API error: {e}")
             return {
                 "status": "error",
@@ -266,6 +677,10 @@ class MCPWebSearchServer:
         """
         return self.search(query, num_results, search_type="news")
 
+    async def asearch_news(self, query: str, num_results: Optional[int] = None) -> Dict[str, Any]:
+        """Async version of search_news()"""
+        return await self.asearch(query, num_results, search_type="news")
+
     def get_answer(self, question: str) -> Dict[str, Any]:
         """
         Get direct answer to a question using web search
@@ -276,8 +691,60 @@ class MCPWebSearchServer:
         Returns:
             Answer with sources
         """
-        result = self.search(question, num_results=5)
+        return self._build_answer(question, self.search(question, num_results=3, fields=ANSWER_FIELDS))
+
+    async def aget_answer(self, question: str) -> Dict[str, Any]:
+        """
+        Async version of get_answer()
 
+        With provider 'auto' and both API keys set, Serper and Tavily are queried
+        concurrently; the first response carrying a direct answer wins and the
+        slower request is cancelled.
+        """
+        if not (AIOHTTP_AVAILABLE and self.provider == "auto"
+                and self.serper_api_key and self.tavily_api_key):
+            return self._build_answer(question, await self.asearch(question, num_results=3,
+                                                                   fields=ANSWER_FIELDS))
+
+        fields = self._normalize_fields(ANSWER_FIELDS)
+        cache_key = self._cache_key(question, 3, "general", fields)
+        if self.cache_enabled:
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return self._build_answer(question, {**cached_result, 'from_cache': True})
+
+        pending = {
+            asyncio.ensure_future(self._afetch(provider, question, 3, "general", fields))
+            for provider in ("serper", "tavily")
+        }
+        winner = fallback = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if result.get('status') != 'success':
+                        fallback = fallback or result
+                    elif result.get('answer_box') or result.get('knowledge_graph') or result.get('answer'):
+                        winner = result
+                        break
+                    elif not fallback or fallback.get('status') != 'success':
+                        fallback = result
+        finally:
+            # Stop the slower provider to save quota
+            for task in pending:
+                task.cancel()
+
+        result = winner or fallback or {"status": "error", "message": "Search failed"}
+        if self.cache_enabled and result.get('status') == 'success':
+            self.cache.set(cache_key, result)
+
+        return self._build_answer(question, result)
+
+    def _build_answer(self, question: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract a direct answer and its sources from a search result"""
         if result.get('status') != 'success':
             return result
 
@@ -330,3 +797,9 @@ class MCPWebSearchServer:
             "cache_enabled": self.cache_enabled,
             "max_results": self.max_results
         }
+
+    def shutdown(self):
+        """Close the pooled HTTP session and the disk cache"""
+        self._http.close()
+        if self.cache and self.cache.disk_cache is not None:
+            self.cache.disk_cache.close()
@@ -4,11 +4,38 @@ Network Connectivity Test for OSS Batch Processor
 Run this script to diagnose network access issues
 """
 
+import asyncio
+import re
 import socket
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+# Optional: psutil lists interfaces natively instead of parsing ifconfig/ip output
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Interface headers: "en0: flags=..." (ifconfig) and "2: eth0: <...>" (ip addr show)
+IFCONFIG_IFACE_RE = re.compile(r'^(\S+?):\s', re.M)
+IP_ADDR_IFACE_RE = re.compile(r'^\d+:\s+(\S+?):\s', re.M)
+INET_RE = re.compile(r'\binet (\d{1,3}(?:\.\d{1,3}){3})')
+SKIPPED_IP_PREFIXES = ('127.', '169.254.')  # loopback and link-local
+
+def _parse_interfaces(output, iface_re):
+    """Split command output into per-interface blocks and collect their IPv4 addresses"""
+    parts = iface_re.split(output)
+    return [(name, ip)
+            for name, block in zip(parts[1::2], parts[2::2])
+            for ip in INET_RE.findall(block)
+            if not ip.startswith(SKIPPED_IP_PREFIXES)]
+
+# Interfaces rarely change during a run; call .cache_clear() on either probe to re-detect
+@lru_cache(maxsize=1)
 def get_local_ip():
     """Get the primary local IP address"""
     try:
@@ -20,31 +47,28 @@ def get_local_ip():
     except:
         return "localhost"
 
+@lru_cache(maxsize=1)
 def get_all_network_interfaces():
-    """Get all available network interfaces and their IPs"""
+    """Get all available network interfaces and their IPs as an immutable tuple of (name, ip)"""
     interfaces = []
     try:
-        if sys.platform == "darwin":  # macOS
+        if PSUTIL_AVAILABLE:
+            interfaces = [(name, addr.address)
+                          for name, addrs in psutil.net_if_addrs().items()
+                          for addr in addrs
+                          if addr.family == socket.AF_INET
+                          and not addr.address.startswith(SKIPPED_IP_PREFIXES)]
+        elif sys.platform == "darwin":  # macOS
             result = subprocess.run(['ifconfig'], capture_output=True, text=True)
+            interfaces = _parse_interfaces(result.stdout, IFCONFIG_IFACE_RE)
         elif sys.platform == "linux":  # Linux
             result = subprocess.run(['ip', 'addr', 'show'], capture_output=True, text=True)
+            interfaces = _parse_interfaces(result.stdout, IP_ADDR_IFACE_RE)
         else:  # Windows
             result = subprocess.run(['ipconfig'], capture_output=True, text=True, shell=True)
-            
-        lines = result.stdout.split('\n')
-        current_interface = None
-        
-        for line in lines:
-            if sys.platform == "darwin":
-                if line and not line.startswith('\t') and not line.startswith(' '):
-                    current_interface = line.split(':')[0]
-                elif 'inet ' in line and '127.0.0.1' not in line and 'inet 169.254' not in line:
-                    ip = line.split('inet ')[1].split(' ')[0]
-                    if current_interface:
-                        interfaces.append((current_interface, ip))
     except Exception as e:
         print(f"⚠️  Could not get network interfaces: {e}")
-    return interfaces
+    return tuple(interfaces)
 
 def test_port_availability(port=5001):
     """Test if a port is available"""
@@ -60,7 +84,7 @@ def test_server_connectivity(ip, port=5001):
     """Test if we can connect to the server"""
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(3)
+        sock.settimeout(1)  # Probes run in parallel, so a short timeout is enough
         result = sock.connect_ex((ip, port))
         sock.close()
         return result == 0
@@ -81,6 +105,31 @@ def check_firewall_status():
     except:
         return "unknown"
 
+def find_port_process(port=5001):
+    """Return lsof output for whatever is listening on the port (empty if unknown)"""
+    try:
+        result = subprocess.run(['lsof', '-i', f':{port}'], capture_output=True, text=True)
+        return result.stdout
+    except:
+        return ""
+
+async def run_diagnostics(hosts, port=5001):
+    """
+    Run the blocking port, connectivity, firewall and lsof checks concurrently
+
+    Returns:
+        (port_available, {host: reachable}, firewall_status, lsof_output)
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(8, len(hosts) + 3)) as executor:
+        port_available, firewall_status, lsof_output, *reachable = await asyncio.gather(
+            loop.run_in_executor(executor, test_port_availability, port),
+            loop.run_in_executor(executor, check_firewall_status),
+            loop.run_in_executor(executor, find_port_process, port),
+            *(loop.run_in_executor(executor, test_server_connectivity, host, port) for host in hosts)
+        )
+    return port_available, dict(zip(hosts, reachable)), firewall_status, lsof_output
+
 def main():
     print("🔍 OSS BATCH PROCESSOR - NETWORK CONNECTIVITY TEST")
     print("=" * 60)
@@ -96,36 +145,31 @@ def main():
         for interface, ip in interfaces:
             print(f"   {interface}: {ip}")
     
+    # Run every probe at once; total time is the slowest probe, not the sum
+    hosts = ['localhost', local_ip] + [ip for _, ip in interfaces]
+    hosts = list(dict.fromkeys(hosts))  # Drop duplicates, keep order
+    port_available, reachable, firewall_status, lsof_output = asyncio.run(run_diagnostics(hosts))
+    
     # Test port availability
     print(f"\n🔌 Port 5001 Status:")
-    if test_port_availability():
+    if port_available:
         print("   ✅ Port 5001 is available")
     else:
         print("   ❌ Port 5001 is in use")
-        try:
-            result = subprocess.run(['lsof', '-i', ':5001'], capture_output=True, text=True)
-            if result.stdout:
-                print("   🔍 Process using port 5001:")
-                print(f"   {result.stdout.strip()}")
-        except:
-            pass
+        if lsof_output:
+            print("   🔍 Process using port 5001:")
+            print(f"   {lsof_output.strip()}")
     
     # Test server connectivity (if running)
     print(f"\n🌍 Server Connectivity Test:")
-    if test_server_connectivity('localhost'):
-        print("   ✅ Server accessible on localhost:5001")
-    else:
-        print("   ❌ Server not accessible on localhost:5001")
-    
-    if local_ip != "localhost":
-        if test_server_connectivity(local_ip):
-            print(f"   ✅ Server accessible on {local_ip}:5001")
+    for host in hosts:
+        if reachable[host]:
+            print(f"   ✅ Server accessible on {host}:5001")
         else:
-            print(f"   ❌ Server not accessible on {local_ip}:5001")
+            print(f"   ❌ Server not accessible on {host}:5001")
     
     # Check firewall
     print(f"\n🛡️  Firewall Status:")
-    firewall_status = check_firewall_status()
     if firewall_status == "enabled":
         print("   ⚠️  macOS Firewall is ENABLED")
         print("   💡 Solution: System Preferences → Security & Privacy → Firewall")
@@ -4,24 +4,55 @@ Universal Task Processor - Handles ANY task type with plugins
 Supports web search, file operations, code execution, and more
 """
 
+import asyncio
+import atexit
 import json
 import yaml
 import time
+import hashlib
+import itertools
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import mmap
 import os
 import re
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
 import threading
 import subprocess
+import queue
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
 import traceback
 
+# Optional: orjson for faster JSON encode/decode (stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+    
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -29,17 +60,49 @@ try:
 except ImportError:
     logger.warning("python-dotenv not installed, environment variables from .env file won't be loaded")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('universal_processor.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging: callers only enqueue records (with the message already
+# merged), and a listener thread adds timestamp/level and does the console/file writes
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('universal_processor.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(_log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Task file entries: {type} content, up to the next marker or end of file
+TASK_RE = re.compile(r'\{(\w+)\}(.*?)(?=\{|\Z)', re.DOTALL)
+TASK_RE_BYTES = re.compile(rb'\{(\w+)\}(.*?)(?=\{|\Z)', re.DOTALL)
+
+# Task files at least this large are scanned through mmap instead of read into a str
+MMAP_MIN_BYTES = 64 * 1024
+
+# Any {placeholder} in a step prompt; unknown ones are replaced with ''
+PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+
+# Queue snapshot, its change journal, and a counts sidecar written with each snapshot
+QUEUE_FILE = Path("task_queue.json")
+QUEUE_JOURNAL_FILE = Path("task_queue.jsonl")
+QUEUE_STATS_FILE = Path("task_queue.stats.json")
+
+# API submissions are journaled unflushed; flush after this many lines or this many seconds
+JOURNAL_FLUSH_EVERY = 100
+JOURNAL_FLUSH_DELAY = 0.5
+
+# Prompt cache (off unless enable_prompt_cache is set): entries older than
+# PROMPT_CACHE_TTL seconds are ignored and purged, the table keeps at most
+# PROMPT_CACHE_MAX_ROWS rows, and PROMPT_CACHE_SIZE of them stay in memory
+PROMPT_CACHE_SIZE = 256
+PROMPT_CACHE_TTL = 24 * 3600
+PROMPT_CACHE_MAX_ROWS = 5000
+PROMPT_CACHE_PURGE_EVERY = 100
+
+# Streamed Ollama output: report partial text to the progress callback every N new chars
+STREAM_PROGRESS_CHARS = 2000
+
 class TaskType(Enum):
     SEARCH = "search"
     PROCESS = "process"
@@ -48,6 +111,9 @@ class TaskType(Enum):
     CODE = "code"
     CUSTOM = "custom"
 
+# Task file marker -> TaskType; unknown markers map to CUSTOM
+TASK_TYPE_MAP = {t.value: t for t in TaskType}
+
 class TaskStatus(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -55,7 +121,12 @@ class TaskStatus(Enum):
     FAILED = "failed"
     RETRYING = "retrying"
 
-@dataclass
+TASK_STATUS_MAP = {s.value: s for s in TaskStatus}
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     id: str
     type: TaskType
@@ -69,11 +140,59 @@ class Task:
     created_at: str = ""
     updated_at: str = ""
     processing_time: float = 0
+    # Serialized results/metadata for the DB; results are re-encoded only after set_result()
+    _results_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _metadata_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        now = datetime.now().isoformat()
         if not self.created_at:
-            self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+            self.created_at = now
+        self.updated_at = now
+    
+    def set_result(self, key: str, value: Any):
+        """Store a step result and invalidate the cached results JSON"""
+        self.results[key] = value
+        self._results_json = None
+    
+    def results_json(self) -> str:
+        if self._results_json is None:
+            self._results_json = _json_dumps(self.results)
+        return self._results_json
+    
+    def metadata_json(self) -> str:
+        # Metadata is fixed once the task is created, so it is encoded once
+        if self._metadata_json is None:
+            self._metadata_json = _json_dumps(self.metadata)
+        return self._metadata_json
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Task':
+        """Rebuild a task saved with to_dict()"""
+        data = dict(data)
+        # Convert strings back to enums
+        if 'type' in data:
+            data['type'] = TASK_TYPE_MAP[data['type']]
+        if 'status' in data:
+            data['status'] = TASK_STATUS_MAP[data['status']]
+        return cls(**data)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict; shares results/metadata rather than deep-copying like asdict()"""
+        return {
+            'id': self.id,
+            'type': self.type.value,
+            'content': self.content,
+            'config_name': self.config_name,
+            'status': self.status.value,
+            'results': self.results,
+            'metadata': self.metadata,
+            'error': self.error,
+            'retry_count': self.retry_count,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'processing_time': self.processing_time,
+        }
 
 # Plugin base class
 class TaskPlugin(ABC):
@@ -89,10 +208,21 @@ class TaskPlugin(ABC):
 
 # Web Search Plugin
 class WebSearchPlugin(TaskPlugin):
-    def __init__(self, api_key: str = None, provider: str = "serper"):
+    def __init__(self, api_key: str = None, provider: str = "serper",
+                 session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv('SERPER_API_KEY') or os.getenv('TAVILY_API_KEY')
         self.provider = provider
         
+        # Keep-alive session so repeat searches skip the TCP+TLS handshake
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            ))
+        self.session = session
+        
     def execute(self, task: Task, context: Dict[str, Any]) -> Any:
         """Execute web search"""
         query = task.metadata.get('search_query', task.content)
@@ -115,9 +245,9 @@ class WebSearchPlugin(TaskPlugin):
         payload = {'q': query}
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, headers=headers, json=payload, timeout=30)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Serper search error: {e}")
         return {}
@@ -132,9 +262,9 @@ class WebSearchPlugin(TaskPlugin):
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.session.post(url, json=payload, timeout=30)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Tavily search error: {e}")
         return {}
@@ -142,6 +272,10 @@ class WebSearchPlugin(TaskPlugin):
     def get_name(self) -> str:
         return "web_search"
 
+# Plugin status messages that must not be mistaken for generated file content
+FILE_STATUS_PREFIXES = ('Created file:', 'Edited file:', 'Deleted file:',
+                        'File not found for editing:', 'Error:')
+
 # File Operations Plugin
 class FileOperationsPlugin(TaskPlugin):
     def __init__(self, workspace_dir: str = "workspace"):
@@ -170,13 +304,9 @@ class FileOperationsPlugin(TaskPlugin):
             # If no explicit content, look for the last text result
             if not content and task.results:
                 # Get the last non-plugin result (which would be LLM output)
-                for key in reversed(list(task.results.keys())):
-                    value = task.results[key]
-                    if isinstance(value, str) and value.strip():
-                        # Skip plugin results that look like status messages
-                        if not value.startswith('Created file:') and not value.startswith('Error:'):
-                            content = value
-                            break
+                content = next((value for value in reversed(task.results.values())
+                                if isinstance(value, str) and value.strip()
+                                and not value.startswith(FILE_STATUS_PREFIXES)), '')
             
             if not content:
                 content = task.results.get('final_output', '')
@@ -203,7 +333,12 @@ class FileOperationsPlugin(TaskPlugin):
     def get_name(self) -> str:
         return "file_operations"
 
-# Code Execution Plugin
+# Seconds a code snippet may run before its interpreter is killed
+CODE_TIMEOUT = 30
+
+# Code Execution Plugin. Each snippet gets a fresh interpreter, so tasks can't
+# leak cwd, modules or monkeypatches into each other, and node drains pending
+# timers and promises before exiting, so their output is captured too
 class CodeExecutionPlugin(TaskPlugin):
     def __init__(self, allowed_languages: List[str] = None):
         self.allowed_languages = allowed_languages or ['python', 'javascript']
@@ -224,13 +359,13 @@ class CodeExecutionPlugin(TaskPlugin):
         return "Code execution completed"
     
     def execute_python(self, code: str) -> str:
-        """Execute Python code in subprocess"""
+        """Execute Python code in a subprocess running this interpreter"""
         try:
             result = subprocess.run(
-                ['python', '-c', code],
+                [sys.executable, '-c', code],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=CODE_TIMEOUT
             )
             return result.stdout or result.stderr
         except Exception as e:
@@ -243,7 +378,7 @@ class CodeExecutionPlugin(TaskPlugin):
                 ['node', '-e', code],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=CODE_TIMEOUT
             )
             return result.stdout or result.stderr
         except Exception as e:
@@ -255,7 +390,16 @@ class CodeExecutionPlugin(TaskPlugin):
 class UniversalTaskProcessor:
     def __init__(self, base_config: str = "processor_config.yaml"):
         self.base_config_file = Path(base_config)
-        self.queue_file = Path("task_queue.json")
+        self.queue_file = QUEUE_FILE
+        self.stats_file = QUEUE_STATS_FILE
+        self._queue_snapshot: Optional[bytes] = None  # last bytes written to queue_file
+        # Append-only log of queue changes since the last full save_queue()
+        self.journal_file = QUEUE_JOURNAL_FILE
+        self._journal = None
+        self._journal_unflushed = 0
+        self._journal_timer: Optional[threading.Timer] = None
+        self._api_task_seq = itertools.count()
+        self._tasks_since_checkpoint = 0
         self.results_dir = Path("results")
         self.results_dir.mkdir(exist_ok=True)
         # Use data directory for database in Docker, current dir otherwise
@@ -278,19 +422,69 @@ class UniversalTaskProcessor:
         
         # Ollama settings - check environment variable first
         self.api_base = os.getenv('OLLAMA_HOST') or self.config.get('ollama_host', 'http://localhost:11434')
+        # Generation settings are fixed per run; build them (and their cache-key form) once
+        self.ollama_model = self.config['model']
+        self.ollama_options = {
+            'temperature': self.config.get('temperature', 0.7),
+            'top_p': self.config.get('top_p', 0.9),
+            'num_predict': self.config.get('max_tokens', -1),
+        }
+        self._ollama_options_key = json.dumps(self.ollama_options, sort_keys=True)
         self.session = requests.Session()
         self.session.timeout = None  # No timeout
+        # Keep-alive pool so each LLM step reuses the connection to Ollama
+        ollama_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount('http://', ollama_adapter)
+        self.session.mount('https://', ollama_adapter)
+        
+        # Exact-match LLM response cache: blake2b(model+prompt+options) -> (stored_at, response).
+        # Opt-in: with a non-zero temperature it replays one sample for every repeat of a prompt
+        self.prompt_cache_enabled = self.config.get('enable_prompt_cache', False)
+        self.llm_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.llm_cache_lock = threading.Lock()
+        self._cache_writes = 0
+        
+        # Step prompt template -> formatter compiled on first use (templates are static per config)
+        self.compiled_prompts: Dict[str, Callable[[Task], str]] = {}
         
         # Initialize database
         self.init_database()
         
-        # Task queue
+        # Buffered task rows are written in one transaction every save_interval seconds;
+        # with save_interval <= 0 they are only written at the end of each task and at exit
+        self.save_interval = self.config.get('save_interval', 5)
+        if self.save_interval > 0:
+            threading.Thread(target=self._flush_db_loop, name='db-flush', daemon=True).start()
+        
+        # Task queue, plus an id index and per-status counts kept in step with it
         self.queue: List[Task] = []
+        self._by_id: Dict[str, Task] = {}
+        self._status_counts: "Counter[TaskStatus]" = Counter()
         self.load_queue()
         
         # Processing control
         self.stop_processing = threading.Event()
         
+        # Tasks run_batch processes at once (1 = one after another, in queue order)
+        self.parallel_tasks = max(1, int(self.config.get('parallel_tasks', 1)))
+        
+        # Hot config values read once instead of on every task, step or request
+        self.delay_between_items = self.config.get('delay_between_items', 2)
+        self.delay_between_steps = self.config.get('delay_between_steps', 1)
+        self.max_retries = self.config.get('max_retries', 3)
+        self.checkpoint_every = self.config.get('checkpoint_every', 50)
+        self.api_port = self.config.get('api_port', 5001)
+        # Long-lived pool run_batch hands tasks to; they are I/O-bound (Ollama, search APIs)
+        self.executor = ThreadPoolExecutor(max_workers=self.parallel_tasks, thread_name_prefix='task')
+        # Guards task.results / queue changes against concurrent save_queue serialization
+        self.queue_lock = threading.RLock()
+        
+        # Queue snapshots are written by one background thread; a pending request absorbs repeats
+        self._save_requests: "queue.Queue[Optional[bool]]" = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._save_worker, name='queue-writer', daemon=True)
+        self._save_thread.start()
+        atexit.register(self.close_queue_writer)
+        
     def init_plugins(self):
         """Initialize all plugins"""
         self.plugins['web_search'] = WebSearchPlugin()
@@ -317,6 +511,9 @@ class UniversalTaskProcessor:
                 'max_tokens': -1,
                 'task_configs_dir': 'task_configs',
                 'enable_web_api': True,
+                'enable_prompt_cache': False,
+                'parallel_tasks': 1,
+                'checkpoint_every': 50,
                 'api_port': 5001
             }
             with open(self.base_config_file, 'w') as f:
@@ -450,9 +647,19 @@ class UniversalTaskProcessor:
                 yaml.dump(code_config, f, default_flow_style=False)
     
     def init_database(self):
-        """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Initialize SQLite database and open the shared connection"""
+        # One long-lived autocommit connection in WAL mode instead of a connect/commit/close per write
+        self.db_lock = threading.Lock()
+        # Latest unsaved row per task id, written by flush_db()
+        self._pending_saves: Dict[str, tuple] = {}
+        self.db_conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.db_conn.execute('PRAGMA journal_mode=WAL')
+        self.db_conn.execute('PRAGMA synchronous=NORMAL')
+        self.db_conn.execute('PRAGMA temp_store=MEMORY')
+        self.db_conn.execute('PRAGMA cache_size=-64000')
+        atexit.register(self.close_database)
+        
+        cursor = self.db_conn.cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
@@ -482,8 +689,16 @@ class UniversalTaskProcessor:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS prompt_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_prompt_cache_created_at ON prompt_cache(created_at)')
+        self.purge_prompt_cache()
+        
         logger.info(f"Database initialized at {self.db_path}")
     
     def parse_task_file(self, filepath: str):
@@ -493,12 +708,15 @@ class UniversalTaskProcessor:
             logger.error(f"File not found: {filepath}")
             return
         
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
         # Parse tasks with type markers like {search}, {process}, {create}, etc.
-        task_pattern = r'\{(\w+)\}(.*?)(?=\{|\Z)'
-        matches = re.findall(task_pattern, content, re.DOTALL)
+        if file_path.stat().st_size < MMAP_MIN_BYTES:
+            matches = TASK_RE.findall(file_path.read_text())
+        else:
+            # Run the regex over the mapped file and decode only the captured groups
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                matches = [(type_bytes.decode('utf-8'), content_bytes.decode('utf-8'))
+                           for type_bytes, content_bytes in TASK_RE_BYTES.findall(mm)]
         
         tasks_added = 0
         for task_type_str, task_content in matches:
@@ -507,10 +725,7 @@ class UniversalTaskProcessor:
                 continue
                 
             # Map string to TaskType
-            try:
-                task_type = TaskType(task_type_str.lower())
-            except ValueError:
-                task_type = TaskType.CUSTOM
+            task_type = TASK_TYPE_MAP.get(task_type_str.lower(), TaskType.CUSTOM)
             
             # Parse any metadata in the task
             metadata = {}
@@ -535,6 +750,7 @@ class UniversalTaskProcessor:
             )
             
             self.queue.append(task)
+            self._index_task(task)
             tasks_added += 1
         
         self.save_queue()
@@ -550,12 +766,16 @@ class UniversalTaskProcessor:
             logger.error(f"No configuration found for {task.config_name}")
             return False
         
-        task.status = TaskStatus.PROCESSING
+        self._set_status(task, TaskStatus.PROCESSING)
         start_time = time.time()
         
+        steps = config.get('steps', [])
+        last_index = len(steps) - 1
+        step_delay = self.delay_between_steps
+        
         try:
             # Process each step in the configuration
-            for step in config.get('steps', []):
+            for index, step in enumerate(steps):
                 if self.stop_processing.is_set():
                     logger.info("Processing stop requested")
                     return False
@@ -578,7 +798,8 @@ class UniversalTaskProcessor:
                         
                         # Execute plugin
                         result = plugin.execute(task, context)
-                        task.results[step_name] = result
+                        with self.queue_lock:
+                            task.set_result(step_name, result)
                         logger.info(f"    Plugin {plugin_name} completed")
                     else:
                         logger.warning(f"    Plugin {plugin_name} not found")
@@ -590,26 +811,30 @@ class UniversalTaskProcessor:
                     # Replace variables in prompt
                     prompt = self.format_prompt(prompt_template, task)
                     
-                    # Call Ollama
-                    result = self.process_with_ollama(prompt)
-                    task.results[step_name] = result
+                    # Call Ollama, exposing partial output while it streams
+                    def on_progress(partial: str, step_name=step_name):
+                        with self.queue_lock:
+                            task.set_result(step_name, partial)
+                    
+                    result = self.process_with_ollama(prompt, on_progress=on_progress)
+                    with self.queue_lock:
+                        task.set_result(step_name, result)
                     
                     # Save intermediate results
                     self.save_task_to_db(task)
                 
                 # Delay between steps
-                if step != config['steps'][-1]:  # Not last step
-                    delay = self.config.get('delay_between_steps', 1)
-                    if delay > 0:
-                        time.sleep(delay)
+                if index < last_index and step_delay > 0:
+                    time.sleep(step_delay)
             
-            task.status = TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.COMPLETED)
             task.processing_time = time.time() - start_time
             task.updated_at = datetime.now().isoformat()
             
             # Save final results
             self.save_task_results(task)
             self.save_task_to_db(task)
+            self.flush_db()
             
             logger.info(f"✓ Completed task: {task.id} in {task.processing_time:.1f}s")
             return True
@@ -619,258 +844,732 @@ class UniversalTaskProcessor:
             task.error = str(e)
             task.retry_count += 1
             
-            if task.retry_count < self.config.get('max_retries', 3):
-                task.status = TaskStatus.RETRYING
+            if task.retry_count < self.max_retries:
+                self._set_status(task, TaskStatus.RETRYING)
             else:
-                task.status = TaskStatus.FAILED
+                self._set_status(task, TaskStatus.FAILED)
             
             task.updated_at = datetime.now().isoformat()
             self.save_task_to_db(task)
+            self.flush_db()
             return False
     
     def format_prompt(self, template: str, task: Task) -> str:
         """Format prompt template with task data"""
         if not template:
             return ""
-            
-        prompt = template
         
-        # Replace {content} with task content
-        prompt = prompt.replace('{content}', task.content)
+        formatter = self.compiled_prompts.get(template)
+        if formatter is None:
+            formatter = self.compiled_prompts[template] = self._compile_prompt(template)
+        return formatter(task)
+    
+    @classmethod
+    def _compile_prompt(cls, template: str) -> Callable[[Task], str]:
+        """Split a template once into literal chunks and per-placeholder resolvers"""
+        parts = PLACEHOLDER_RE.split(template)
+        if len(parts) == 1:
+            return lambda task: template
         
-        # Replace {task_id} with task ID
-        prompt = prompt.replace('{task_id}', task.id)
+        head = parts[0]
+        # (resolver, literal following the placeholder) pairs
+        pieces = [(cls._placeholder_resolver(name), literal)
+                  for name, literal in zip(parts[1::2], parts[2::2])]
         
-        # Replace results from previous steps - both with and without _result suffix
-        for result_key, result_value in task.results.items():
-            # Try with _result suffix for backward compatibility
-            placeholder_result = f'{{{result_key}_result}}'
-            if placeholder_result in prompt:
-                prompt = prompt.replace(placeholder_result, str(result_value))
-            
-            # Try without suffix (new format)
-            placeholder = f'{{{result_key}}}'
-            if placeholder in prompt:
-                # Format the result value appropriately
-                if isinstance(result_value, dict):
-                    formatted_value = json.dumps(result_value, indent=2)
-                elif isinstance(result_value, list):
-                    formatted_value = '\n'.join(str(item) for item in result_value)
-                else:
-                    formatted_value = str(result_value)
-                prompt = prompt.replace(placeholder, formatted_value)
-        
-        # Replace metadata values
-        for meta_key, meta_value in task.metadata.items():
-            placeholder = f'{{{meta_key}}}'
-            if placeholder in prompt:
-                prompt = prompt.replace(placeholder, str(meta_value))
-        
-        # Handle any remaining placeholders with empty string to avoid errors
-        import re
-        remaining_placeholders = re.findall(r'\{[^}]+\}', prompt)
-        for placeholder in remaining_placeholders:
-            if placeholder not in ['{', '}']:  # Skip literal braces
-                prompt = prompt.replace(placeholder, '')
-        
-        return prompt
-    
-    def process_with_ollama(self, prompt: str) -> str:
-        """Process prompt with Ollama (no timeout)"""
+        def render(task: Task) -> str:
+            out = [head]
+            for resolve, literal in pieces:
+                out.append(resolve(task))
+                out.append(literal)
+            return ''.join(out)
+        
+        return render
+    
+    @staticmethod
+    def _placeholder_resolver(name: str) -> Callable[[Task], str]:
+        """Build the lookup for one {placeholder}"""
+        if name == 'content':
+            return lambda task: task.content
+        if name == 'task_id':
+            return lambda task: task.id
+        
+        # {step}_result names the raw string of an earlier step
+        raw_name = name[:-7] if name.endswith('_result') else None
+        
+        def resolve(task: Task) -> str:
+            results = task.results
+            # Results from previous steps: {step} is formatted, {step_result} is the raw string
+            if name in results:
+                value = results[name]
+                if isinstance(value, dict):
+                    return _json_dumps_pretty(value).decode('utf-8')
+                if isinstance(value, list):
+                    return '\n'.join(str(item) for item in value)
+                return str(value)
+            if raw_name is not None and raw_name in results:
+                return str(results[raw_name])
+            if name in task.metadata:
+                return str(task.metadata[name])
+            # Remaining placeholders become empty strings to avoid errors
+            return ''
+        
+        return resolve
+    
+    def process_with_ollama(self, prompt: str,
+                            on_progress: Optional[Callable[[str], None]] = None) -> str:
+        """Process prompt with Ollama (no timeout), streaming the generation
+        
+        on_progress, if given, receives the text generated so far every
+        STREAM_PROGRESS_CHARS characters.
+        """
         try:
             payload = {
-                'model': self.config['model'],
+                'model': self.ollama_model,
                 'prompt': prompt,
-                'stream': False,
-                'options': {
-                    'temperature': self.config.get('temperature', 0.7),
-                    'top_p': self.config.get('top_p', 0.9),
-                    'num_predict': self.config.get('max_tokens', -1),
-                }
+                'stream': True,
+                'options': self.ollama_options
             }
             
+            cache_key = None
+            if self.prompt_cache_enabled:
+                cache_key = hashlib.blake2b(
+                    (self.ollama_model + prompt + self._ollama_options_key).encode('utf-8'),
+                    digest_size=16
+                ).hexdigest()
+                cached = self.get_cached_response(cache_key)
+                if cached is not None:
+                    logger.debug(f"Prompt cache hit ({len(prompt)} chars)")
+                    return cached
+            
             logger.debug(f"Sending to Ollama: {len(prompt)} chars")
             start_time = time.time()
             
-            response = requests.post(
+            with self.session.post(
                 f"{self.api_base}/api/generate",
                 json=payload,
+                stream=True,
                 timeout=None  # No timeout
-            )
+            ) as response:
+                if response.status_code != 200:
+                    raise Exception(f"API error: {response.status_code}")
+                
+                text_parts = []
+                generated = reported = 0
+                done = False
+                for line in response.iter_lines():
+                    if self.stop_processing.is_set():
+                        # Abandon the generation; leaving the with-block closes the connection
+                        raise Exception("Processing stopped during generation")
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if 'error' in chunk:
+                        raise Exception(f"API error: {chunk['error']}")
+                    token = chunk.get('response', '')
+                    if token:
+                        text_parts.append(token)
+                        generated += len(token)
+                        if on_progress and generated - reported >= STREAM_PROGRESS_CHARS:
+                            reported = generated
+                            on_progress(''.join(text_parts))
+                    if chunk.get('done'):
+                        done = True
+                        break
+                if not done:
+                    # Connection closed mid-generation: fail rather than return (and cache) partial text
+                    raise Exception(f"API error: stream ended before completion ({generated} chars received)")
             
+            response_text = ''.join(text_parts)
             elapsed = time.time() - start_time
-            
-            if response.status_code == 200:
-                result = response.json()
-                response_text = result.get('response', '')
-                logger.debug(f"Ollama responded in {elapsed:.1f}s")
-                return response_text
-            else:
-                raise Exception(f"API error: {response.status_code}")
+            logger.debug(f"Ollama responded in {elapsed:.1f}s ({generated} chars)")
+            if cache_key is not None:
+                self.cache_response(cache_key, response_text)
+            return response_text
                 
         except Exception as e:
             logger.error(f"Ollama error: {e}")
             raise
     
+    def get_cached_response(self, key: str) -> Optional[str]:
+        """Look up an unexpired cached LLM response in memory, then in the database"""
+        with self.llm_cache_lock:
+            entry = self.llm_cache.get(key)
+            if entry is not None:
+                if time.time() - entry[0] < PROMPT_CACHE_TTL:
+                    self.llm_cache.move_to_end(key)
+                    return entry[1]
+                del self.llm_cache[key]
+        
+        with self.db_lock:
+            row = self.db_conn.execute(
+                "SELECT response, CAST(strftime('%s', created_at) AS INTEGER) FROM prompt_cache "
+                "WHERE key = ? AND created_at >= datetime('now', ?)",
+                (key, f'-{PROMPT_CACHE_TTL} seconds')
+            ).fetchone()
+        if row is None:
+            return None
+        self._remember_response(key, row[0], row[1])
+        return row[0]
+    
+    def cache_response(self, key: str, response_text: str):
+        """Store an LLM response in memory and in the database"""
+        self._remember_response(key, response_text, time.time())
+        with self.db_lock:
+            self.db_conn.execute('INSERT OR REPLACE INTO prompt_cache (key, response) VALUES (?, ?)',
+                                 (key, response_text))
+            self._cache_writes += 1
+            purge = self._cache_writes % PROMPT_CACHE_PURGE_EVERY == 0
+        if purge:
+            self.purge_prompt_cache()
+    
+    def _remember_response(self, key: str, response_text: str, stored_at: float):
+        with self.llm_cache_lock:
+            self.llm_cache[key] = (stored_at, response_text)
+            self.llm_cache.move_to_end(key)
+            if len(self.llm_cache) > PROMPT_CACHE_SIZE:
+                self.llm_cache.popitem(last=False)
+    
+    def purge_prompt_cache(self, everything: bool = False):
+        """Delete expired prompt cache rows and trim the table to PROMPT_CACHE_MAX_ROWS"""
+        with self.db_lock:
+            if everything:
+                self.db_conn.execute('DELETE FROM prompt_cache')
+            else:
+                self.db_conn.execute("DELETE FROM prompt_cache WHERE created_at < datetime('now', ?)",
+                                     (f'-{PROMPT_CACHE_TTL} seconds',))
+                # Rows keyed by the old sha256 digest (64 hex chars) can never be hit again
+                self.db_conn.execute('DELETE FROM prompt_cache WHERE length(key) != 32')
+                self.db_conn.execute(
+                    'DELETE FROM prompt_cache WHERE key NOT IN '
+                    '(SELECT key FROM prompt_cache ORDER BY created_at DESC LIMIT ?)',
+                    (PROMPT_CACHE_MAX_ROWS,)
+                )
+        if everything:
+            with self.llm_cache_lock:
+                self.llm_cache.clear()
+    
     def save_task_results(self, task: Task):
         """Save task results to file"""
         result_file = self.results_dir / f"{task.id}.json"
         
-        # Convert task to dict
-        task_dict = asdict(task)
-        task_dict['type'] = task.type.value
-        task_dict['status'] = task.status.value
-        
-        with open(result_file, 'w') as f:
-            json.dump(task_dict, f, indent=2)
+        with open(result_file, 'wb') as f:
+            f.write(_json_dumps_pretty(task.to_dict()))
     
     def save_task_to_db(self, task: Task):
-        """Save task to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO tasks 
-                (id, type, content, config_name, status, results, metadata, 
-                 error, retry_count, updated_at, processing_time)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                task.id,
-                task.type.value,
-                task.content,
-                task.config_name,
-                task.status.value,
-                json.dumps(task.results),
-                json.dumps(task.metadata),
-                task.error,
-                task.retry_count,
-                task.updated_at,
-                task.processing_time
-            ))
+        """Queue the task's current state for the next flush_db()"""
+        row = (
+            task.id,
+            task.type.value,
+            task.content,
+            task.config_name,
+            task.status.value,
+            task.results_json(),
+            task.metadata_json(),
+            task.error,
+            task.retry_count,
+            task.updated_at,
+            task.processing_time
+        )
+        with self.db_lock:
+            self._pending_saves[task.id] = row
+    
+    def flush_db(self):
+        """Write all buffered task rows in a single transaction"""
+        with self.db_lock:
+            if not self._pending_saves or self.db_conn is None:
+                return
+            rows = list(self._pending_saves.values())
+            self._pending_saves.clear()
             
-            conn.commit()
-        finally:
-            conn.close()
+            self.db_conn.execute('BEGIN')
+            try:
+                self.db_conn.executemany('''
+                    INSERT INTO tasks 
+                    (id, type, content, config_name, status, results, metadata, 
+                     error, retry_count, updated_at, processing_time)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        type = excluded.type,
+                        content = excluded.content,
+                        config_name = excluded.config_name,
+                        status = excluded.status,
+                        results = excluded.results,
+                        metadata = excluded.metadata,
+                        error = excluded.error,
+                        retry_count = excluded.retry_count,
+                        updated_at = excluded.updated_at,
+                        processing_time = excluded.processing_time
+                ''', rows)
+                self.db_conn.execute('COMMIT')
+            except Exception:
+                self.db_conn.execute('ROLLBACK')
+                # Keep the rows for the next attempt unless a newer save replaced them
+                for row in rows:
+                    self._pending_saves.setdefault(row[0], row)
+                raise
+    
+    def _flush_db_loop(self):
+        while True:
+            time.sleep(self.save_interval)
+            try:
+                self.flush_db()
+            except Exception as e:
+                logger.error(f"Database flush failed: {e}")
+    
+    def close_database(self):
+        """Flush pending rows and close the shared connection"""
+        self.flush_db()
+        with self.db_lock:
+            if self.db_conn is not None:
+                self.db_conn.close()
+                self.db_conn = None
     
     def load_queue(self):
-        """Load task queue from file"""
+        """Load task queue from file, then replay the journal on top of it"""
         if self.queue_file.exists():
-            with open(self.queue_file, 'r') as f:
-                data = json.load(f)
-                self.queue = []
-                for item_data in data:
-                    # Convert strings back to enums
-                    if 'type' in item_data:
-                        item_data['type'] = TaskType(item_data['type'])
-                    if 'status' in item_data:
-                        item_data['status'] = TaskStatus(item_data['status'])
-                    self.queue.append(Task(**item_data))
+            with open(self.queue_file, 'rb') as f:
+                raw = f.read()
+                data = _json_loads(raw)
+                self._queue_snapshot = raw
+                self.queue = [Task.from_dict(item_data) for item_data in data]
                 logger.info(f"Loaded {len(self.queue)} tasks from queue")
+        self._replay_journal()
+        self._rebuild_index()
     
-    def save_queue(self):
-        """Save queue to file"""
-        queue_data = []
-        for task in self.queue:
-            task_dict = asdict(task)
-            task_dict['type'] = task.type.value
-            task_dict['status'] = task.status.value
-            queue_data.append(task_dict)
+    def _rebuild_index(self):
+        """Recompute the id index and status counts from self.queue"""
+        self._by_id = {task.id: task for task in self.queue}
+        self._status_counts = Counter(task.status for task in self.queue)
+    
+    def _index_task(self, task: Task):
+        """Register a task just appended to self.queue"""
+        self._by_id[task.id] = task
+        self._status_counts[task.status] += 1
+    
+    def _set_status(self, task: Task, status: TaskStatus):
+        """Change a task's status, keeping the status counts current"""
+        with self.queue_lock:
+            if self._by_id.get(task.id) is task:
+                self._status_counts[task.status] -= 1
+                self._status_counts[status] += 1
+            task.status = status
+    
+    def _replay_journal(self):
+        """Apply journal entries written after the last full queue save"""
+        if not self.journal_file.exists():
+            return
+        
+        tasks_by_id = {task.id: task for task in self.queue}
+        replayed = 0
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    # Torn last line from an interrupted write
+                    break
+                
+                if entry['op'] == 'add':
+                    # Skip adds already captured by a snapshot written before the journal was removed
+                    if entry['task']['id'] not in tasks_by_id:
+                        task = Task.from_dict(entry['task'])
+                        self.queue.append(task)
+                        tasks_by_id[task.id] = task
+                else:
+                    task = tasks_by_id.get(entry['id'])
+                    if task is None:
+                        continue
+                    task.status = TASK_STATUS_MAP[entry['status']]
+                    task.results = entry['results']
+                    task._results_json = None
+                    task.error = entry['error']
+                    task.retry_count = entry['retry_count']
+                    task.updated_at = entry['updated_at']
+                    task.processing_time = entry['processing_time']
+                replayed += 1
         
-        with open(self.queue_file, 'w') as f:
-            json.dump(queue_data, f, indent=2)
+        if replayed:
+            logger.info(f"Replayed {replayed} queue journal entries")
+    
+    def _append_journal(self, entry: Dict[str, Any], flush: bool = True):
+        """Append one journal line; with flush=False it is flushed in a later batch"""
+        with self.queue_lock:
+            if self._journal is not None and os.fstat(self._journal.fileno()).st_nlink == 0:
+                # Another CLI process saved a snapshot and removed the journal; start a new one
+                self._journal.close()
+                self._journal = None
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'a', encoding='utf-8')
+            self._journal.write(_json_dumps(entry) + '\n')
+            if flush:
+                self._flush_journal()
+                return
+            
+            self._journal_unflushed += 1
+            if self._journal_unflushed >= JOURNAL_FLUSH_EVERY:
+                self._flush_journal()
+            elif self._journal_timer is None:
+                self._journal_timer = threading.Timer(JOURNAL_FLUSH_DELAY, self._flush_journal)
+                self._journal_timer.daemon = True
+                self._journal_timer.start()
+    
+    def _flush_journal(self):
+        with self.queue_lock:
+            if self._journal_timer is not None:
+                self._journal_timer.cancel()
+                self._journal_timer = None
+            if self._journal is not None:
+                self._journal.flush()
+            self._journal_unflushed = 0
+    
+    def _journal_update(self, task: Task):
+        """Record a task's new state without rewriting the whole queue file"""
+        self._append_journal({
+            'op': 'update',
+            'id': task.id,
+            'status': task.status.value,
+            'results': task.results,
+            'error': task.error,
+            'retry_count': task.retry_count,
+            'updated_at': task.updated_at,
+            'processing_time': task.processing_time,
+        })
+    
+    def save_queue(self, wait: bool = False):
+        """Save queue to file
+        
+        By default this only schedules a write on the queue-writer thread, so
+        callers never block on serialization or disk; calls made while a write
+        is already pending collapse into it. Pass wait=True to write now.
+        """
+        if wait:
+            self._write_queue()
+            return
+        try:
+            self._save_requests.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def _save_worker(self):
+        while True:
+            request = self._save_requests.get()
+            try:
+                self._write_queue()
+            except Exception as e:
+                logger.error(f"Failed to save queue: {e}")
+            if request is None:
+                return
+    
+    def close_queue_writer(self):
+        """Write the final snapshot and stop the queue-writer thread"""
+        if self._save_thread.is_alive():
+            self._save_requests.put(None)
+            self._save_thread.join()
     
-    def clear_queue(self, clear_all=False):
+    def _write_queue(self):
+        with self.queue_lock:
+            queue_data = [task.to_dict() for task in self.queue]
+            
+            payload = _json_dumps_pretty(queue_data)
+            
+            # Skip the rewrite when nothing changed since the last save
+            if payload != self._queue_snapshot:
+                self._replace_file(self.queue_file, payload)
+                self._queue_snapshot = payload
+                self._replace_file(self.stats_file, _json_dumps(self.queue_stats()).encode('utf-8'))
+            elif not self.stats_file.exists():
+                self._replace_file(self.stats_file, _json_dumps(self.queue_stats()).encode('utf-8'))
+            
+            # The snapshot now covers everything journaled so far
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            self.journal_file.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _replace_file(path: Path, data: bytes):
+        """Write a temp file and swap it in so a crash never leaves a truncated file"""
+        tmp_file = path.with_name(path.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    
+    def queue_stats(self) -> Dict[str, Any]:
+        """Task counts by status and by type, as stored in the stats sidecar"""
+        status_counts = Counter(task.status for task in self.queue)
+        type_counts = Counter(task.type for task in self.queue)
+        stats = {'total': len(self.queue)}
+        stats.update((status.value, status_counts[status]) for status in TaskStatus)
+        stats['by_type'] = {task_type.value: count for task_type, count in type_counts.items()}
+        return stats
+    
+    def clear_queue(self, clear_all=False, dry_run=False):
         """Clear tasks from the queue
         
         Args:
             clear_all: If True, clear all tasks. If False, clear only pending tasks.
+            dry_run: If True, only report the counts and leave the queue untouched.
+        
+        Returns:
+            (pending_count, total_count) as they were before clearing
         """
-        # Count tasks before clearing
-        pending_count = sum(1 for task in self.queue if task.status == TaskStatus.PENDING)
         total_count = len(self.queue)
+        if dry_run:
+            return self._status_counts[TaskStatus.PENDING], total_count
         
-        if clear_all:
-            # Clear all tasks
-            cleared_count = len(self.queue)
-            self.queue = []
-            logger.info(f"Cleared ALL {cleared_count} tasks from queue")
-        else:
-            # Clear only pending tasks from queue
-            self.queue = [task for task in self.queue if task.status != TaskStatus.PENDING]
-            logger.info(f"Cleared {pending_count} pending tasks from queue (kept {len(self.queue)} non-pending tasks)")
+        with self.queue_lock:
+            if clear_all:
+                # Clear all tasks
+                pending_count = self._status_counts[TaskStatus.PENDING]
+                self.queue.clear()
+                self._by_id = {}
+                self._status_counts = Counter()
+                logger.info(f"Cleared ALL {total_count} tasks from queue")
+            else:
+                # Clear only pending tasks: count and compact the list in place in one pass
+                queue = self.queue
+                kept = 0
+                pending_count = 0
+                for task in queue:
+                    if task.status == TaskStatus.PENDING:
+                        pending_count += 1
+                        if self._by_id.get(task.id) is task:
+                            del self._by_id[task.id]
+                    else:
+                        queue[kept] = task
+                        kept += 1
+                del queue[kept:]
+                del self._status_counts[TaskStatus.PENDING]
+                logger.info(f"Cleared {pending_count} pending tasks from queue (kept {len(self.queue)} non-pending tasks)")
         
         # Save the updated queue
         self.save_queue()
+        if clear_all:
+            # Cached generations would otherwise outlive the tasks that produced them
+            self.purge_prompt_cache(everything=True)
         
         return pending_count, total_count
     
-    def run_batch(self):
-        """Run all tasks in queue"""
+    async def run_batch(self):
+        """Run all tasks in queue, up to `parallel_tasks` at a time"""
+        todo = self._unfinished_tasks()
         logger.info("=" * 50)
         logger.info("Starting Universal Task Processor")
-        logger.info(f"Tasks in queue: {len(self.queue)}")
+        logger.info(f"Tasks in queue: {len(self.queue)}, to run: {len(todo)} (parallel tasks: {self.parallel_tasks})")
         logger.info("=" * 50)
         
-        for task in self.queue:
-            if task.status == TaskStatus.COMPLETED:
-                continue
+        if not todo:
+            logger.info("Batch processing complete!")
+            return
+        
+        loop = asyncio.get_running_loop()
+        # The semaphore hands out slots in queue order, so with one slot this is the sequential run
+        semaphore = asyncio.Semaphore(self.parallel_tasks)
+        delay = self.delay_between_items
+        process = self.process_task
+        record_progress = self._record_progress
+        
+        async def run_one(task: Task):
+            async with semaphore:
+                # process_task is blocking I/O; run it on the shared pool
+                await loop.run_in_executor(self.executor, process, task)
                 
-            success = self.process_task(task)
-            
-            # Save progress
+                # Save progress
+                record_progress(task)
+                
+                # Delay before this slot takes the next task
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        
+        self._tasks_since_checkpoint = 0
+        try:
+            await asyncio.gather(*(run_one(task) for task in todo))
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # Ctrl-C: the pool threads are not daemons, so make the in-flight
+            # tasks give up instead of letting interpreter exit wait for them
+            logger.info("Batch run interrupted, stopping in-flight tasks")
+            self.stop_processing.set()
+            if sys.version_info >= (3, 9):
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self.executor.shutdown(wait=False)
+            raise
+        finally:
             self.save_queue()
-            
-            # Delay between tasks
-            delay = self.config.get('delay_between_items', 2)
-            if delay > 0:
-                time.sleep(delay)
         
         logger.info("Batch processing complete!")
     
+    def _unfinished_tasks(self) -> List[Task]:
+        """Tasks a batch run still has to process (same Task objects as self.queue)"""
+        return [task for task in self.queue if task.status != TaskStatus.COMPLETED]
+    
+    def _record_progress(self, task: Task):
+        """Journal a finished task; rewrite the full queue every checkpoint_every tasks"""
+        with self.queue_lock:
+            self._journal_update(task)
+            self._tasks_since_checkpoint += 1
+            if self._tasks_since_checkpoint >= self.checkpoint_every:
+                self._tasks_since_checkpoint = 0
+                self.save_queue()
+    
+    def _api_add_tasks(self, items: List[Dict[str, Any]]) -> List[Task]:
+        """Queue tasks submitted through the REST API
+        
+        Each item has 'content' and optional 'type', 'config' and 'metadata'. All
+        items are validated before any is queued. The tasks are visible at once;
+        their journal lines are flushed in batches (JOURNAL_FLUSH_EVERY /
+        JOURNAL_FLUSH_DELAY) rather than per request, and a snapshot is scheduled
+        on the queue-writer thread (repeat requests collapse into one write).
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        tasks = []
+        for item in items:
+            task_type = item.get('type', 'process')
+            # Dict lookup instead of the Enum constructor on every request
+            task_type_enum = TASK_TYPE_MAP.get(task_type)
+            if task_type_enum is None:
+                raise ValueError(f"{task_type!r} is not a valid TaskType")
+            tasks.append(Task(
+                id=f"api_{timestamp}_{next(self._api_task_seq)}",
+                type=task_type_enum,
+                content=item['content'],
+                config_name=item.get('config', 'process_tasks'),
+                metadata=item.get('metadata') or {}
+            ))
+        
+        with self.queue_lock:
+            for task in tasks:
+                self.queue.append(task)
+                self._index_task(task)
+                self._append_journal({'op': 'add', 'task': task.to_dict()}, flush=False)
+        self.save_queue()
+        return tasks
+    
+    def _api_status(self) -> Dict[str, int]:
+        counts = self._status_counts
+        return {
+            'total': len(self.queue),
+            'pending': counts[TaskStatus.PENDING],
+            'completed': counts[TaskStatus.COMPLETED],
+            'failed': counts[TaskStatus.FAILED]
+        }
+    
     def start_web_api(self):
-        """Start REST API for remote task submission"""
+        """Start REST API for remote task submission
+        
+        Served by uvicorn + FastAPI when installed, otherwise by Flask's threaded server.
+        """
+        try:
+            import uvicorn
+            from fastapi import FastAPI, HTTPException, Response
+            from pydantic import BaseModel
+        except ImportError:
+            return self._start_flask_api()
+        
+        class TaskRequest(BaseModel):
+            content: str
+            type: str = 'process'
+            config: str = 'process_tasks'
+            metadata: Dict[str, Any] = {}
+        
+        app = FastAPI(title='Universal Task Processor')
+        app.state.processor = self
+        
+        # Handlers are plain defs: they take queue_lock, which the queue writer holds
+        # while it serializes a snapshot, so Starlette runs them in its threadpool
+        # instead of on the event loop
+        def as_item(payload: TaskRequest) -> Dict[str, Any]:
+            return {'content': payload.content, 'type': payload.type,
+                    'config': payload.config, 'metadata': payload.metadata}
+        
+        @app.post('/add_task')
+        def add_task(payload: TaskRequest):
+            try:
+                task, = self._api_add_tasks([as_item(payload)])
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {'task_id': task.id, 'status': 'queued'}
+        
+        @app.post('/add_tasks')
+        def add_tasks(payload: List[TaskRequest]):
+            try:
+                tasks = self._api_add_tasks([as_item(item) for item in payload])
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return {'task_ids': [task.id for task in tasks], 'status': 'queued'}
+        
+        @app.get('/status')
+        def status():
+            return self._api_status()
+        
+        @app.get('/task/{task_id}')
+        def get_task(task_id: str):
+            task = self._by_id.get(task_id)
+            if task is None:
+                return Response(_json_dumps({'error': 'Task not found'}),
+                                status_code=404, media_type='application/json')
+            # Encode under the lock: the dict shares the task's live results
+            with self.queue_lock:
+                body = _json_dumps(task.to_dict())
+            return Response(body, media_type='application/json')
+        
+        port = self.api_port
+        logger.info(f"Starting web API (uvicorn) on port {port}")
+        server = uvicorn.Server(uvicorn.Config(app, host='0.0.0.0', port=port, loop='asyncio'))
+        asyncio.run(server.serve())
+    
+    def _start_flask_api(self):
+        """Fallback REST API on Flask's development server"""
         from flask import Flask, request, jsonify
         
         app = Flask(__name__)
         
         @app.route('/add_task', methods=['POST'])
         def add_task():
-            data = request.json
-            task = Task(
-                id=f"api_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                type=TaskType(data.get('type', 'process')),
-                content=data['content'],
-                config_name=data.get('config', 'process_tasks'),
-                metadata=data.get('metadata', {})
-            )
-            self.queue.append(task)
-            self.save_queue()
+            task, = self._api_add_tasks([request.json])
             return jsonify({'task_id': task.id, 'status': 'queued'})
         
+        @app.route('/add_tasks', methods=['POST'])
+        def add_tasks():
+            tasks = self._api_add_tasks(request.json)
+            return jsonify({'task_ids': [task.id for task in tasks], 'status': 'queued'})
+        
         @app.route('/status', methods=['GET'])
         def status():
-            return jsonify({
-                'total': len(self.queue),
-                'pending': sum(1 for t in self.queue if t.status == TaskStatus.PENDING),
-                'completed': sum(1 for t in self.queue if t.status == TaskStatus.COMPLETED),
-                'failed': sum(1 for t in self.queue if t.status == TaskStatus.FAILED)
-            })
+            return jsonify(self._api_status())
         
         @app.route('/task/<task_id>', methods=['GET'])
         def get_task(task_id):
-            task = next((t for t in self.queue if t.id == task_id), None)
+            task = self._by_id.get(task_id)
             if task:
-                task_dict = asdict(task)
-                task_dict['type'] = task.type.value
-                task_dict['status'] = task.status.value
-                return jsonify(task_dict)
+                # Encode under the lock: the dict shares the task's live results
+                with self.queue_lock:
+                    body = _json_dumps(task.to_dict())
+                return app.response_class(body, mimetype='application/json')
             return jsonify({'error': 'Task not found'}), 404
         
-        port = self.config.get('api_port', 5001)
+        port = self.api_port
         logger.info(f"Starting web API on port {port}")
         app.run(host='0.0.0.0', port=port, threaded=True)
 
+def read_queue_stats() -> Optional[Dict[str, Any]]:
+    """Counts saved with the last queue snapshot, or None if they may be stale
+    
+    Lets --status and the clear prompts skip loading the whole queue.
+    """
+    try:
+        # Journaled changes are not reflected in the sidecar, and without the
+        # queue file it describes, a leftover sidecar is meaningless
+        if QUEUE_JOURNAL_FILE.exists() or not QUEUE_FILE.exists():
+            return None
+        if QUEUE_STATS_FILE.stat().st_mtime_ns < QUEUE_FILE.stat().st_mtime_ns:
+            return None
+        return _json_loads(QUEUE_STATS_FILE.read_bytes())
+    except (OSError, ValueError):
+        return None
+
 def main():
     import argparse
     
@@ -884,31 +1583,40 @@ def main():
     
     args = parser.parse_args()
     
-    processor = UniversalTaskProcessor()
+    processor = None
+    if args.status or args.clear or args.clear_all:
+        # Answer from the stats sidecar when it is current; load the queue only if needed
+        stats = read_queue_stats()
+        if stats is None:
+            processor = UniversalTaskProcessor()
+            stats = processor.queue_stats()
+    else:
+        processor = UniversalTaskProcessor()
     
     if args.add_file:
         processor.parse_task_file(args.add_file)
     elif args.run:
-        processor.run_batch()
+        asyncio.run(processor.run_batch())
     elif args.api:
         processor.start_web_api()
     elif args.status:
-        print(f"Tasks in queue: {len(processor.queue)}")
+        print(f"Tasks in queue: {stats['total']}")
         for task_type in TaskType:
-            count = sum(1 for t in processor.queue if t.type == task_type)
+            count = stats['by_type'].get(task_type.value, 0)
             if count > 0:
                 print(f"  {task_type.value}: {count}")
     elif args.clear:
         # Show current status before clearing
-        print(f"Current queue status: {len(processor.queue)} tasks")
-        pending_count = sum(1 for t in processor.queue if t.status == TaskStatus.PENDING)
+        pending_count, total_count = stats['pending'], stats['total']
+        print(f"Current queue status: {total_count} tasks")
         print(f"  Pending: {pending_count}")
-        print(f"  Processing/Completed/Failed: {len(processor.queue) - pending_count}")
+        print(f"  Processing/Completed/Failed: {total_count - pending_count}")
         
         # Confirm before clearing
         if pending_count > 0:
             response = input(f"\nAre you sure you want to clear {pending_count} pending tasks? (y/N): ")
             if response.lower() == 'y':
+                processor = processor or UniversalTaskProcessor()
                 cleared, total = processor.clear_queue()
                 print(f"✓ Cleared {cleared} pending tasks from queue")
                 print(f"  Remaining tasks: {len(processor.queue)}")
@@ -918,15 +1626,16 @@ def main():
             print("No pending tasks to clear")
     elif args.clear_all:
         # Show current status before clearing
-        print(f"Current queue status: {len(processor.queue)} tasks")
-        pending_count = sum(1 for t in processor.queue if t.status == TaskStatus.PENDING)
+        pending_count, total_count = stats['pending'], stats['total']
+        print(f"Current queue status: {total_count} tasks")
         print(f"  Pending: {pending_count}")
-        print(f"  Processing/Completed/Failed: {len(processor.queue) - pending_count}")
+        print(f"  Processing/Completed/Failed: {total_count - pending_count}")
         
         # Confirm before clearing ALL tasks
-        if len(processor.queue) > 0:
-            response = input(f"\n⚠️  Are you sure you want to clear ALL {len(processor.queue)} tasks? (y/N): ")
+        if total_count > 0:
+            response = input(f"\n⚠️  Are you sure you want to clear ALL {total_count} tasks? (y/N): ")
             if response.lower() == 'y':
+                processor = processor or UniversalTaskProcessor()
                 processor.clear_queue(clear_all=True)
                 print(f"✓ Cleared ALL tasks from queue")
             else:
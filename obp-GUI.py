@@ -6,25 +6,36 @@ Run: python obp-GUI.py
 Access: http://your-ip:5001
 """
 
+import atexit
 import json
 import yaml
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
+import queue
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
 import threading
 import subprocess
 import socket
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass, field
 from enum import Enum
-from flask import Flask, render_template_string, request, jsonify, send_file
+from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import traceback
+import hashlib
+import secrets
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 # Parallax SDK imports
 try:
@@ -37,6 +48,42 @@ except ImportError as e:
     logger.warning("Falling back to Ollama compatibility mode")
     PARALLAX_AVAILABLE = False
 
+# Optional gzip/brotli compression of responses (static assets, JSON, HTML)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Faster JSON for API responses and Ollama round-trips
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Production WSGI server; Flask's threaded dev server otherwise
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -45,11 +92,17 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("python-dotenv not installed, environment variables from .env file won't be loaded")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Configure logging: callers only enqueue records (with the message already
+# merged), and a listener thread adds timestamp/level and does the console writes
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(_log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Enums
@@ -69,7 +122,9 @@ class TaskStatus(Enum):
     RETRYING = "retrying"
 
 # Data classes
-@dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     id: str
     type: TaskType
@@ -93,9 +148,37 @@ class Task:
     current_step: str = ""  # Current processing step
 
     def __post_init__(self):
+        now = datetime.now().isoformat()
         if not self.created_at:
-            self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+            self.created_at = now
+        self.updated_at = now
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict; shares results/metadata rather than deep-copying like asdict()"""
+        return {
+            'id': self.id,
+            'type': self.type.value,
+            'content': self.content,
+            'config_name': self.config_name,
+            'status': self.status.value,
+            'results': self.results,
+            'metadata': self.metadata,
+            'error': self.error,
+            'retry_count': self.retry_count,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'processing_time': self.processing_time,
+            'priority': self.priority,
+            'tags': self.tags,
+            'scheduled_time': self.scheduled_time,
+            'parent_task_id': self.parent_task_id,
+            'recurring': self.recurring,
+            'progress': self.progress,
+            'current_step': self.current_step,
+        }
+
+# Task.to_dict() keys, in order; /api/tasks?fields= may select any of them
+TASK_FIELDS = tuple(Task.__dataclass_fields__)
 
 # HTML Template
 HTML_TEMPLATE = '''
@@ -105,710 +188,7 @@ HTML_TEMPLATE = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Parallax Voice Office - AI Voice Assistant</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        :root {
-            --background: #0a0a0a;
-            --foreground: #fafafa;
-            --muted: #171717;
-            --muted-foreground: #a3a3a3;
-            --border: #262626;
-            --input: #171717;
-            --primary: #3b82f6;
-            --primary-foreground: #ffffff;
-            --secondary: #1f1f1f;
-            --secondary-foreground: #e5e5e5;
-            --accent: #262626;
-            --accent-foreground: #fafafa;
-            --destructive: #dc2626;
-            --destructive-foreground: #ffffff;
-            --ring: #3b82f6;
-            --radius: 0.75rem;
-            --glow: rgba(59, 130, 246, 0.5);
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            background: var(--background);
-            background-image: 
-                radial-gradient(ellipse at top, rgba(59, 130, 246, 0.1) 0%, transparent 50%),
-                radial-gradient(ellipse at bottom, rgba(139, 92, 246, 0.05) 0%, transparent 50%);
-            color: var(--foreground);
-            line-height: 1.5;
-            min-height: 100vh;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 2rem;
-        }
-        
-        header {
-            border-bottom: 1px solid var(--border);
-            padding-bottom: 2rem;
-            margin-bottom: 2rem;
-        }
-        
-        h1 {
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-            background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .subtitle {
-            color: var(--muted-foreground);
-            font-size: 0.875rem;
-        }
-        
-        .grid {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 2rem;
-            margin-bottom: 2rem;
-        }
-        
-        @media (max-width: 768px) {
-            .grid {
-                grid-template-columns: 1fr;
-            }
-        }
-        
-        @keyframes pulse {
-            0%, 100% {
-                opacity: 1;
-            }
-            50% {
-                opacity: 0.7;
-            }
-        }
-        
-        @keyframes spin {
-            to {
-                transform: rotate(360deg);
-            }
-        }
-        
-        @keyframes fadeIn {
-            from {
-                opacity: 0;
-                transform: translateY(10px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
-        
-        /* Custom Scrollbar Styling */
-        ::-webkit-scrollbar {
-            width: 10px;
-            height: 10px;
-        }
-        
-        ::-webkit-scrollbar-track {
-            background: rgba(23, 23, 23, 0.5);
-            border-radius: 5px;
-        }
-        
-        ::-webkit-scrollbar-thumb {
-            background: linear-gradient(135deg, #3b82f6 0%, #8b5cf6 100%);
-            border-radius: 5px;
-            border: 2px solid rgba(23, 23, 23, 0.5);
-        }
-        
-        ::-webkit-scrollbar-thumb:hover {
-            background: linear-gradient(135deg, #2563eb 0%, #7c3aed 100%);
-        }
-        
-        /* Firefox scrollbar */
-        * {
-            scrollbar-width: thin;
-            scrollbar-color: #3b82f6 rgba(23, 23, 23, 0.5);
-        }
-        
-        .card {
-            background: rgba(23, 23, 23, 0.5);
-            backdrop-filter: blur(10px);
-            border: 1px solid var(--border);
-            border-radius: var(--radius);
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.3);
-            animation: fadeIn 0.3s ease-out;
-        }
-        
-        .card-header {
-            margin-bottom: 1rem;
-        }
-        
-        .card-title {
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin-bottom: 0.25rem;
-        }
-        
-        .card-description {
-            color: var(--muted-foreground);
-            font-size: 0.875rem;
-        }
-        
-        .form-group {
-            margin-bottom: 1rem;
-        }
-        
-        label {
-            display: block;
-            font-size: 0.875rem;
-            font-weight: 500;
-            margin-bottom: 0.5rem;
-        }
-        
-        input, textarea, select {
-            width: 100%;
-            padding: 0.5rem;
-            border: 1px solid var(--border);
-            border-radius: calc(var(--radius) - 2px);
-            font-size: 0.875rem;
-            transition: border-color 0.15s;
-            background: var(--input);
-            color: var(--foreground);
-        }
-        
-        input:focus, textarea:focus, select:focus {
-            outline: none;
-            border-color: var(--ring);
-            box-shadow: 0 0 0 3px var(--glow);
-        }
-        
-        textarea {
-            min-height: 100px;
-            resize: vertical;
-            font-family: inherit;
-        }
-        
-        .button {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            padding: 0.5rem 1rem;
-            font-size: 0.875rem;
-            font-weight: 500;
-            border-radius: calc(var(--radius) - 2px);
-            border: 1px solid transparent;
-            cursor: pointer;
-            transition: all 0.15s;
-            text-decoration: none;
-        }
-        
-        .button-primary {
-            background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-            color: var(--primary-foreground);
-            border: none;
-            box-shadow: 0 0 20px rgba(59, 130, 246, 0.3);
-        }
-        
-        .button-primary:hover {
-            background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 100%);
-            box-shadow: 0 0 25px rgba(59, 130, 246, 0.5);
-            transform: translateY(-1px);
-        }
-        
-        .button-secondary {
-            background: var(--secondary);
-            color: var(--secondary-foreground);
-            border-color: var(--border);
-        }
-        
-        .button-secondary:hover {
-            background: var(--accent);
-        }
-        
-        .button-destructive {
-            background: var(--destructive);
-            color: var(--destructive-foreground);
-        }
-        
-        .button-destructive:hover {
-            opacity: 0.9;
-        }
-        
-        .button-ghost {
-            background: transparent;
-            color: var(--foreground);
-        }
-        
-        .button-ghost:hover {
-            background: var(--accent);
-        }
-        
-        .button-group {
-            display: flex;
-            gap: 0.5rem;
-            flex-wrap: wrap;
-        }
-        
-        .task-type-selector {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(100px, 1fr));
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }
-        
-        .task-type-btn {
-            padding: 0.75rem;
-            text-align: center;
-            border: 2px solid var(--border);
-            background: var(--background);
-            border-radius: calc(var(--radius) - 2px);
-            cursor: pointer;
-            transition: all 0.15s;
-            font-weight: 500;
-        }
-        
-        .task-type-btn:hover {
-            background: var(--secondary);
-        }
-        
-        .task-type-btn.active {
-            background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-            color: white;
-            border-color: #3b82f6;
-            box-shadow: 0 0 15px rgba(59, 130, 246, 0.3);
-        }
-        
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }
-        
-        .stat-card {
-            background: linear-gradient(135deg, rgba(31, 31, 31, 0.8) 0%, rgba(38, 38, 38, 0.6) 100%);
-            backdrop-filter: blur(10px);
-            padding: 1rem;
-            border-radius: calc(var(--radius) - 2px);
-            text-align: center;
-            border: 1px solid var(--border);
-        }
-        
-        .stat-value {
-            font-size: 2rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .stat-label {
-            font-size: 0.75rem;
-            color: var(--muted-foreground);
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-        
-        .task-list {
-            border: 1px solid var(--border);
-            border-radius: var(--radius);
-            overflow: hidden;
-            background: rgba(23, 23, 23, 0.3);
-            backdrop-filter: blur(5px);
-        }
-        
-        .task-item {
-            padding: 1rem;
-            border-bottom: 1px solid var(--border);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background 0.15s;
-        }
-        
-        .task-item:last-child {
-            border-bottom: none;
-        }
-        
-        .task-item:hover {
-            background: var(--secondary);
-        }
-        
-        .task-info {
-            flex: 1;
-        }
-        
-        .task-id {
-            font-size: 0.75rem;
-            color: var(--muted-foreground);
-            font-family: monospace;
-        }
-        
-        .task-content {
-            margin: 0.25rem 0;
-            font-size: 0.875rem;
-        }
-        
-        .task-meta {
-            display: flex;
-            gap: 0.5rem;
-            align-items: center;
-            flex-wrap: wrap;
-        }
-        
-        .badge {
-            display: inline-flex;
-            align-items: center;
-            padding: 0.25rem 0.5rem;
-            font-size: 0.75rem;
-            font-weight: 500;
-            border-radius: 9999px;
-            text-transform: uppercase;
-            letter-spacing: 0.025em;
-        }
-        
-        .badge-default {
-            background: var(--secondary);
-            color: var(--secondary-foreground);
-        }
-        
-        .badge-pending {
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-            border: 1px solid rgba(251, 191, 36, 0.3);
-        }
-        
-        .badge-processing {
-            background: rgba(59, 130, 246, 0.2);
-            color: #60a5fa;
-            border: 1px solid rgba(59, 130, 246, 0.3);
-            animation: pulse 2s infinite;
-        }
-        
-        .badge-completed {
-            background: rgba(34, 197, 94, 0.2);
-            color: #22c55e;
-            border: 1px solid rgba(34, 197, 94, 0.3);
-        }
-        
-        .badge-failed {
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            border: 1px solid rgba(239, 68, 68, 0.3);
-        }
-        
-        .empty-state {
-            text-align: center;
-            padding: 3rem;
-            color: var(--muted-foreground);
-        }
-        
-        .metadata-inputs {
-            display: grid;
-            gap: 0.5rem;
-        }
-        
-        .metadata-row {
-            display: grid;
-            grid-template-columns: 1fr 1fr auto;
-            gap: 0.5rem;
-            align-items: center;
-            margin-bottom: 0.5rem;
-        }
-        
-        .icon-button {
-            width: 2rem;
-            height: 2rem;
-            padding: 0;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: calc(var(--radius) - 2px);
-        }
-        
-        .toast {
-            position: fixed;
-            bottom: 2rem;
-            right: 2rem;
-            background: rgba(31, 31, 31, 0.95);
-            color: var(--foreground);
-            padding: 1rem 1.5rem;
-            border-radius: var(--radius);
-            border: 1px solid var(--border);
-            box-shadow: 0 10px 25px -5px rgba(0, 0, 0, 0.5);
-            transform: translateY(100px);
-            opacity: 0;
-            transition: all 0.3s;
-            z-index: 1000;
-            max-width: 400px;
-            backdrop-filter: blur(10px);
-        }
-        
-        .toast.show {
-            transform: translateY(0);
-            opacity: 1;
-        }
-        
-        .toast.error {
-            background: var(--destructive);
-            color: var(--destructive-foreground);
-        }
-        
-        .tabs {
-            border-bottom: 1px solid var(--border);
-            margin-bottom: 1.5rem;
-        }
-        
-        .tab-list {
-            display: flex;
-            gap: 2rem;
-        }
-        
-        .tab-trigger {
-            padding: 0.5rem 0;
-            border-bottom: 2px solid transparent;
-            background: none;
-            border-top: none;
-            border-left: none;
-            border-right: none;
-            cursor: pointer;
-            font-weight: 500;
-            color: var(--muted-foreground);
-            transition: all 0.15s;
-        }
-        
-        .tab-trigger:hover {
-            color: var(--foreground);
-        }
-        
-        .tab-trigger.active {
-            color: #3b82f6;
-            border-bottom-color: #3b82f6;
-        }
-        
-        .tab-content {
-            display: none;
-        }
-        
-        .tab-content.active {
-            display: block;
-        }
-        
-        .server-info {
-            background: linear-gradient(135deg, rgba(31, 31, 31, 0.8) 0%, rgba(38, 38, 38, 0.6) 100%);
-            padding: 1rem;
-            border-radius: var(--radius);
-            margin-bottom: 2rem;
-            font-family: monospace;
-            font-size: 0.875rem;
-            border: 1px solid var(--border);
-            backdrop-filter: blur(10px);
-        }
-        
-        .loader {
-            width: 1rem;
-            height: 1rem;
-            border: 2px solid rgba(59, 130, 246, 0.2);
-            border-top-color: #3b82f6;
-            border-radius: 50%;
-            animation: spin 0.6s linear infinite;
-            display: inline-block;
-            margin-left: 0.5rem;
-        }
-        
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-        
-        .result-viewer {
-            background: var(--secondary);
-            padding: 1rem;
-            border-radius: calc(var(--radius) - 2px);
-            font-family: monospace;
-            font-size: 0.75rem;
-            white-space: pre-wrap;
-            word-break: break-all;
-            max-height: 300px;
-            overflow-y: auto;
-        }
-
-        /* Voice Interface Styles */
-        .voice-controls {
-            display: flex;
-            gap: 1rem;
-            align-items: center;
-            margin-bottom: 1rem;
-        }
-
-        .mic-button {
-            width: 4rem;
-            height: 4rem;
-            border-radius: 50%;
-            border: 3px solid var(--primary);
-            background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-            color: white;
-            font-size: 1.5rem;
-            cursor: pointer;
-            transition: all 0.3s;
-            position: relative;
-            box-shadow: 0 4px 15px rgba(59, 130, 246, 0.3);
-        }
-
-        .mic-button:hover {
-            transform: scale(1.05);
-            box-shadow: 0 6px 20px rgba(59, 130, 246, 0.5);
-        }
-
-        .mic-button.listening {
-            background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-            border-color: #ef4444;
-            animation: pulse-glow 1.5s infinite;
-        }
-
-        .mic-button.processing {
-            background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
-            border-color: #f59e0b;
-        }
-
-        @keyframes pulse-glow {
-            0%, 100% {
-                box-shadow: 0 0 20px rgba(239, 68, 68, 0.5);
-            }
-            50% {
-                box-shadow: 0 0 40px rgba(239, 68, 68, 0.8);
-            }
-        }
-
-        .voice-status {
-            flex: 1;
-            padding: 1rem;
-            background: rgba(23, 23, 23, 0.5);
-            border-radius: calc(var(--radius) - 2px);
-            border: 1px solid var(--border);
-        }
-
-        .voice-status-text {
-            font-size: 0.875rem;
-            color: var(--muted-foreground);
-            margin-bottom: 0.5rem;
-        }
-
-        .voice-transcript {
-            font-size: 0.875rem;
-            color: var(--foreground);
-            min-height: 1.5rem;
-        }
-
-        .voice-settings-panel {
-            background: rgba(23, 23, 23, 0.7);
-            border: 1px solid var(--border);
-            border-radius: var(--radius);
-            padding: 1.5rem;
-            margin-bottom: 1rem;
-        }
-
-        .voice-setting-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 1rem;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid var(--border);
-        }
-
-        .voice-setting-row:last-child {
-            margin-bottom: 0;
-            padding-bottom: 0;
-            border-bottom: none;
-        }
-
-        .voice-setting-label {
-            font-size: 0.875rem;
-            font-weight: 500;
-        }
-
-        .voice-setting-description {
-            font-size: 0.75rem;
-            color: var(--muted-foreground);
-            margin-top: 0.25rem;
-        }
-
-        .toggle-switch {
-            position: relative;
-            display: inline-block;
-            width: 3rem;
-            height: 1.5rem;
-        }
-
-        .toggle-switch input {
-            opacity: 0;
-            width: 0;
-            height: 0;
-        }
-
-        .toggle-slider {
-            position: absolute;
-            cursor: pointer;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background-color: var(--secondary);
-            transition: 0.3s;
-            border-radius: 1.5rem;
-            border: 1px solid var(--border);
-        }
-
-        .toggle-slider:before {
-            position: absolute;
-            content: "";
-            height: 1rem;
-            width: 1rem;
-            left: 0.25rem;
-            bottom: 0.2rem;
-            background-color: var(--muted-foreground);
-            transition: 0.3s;
-            border-radius: 50%;
-        }
-
-        .toggle-switch input:checked + .toggle-slider {
-            background: linear-gradient(135deg, #3b82f6 0%, #2563eb 100%);
-            border-color: #3b82f6;
-        }
-
-        .toggle-switch input:checked + .toggle-slider:before {
-            transform: translateX(1.5rem);
-            background-color: white;
-        }
-
-        .permission-alert {
-            background: rgba(239, 68, 68, 0.1);
-            border: 1px solid rgba(239, 68, 68, 0.3);
-            color: #ef4444;
-            padding: 1rem;
-            border-radius: calc(var(--radius) - 2px);
-            margin-bottom: 1rem;
-            font-size: 0.875rem;
-        }
-
-        .compatibility-alert {
-            background: rgba(251, 191, 36, 0.1);
-            border: 1px solid rgba(251, 191, 36, 0.3);
-            color: #fbbf24;
-            padding: 1rem;
-            border-radius: calc(var(--radius) - 2px);
-            margin-bottom: 1rem;
-            font-size: 0.875rem;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='app.css', v=asset_version) }}">
 </head>
 <body>
     <div class="container">
@@ -928,1130 +308,135 @@ HTML_TEMPLATE = '''
                             <div class="voice-setting-description">Select your preferred language</div>
                         </div>
                         <select id="voice-language-select" onchange="saveVoiceSettings()" style="width: 200px; padding: 0.5rem; border-radius: 0.25rem; background: var(--input); color: var(--foreground); border: 1px solid var(--border);">
-                            <option value="en-US">English (US)</option>
-                            <option value="en-GB">English (UK)</option>
-                            <option value="es-ES">Spanish (Spain)</option>
-                            <option value="es-MX">Spanish (Mexico)</option>
-                            <option value="fr-FR">French</option>
-                            <option value="de-DE">German</option>
-                            <option value="it-IT">Italian</option>
-                            <option value="pt-BR">Portuguese (Brazil)</option>
-                            <option value="ja-JP">Japanese</option>
-                            <option value="zh-CN">Chinese (Simplified)</option>
-                            <option value="ko-KR">Korean</option>
-                        </select>
-                    </div>
-                </div>
-                
-                <div id="confirmation-area" style="display: none; margin-top: 2rem; padding: 1.5rem; background: var(--secondary); border-radius: var(--radius);">
-                    <h3 style="margin-bottom: 1rem;">Task Interpretation</h3>
-                    
-                    <div style="margin-bottom: 1rem;">
-                        <strong>Type:</strong>
-                        <span id="interpreted-type" class="badge badge-default" style="margin-left: 0.5rem;"></span>
-                    </div>
-                    
-                    <div style="margin-bottom: 1rem;">
-                        <strong>Content:</strong>
-                        <div id="interpreted-content" style="margin-top: 0.5rem; padding: 0.75rem; background: var(--background); border-radius: calc(var(--radius) - 2px); font-size: 0.875rem;"></div>
-                    </div>
-                    
-                    <div style="margin-bottom: 1.5rem;">
-                        <strong>Metadata:</strong>
-                        <div id="interpreted-metadata" style="margin-top: 0.5rem; padding: 0.75rem; background: var(--background); border-radius: calc(var(--radius) - 2px); font-family: monospace; font-size: 0.75rem;"></div>
-                    </div>
-                    
-                    <div class="button-group">
-                        <button class="button button-primary" onclick="confirmAndQueue()">Add to Queue</button>
-                        <button class="button button-secondary" onclick="clearConfirmation()">Clear</button>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="card">
-                <div class="card-header">
-                    <h2 class="card-title">Processing Controls</h2>
-                    <p class="card-description">Manage task processing</p>
-                </div>
-                
-                <div class="button-group">
-                    <button id="process-btn" class="button button-primary" onclick="startProcessing()">
-                        Start Processing
-                    </button>
-                    <button class="button button-destructive" onclick="stopProcessing()">Stop</button>
-                    <button class="button button-secondary" onclick="clearCompleted()">Clear Completed</button>
-                    <button class="button button-secondary" onclick="resetFailed()">Reset Failed</button>
-                </div>
-                
-                <div style="margin-top: 1rem;">
-                    <label for="auto-refresh">
-                        <input type="checkbox" id="auto-refresh" checked> Auto-refresh (5s)
-                    </label>
-                </div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <div class="tabs">
-                <div class="tab-list">
-                    <button class="tab-trigger active" onclick="switchTab('queue')">Task Queue</button>
-                    <button class="tab-trigger" onclick="switchTab('results')">Results</button>
-                    <button class="tab-trigger" onclick="switchTab('cluster')">🖥️  Cluster</button>
-                    <button class="tab-trigger" onclick="switchTab('logs')">Logs</button>
-                    <button class="tab-trigger" onclick="switchTab('files')">Files 📁</button>
-                    <a href="/gallery" target="_blank" class="tab-trigger" style="text-decoration: none;">Gallery View 🎨</a>
-                </div>
-            </div>
-            
-            <div class="tab-content active" id="tab-queue">
-                <div id="task-list">
-                    <div class="empty-state">No tasks in queue</div>
-                </div>
-            </div>
-            
-            <div class="tab-content" id="tab-results">
-                <div id="results-list">
-                    <div class="empty-state">No completed tasks</div>
-                </div>
-            </div>
-            
-            <div class="tab-content" id="tab-cluster">
-                <div style="margin-bottom: 1rem;">
-                    <button onclick="refreshClusterStatus()" class="button button-primary">🔄 Refresh Cluster Status</button>
-                </div>
-                <div id="cluster-info" class="result-viewer">
-                    <div class="cluster-status-card">
-                        <h3>Parallax Cluster Status</h3>
-                        <div id="cluster-status-content">
-                            <p>Loading cluster information...</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="tab-content" id="tab-logs">
-                <div class="result-viewer" id="logs-viewer">
-                    Logs will appear here...
-                </div>
-            </div>
-
-            <div class="tab-content" id="tab-files">
-                <div style="margin-bottom: 1rem;">
-                    <button onclick="refreshFiles()" class="btn">🔄 Refresh Files</button>
-                    <button onclick="downloadWorkspace()" class="btn">📦 Download Workspace</button>
-                </div>
-                <div id="files-list">
-                    <div class="empty-state">Click refresh to load workspace files</div>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <div class="toast" id="toast"></div>
-    
-    <script>
-        let processingInterval = null;
-        let refreshInterval = null;
-        let interpretedTask = null;
-
-        // Voice Recognition Variables
-        let recognition = null;
-        let isListening = false;
-        let voiceSettings = {
-            voiceFeedback: false,
-            autoDetect: true,
-            continuousMode: false,
-            language: 'en-US'
-        };
-        let speechSynthesis = window.speechSynthesis;
-        let voiceTimeout = null;
-
-        // Initialize Voice Recognition
-        function initVoiceRecognition() {
-            // Check browser compatibility
-            const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
-
-            if (!SpeechRecognition) {
-                document.getElementById('voice-compatibility-alert').style.display = 'block';
-                document.getElementById('mic-button').disabled = true;
-                document.getElementById('mic-button').style.opacity = '0.5';
-                document.getElementById('mic-button').style.cursor = 'not-allowed';
-                return false;
-            }
-
-            recognition = new SpeechRecognition();
-            recognition.continuous = voiceSettings.continuousMode;
-            recognition.interimResults = true;
-            recognition.lang = voiceSettings.language;
-            recognition.maxAlternatives = 1;
-
-            recognition.onstart = function() {
-                isListening = true;
-                updateVoiceUI('listening');
-                document.getElementById('voice-status-text').textContent = 'Listening... Speak now';
-
-                // Set timeout for auto-stop (30 seconds)
-                voiceTimeout = setTimeout(() => {
-                    if (isListening) {
-                        stopVoiceRecording();
-                        speakFeedback('Voice input timed out');
-                    }
-                }, 30000);
-            };
-
-            recognition.onresult = function(event) {
-                let interimTranscript = '';
-                let finalTranscript = '';
-
-                for (let i = event.resultIndex; i < event.results.length; i++) {
-                    const transcript = event.results[i][0].transcript;
-                    if (event.results[i].isFinal) {
-                        finalTranscript += transcript + ' ';
-                    } else {
-                        interimTranscript += transcript;
-                    }
-                }
-
-                // Update live transcript display
-                document.getElementById('voice-transcript').innerHTML =
-                    '<span style="color: #10b981;">' + finalTranscript + '</span>' +
-                    '<span style="color: #6b7280;">' + interimTranscript + '</span>';
-
-                // Update the textarea with final transcript
-                if (finalTranscript) {
-                    const currentText = document.getElementById('command').value;
-                    document.getElementById('command').value = currentText + finalTranscript;
-                }
-            };
-
-            recognition.onerror = function(event) {
-                console.error('Speech recognition error:', event.error);
-
-                if (event.error === 'not-allowed' || event.error === 'permission-denied') {
-                    document.getElementById('voice-permission-alert').style.display = 'block';
-                    speakFeedback('Microphone permission denied');
-                } else if (event.error === 'no-speech') {
-                    speakFeedback('No speech detected. Please try again.');
-                } else if (event.error === 'network') {
-                    speakFeedback('Network error. Please check your connection.');
-                } else {
-                    speakFeedback('Voice recognition error: ' + event.error);
-                }
-
-                stopVoiceRecording();
-            };
-
-            recognition.onend = function() {
-                if (voiceSettings.continuousMode && isListening) {
-                    // Restart if in continuous mode
-                    try {
-                        recognition.start();
-                    } catch (e) {
-                        console.error('Failed to restart recognition:', e);
-                        stopVoiceRecording();
-                    }
-                } else {
-                    stopVoiceRecording();
-                }
-            };
-
-            return true;
-        }
-
-        function toggleVoiceRecording() {
-            if (isListening) {
-                stopVoiceRecording();
-            } else {
-                startVoiceRecording();
-            }
-        }
-
-        function startVoiceRecording() {
-            if (!recognition) {
-                if (!initVoiceRecognition()) {
-                    return;
-                }
-            }
-
-            try {
-                recognition.lang = voiceSettings.language;
-                recognition.continuous = voiceSettings.continuousMode;
-                recognition.start();
-                speakFeedback('Listening');
-            } catch (e) {
-                console.error('Failed to start recognition:', e);
-                speakFeedback('Failed to start voice recognition');
-            }
-        }
-
-        function stopVoiceRecording() {
-            if (recognition && isListening) {
-                recognition.stop();
-            }
-
-            isListening = false;
-            updateVoiceUI('idle');
-            document.getElementById('voice-status-text').textContent = 'Click the microphone to speak your task';
-
-            if (voiceTimeout) {
-                clearTimeout(voiceTimeout);
-                voiceTimeout = null;
-            }
-
-            // If there's text, offer to interpret it
-            const commandText = document.getElementById('command').value.trim();
-            if (commandText && voiceSettings.autoDetect) {
-                setTimeout(() => {
-                    speakFeedback('Task captured. Click interpret to process.');
-                }, 500);
-            }
-        }
-
-        function updateVoiceUI(state) {
-            const micButton = document.getElementById('mic-button');
-            const micIcon = document.getElementById('mic-icon');
-
-            micButton.classList.remove('listening', 'processing');
-
-            if (state === 'listening') {
-                micButton.classList.add('listening');
-                micIcon.textContent = '⏸️';
-            } else if (state === 'processing') {
-                micButton.classList.add('processing');
-                micIcon.textContent = '⏳';
-            } else {
-                micIcon.textContent = '🎤';
-            }
-        }
-
-        function speakFeedback(text) {
-            if (!voiceSettings.voiceFeedback || !speechSynthesis) {
-                return;
-            }
-
-            // Cancel any ongoing speech
-            speechSynthesis.cancel();
-
-            const utterance = new SpeechSynthesisUtterance(text);
-            utterance.rate = 1.0;
-            utterance.pitch = 1.0;
-            utterance.volume = 0.8;
-
-            // Try to use a voice matching the selected language
-            const voices = speechSynthesis.getVoices();
-            const langPrefix = voiceSettings.language.substring(0, 2);
-            const matchingVoice = voices.find(voice => voice.lang.startsWith(langPrefix));
-            if (matchingVoice) {
-                utterance.voice = matchingVoice;
-            }
-
-            speechSynthesis.speak(utterance);
-        }
-
-        function toggleVoiceSettings() {
-            const panel = document.getElementById('voice-settings-panel');
-            panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
-        }
-
-        function saveVoiceSettings() {
-            voiceSettings.voiceFeedback = document.getElementById('voice-feedback-toggle').checked;
-            voiceSettings.autoDetect = document.getElementById('auto-detect-toggle').checked;
-            voiceSettings.continuousMode = document.getElementById('continuous-mode-toggle').checked;
-            voiceSettings.language = document.getElementById('voice-language-select').value;
-
-            // Save to localStorage
-            localStorage.setItem('voiceSettings', JSON.stringify(voiceSettings));
-
-            // Update recognition if active
-            if (recognition) {
-                recognition.lang = voiceSettings.language;
-                recognition.continuous = voiceSettings.continuousMode;
-            }
-
-            speakFeedback('Settings saved');
-        }
-
-        function loadVoiceSettings() {
-            const saved = localStorage.getItem('voiceSettings');
-            if (saved) {
-                voiceSettings = JSON.parse(saved);
-
-                document.getElementById('voice-feedback-toggle').checked = voiceSettings.voiceFeedback;
-                document.getElementById('auto-detect-toggle').checked = voiceSettings.autoDetect;
-                document.getElementById('continuous-mode-toggle').checked = voiceSettings.continuousMode;
-                document.getElementById('voice-language-select').value = voiceSettings.language;
-            }
-        }
-
-        // Load voices when available
-        if (speechSynthesis) {
-            speechSynthesis.onvoiceschanged = function() {
-                speechSynthesis.getVoices();
-            };
-        }
-
-        
-        async function interpretTask() {
-            const command = document.getElementById('command').value.trim();
-            if (!command) {
-                showToast('Please enter a task description', 'error');
-                speakFeedback('Please enter a task description');
-                return;
-            }
-
-            // Update voice UI to show processing
-            updateVoiceUI('processing');
-            speakFeedback('Interpreting your task');
-
-            // Show loading state
-            const button = event.target;
-            const originalText = button.textContent;
-            button.disabled = true;
-            button.textContent = 'Interpreting...';
-
-            try {
-                const response = await fetch('/api/interpret_task', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({command: command, voice_input: true})
-                });
-
-                if (response.ok) {
-                    interpretedTask = await response.json();
-                    displayInterpretation(interpretedTask);
-                    speakFeedback('Task interpreted as ' + interpretedTask.type);
-                } else {
-                    const error = await response.json();
-                    showToast('Failed to interpret task: ' + (error.error || 'Unknown error'), 'error');
-                    speakFeedback('Failed to interpret task');
-                }
-            } catch (error) {
-                showToast('Error: ' + error.message, 'error');
-                speakFeedback('Error interpreting task');
-            } finally {
-                button.disabled = false;
-                button.textContent = originalText;
-                updateVoiceUI('idle');
-            }
-        }
-        
-        function displayInterpretation(task) {
-            // Show the confirmation area
-            document.getElementById('confirmation-area').style.display = 'block';
-            
-            // Display task type
-            const typeSpan = document.getElementById('interpreted-type');
-            typeSpan.textContent = task.type.toUpperCase();
-            typeSpan.className = 'badge badge-default';
-            
-            // Display content
-            document.getElementById('interpreted-content').textContent = task.content;
-            
-            // Display metadata
-            const metadataDiv = document.getElementById('interpreted-metadata');
-            if (task.metadata && Object.keys(task.metadata).length > 0) {
-                metadataDiv.textContent = JSON.stringify(task.metadata, null, 2);
-            } else {
-                metadataDiv.textContent = 'No metadata specified';
-            }
-            
-            // Scroll to confirmation area
-            document.getElementById('confirmation-area').scrollIntoView({ behavior: 'smooth' });
-        }
-        
-        async function confirmAndQueue() {
-            if (!interpretedTask) {
-                showToast('No task to queue', 'error');
-                speakFeedback('No task to queue');
-                return;
-            }
-
-            try {
-                const response = await fetch('/api/add_task', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify(interpretedTask)
-                });
-
-                if (response.ok) {
-                    const result = await response.json();
-                    showToast(`Task queued: ${result.task_id}`);
-                    speakFeedback('Task queued successfully');
-                    clearAll();
-                    updateStatus();
-                    loadTasks();
-                } else {
-                    showToast('Failed to queue task', 'error');
-                    speakFeedback('Failed to queue task');
-                }
-            } catch (error) {
-                showToast('Error: ' + error.message, 'error');
-                speakFeedback('Error queuing task');
-            }
-        }
-        
-        function clearConfirmation() {
-            document.getElementById('confirmation-area').style.display = 'none';
-            interpretedTask = null;
-        }
-        
-        function clearAll() {
-            document.getElementById('command').value = '';
-            clearConfirmation();
-        }
-        
-        function clearForm() {
-            clearAll();
-        }
-        
-        // Keep for backward compatibility but won't be used with new flow
-        async function submitTask(event) {
-            event.preventDefault();
-            // This form submission is now handled through the interpret flow
-            interpretTask();
-        }
-        
-        async function startProcessing() {
-            const processBtn = document.getElementById('process-btn');
-            processBtn.disabled = true;
-            processBtn.innerHTML = 'Processing... <span class="loader" style="display: inline-block;"></span>';
-
-            try {
-                const response = await fetch('/api/start_processing', {method: 'POST'});
-                if (response.ok) {
-                    showToast('Processing started');
-                    speakFeedback('Processing started');
-                    processingInterval = setInterval(updateStatus, 2000);
-                    processBtn.classList.add('processing');
-                }
-            } catch (error) {
-                showToast('Error starting processing', 'error');
-                speakFeedback('Error starting processing');
-                processBtn.innerHTML = 'Start Processing';
-                processBtn.disabled = false;
-            }
-        }
-        
-        async function stopProcessing() {
-            const processBtn = document.getElementById('process-btn');
-            
-            try {
-                const response = await fetch('/api/stop_processing', {method: 'POST'});
-                if (response.ok) {
-                    showToast('Processing stopped');
-                    if (processingInterval) {
-                        clearInterval(processingInterval);
-                        processingInterval = null;
-                    }
-                    processBtn.innerHTML = 'Start Processing';
-                    processBtn.classList.remove('processing');
-                    processBtn.disabled = false;
-                }
-            } catch (error) {
-                showToast('Error stopping processing', 'error');
-            }
-        }
-        
-        async function clearCompleted() {
-            try {
-                const response = await fetch('/api/clear_completed', {method: 'POST'});
-                if (response.ok) {
-                    showToast('Completed tasks cleared');
-                    updateStatus();
-                    loadTasks();
-                }
-            } catch (error) {
-                showToast('Error clearing tasks', 'error');
-            }
-        }
-        
-        async function resetFailed() {
-            try {
-                const response = await fetch('/api/reset_failed', {method: 'POST'});
-                if (response.ok) {
-                    showToast('Failed tasks reset');
-                    updateStatus();
-                    loadTasks();
-                }
-            } catch (error) {
-                showToast('Error resetting tasks', 'error');
-            }
-        }
-        
-        async function updateStatus() {
-            try {
-                const response = await fetch('/api/status');
-                if (response.ok) {
-                    const stats = await response.json();
-                    document.getElementById('stat-total').textContent = stats.total || 0;
-                    document.getElementById('stat-pending').textContent = stats.pending || 0;
-                    document.getElementById('stat-processing').textContent = stats.processing || 0;
-                    document.getElementById('stat-completed').textContent = stats.completed || 0;
-                    document.getElementById('stat-failed').textContent = stats.failed || 0;
-                    
-                    // Update button state based on actual processing status
-                    const processBtn = document.getElementById('process-btn');
-                    const isProcessing = stats.processing === true;
-                    
-                    if (isProcessing) {
-                        processBtn.innerHTML = 'Processing... <span class="loader" style="display: inline-block;"></span>';
-                        processBtn.classList.add('processing');
-                        processBtn.disabled = true;
-                    } else {
-                        processBtn.innerHTML = 'Start Processing';
-                        processBtn.classList.remove('processing');
-                        processBtn.disabled = false;
-                        
-                        // Clear processing interval when processing stops
-                        if (processingInterval) {
-                            clearInterval(processingInterval);
-                            processingInterval = null;
-                        }
-                    }
-                }
-            } catch (error) {
-                console.error('Status update error:', error);
-            }
-        }
-        
-        
-        function renderTasks(tasks) {
-            const container = document.getElementById('task-list');
-            
-            if (tasks.length === 0) {
-                container.innerHTML = '<div class="empty-state">No tasks in queue</div>';
-                return;
-            }
-            
-            container.innerHTML = '<div class="task-list">' + 
-                tasks.map(task => `
-                    <div class="task-item">
-                        <div class="task-info">
-                            <div class="task-id">${task.id}</div>
-                            <div class="task-content">${task.content.substring(0, 100)}${task.content.length > 100 ? '...' : ''}</div>
-                            <div class="task-meta">
-                                <span class="badge badge-default">${task.type}</span>
-                                <span class="badge badge-${task.status}">${task.status}</span>
-                                ${task.processing_time ? `<span class="badge badge-default">${task.processing_time.toFixed(1)}s</span>` : ''}
-                            </div>
-                        </div>
-                        <div class="task-actions" style="display: flex; gap: 0.5rem;">
-                            ${task.status === 'completed' ? 
-                                `<button class="button button-ghost" onclick="viewResults('${task.id}')">View</button>` : 
-                                ''}
-                            ${task.status === 'pending' ? 
-                                `<button class="button button-ghost" onclick="editTask('${task.id}')">Edit</button>` : 
-                                ''}
-                            <button class="button button-ghost" onclick="deleteTask('${task.id}')" style="color: #ef4444;">Delete</button>
-                        </div>
-                    </div>
-                `).join('') + '</div>';
-        }
-        
-        async function viewResults(taskId) {
-            try {
-                const response = await fetch(`/api/task/${taskId}`);
-                if (response.ok) {
-                    const task = await response.json();
-                    switchTab('results');
-                    document.getElementById('results-list').innerHTML = 
-                        `<div class="result-viewer">${JSON.stringify(task.results, null, 2)}</div>`;
-                }
-            } catch (error) {
-                showToast('Error loading results', 'error');
-            }
-        }
-        
-        function switchTab(tabName) {
-            // Update current tab tracker
-            currentTab = tabName;
-            
-            // Update tab buttons
-            document.querySelectorAll('.tab-trigger').forEach(tab => {
-                tab.classList.remove('active');
-            });
-            document.querySelectorAll('.tab-content').forEach(content => {
-                content.classList.remove('active');
-            });
-            
-            // Find the clicked button and activate it
-            const clickedButton = Array.from(document.querySelectorAll('.tab-trigger'))
-                .find(btn => btn.textContent.toLowerCase().includes(tabName) || btn.onclick?.toString().includes(tabName));
-            if (clickedButton) {
-                clickedButton.classList.add('active');
-            }
-            
-            // Show the correct tab content
-            const tabContent = document.getElementById(`tab-${tabName}`);
-            if (tabContent) {
-                tabContent.classList.add('active');
-
-                // Load content based on tab
-                if (tabName === 'files') {
-                    refreshFiles();
-                } else if (tabName === 'results') {
-                    loadCompletedTasks();
-                } else if (tabName === 'cluster') {
-                    onClusterTabOpen();
-                }
-            }
-        }
-        
-        function showToast(message, type = 'success') {
-            const toast = document.getElementById('toast');
-            toast.textContent = message;
-            toast.className = 'toast show' + (type === 'error' ? ' error' : '');
-            
-            setTimeout(() => {
-                toast.classList.remove('show');
-            }, 3000);
-        }
-        
-        // Auto-refresh
-        document.getElementById('auto-refresh').addEventListener('change', function() {
-            if (this.checked) {
-                refreshInterval = setInterval(() => {
-                    updateStatus();
-                    loadTasks();
-                    if (currentTab === 'files') refreshFiles();
-                }, 5000);
-            } else {
-                if (refreshInterval) {
-                    clearInterval(refreshInterval);
-                    refreshInterval = null;
-                }
-            }
-        });
-        
-        // File management functions
-        async function refreshFiles() {
-            try {
-                const response = await fetch('/api/files');
-                if (response.ok) {
-                    const files = await response.json();
-                    displayFiles(files);
-                } else {
-                    showToast('Error loading files', 'error');
-                }
-            } catch (error) {
-                console.error('Error loading files:', error);
-                showToast('Error loading files', 'error');
-            }
-        }
-        
-        function displayFiles(files) {
-            const filesList = document.getElementById('files-list');
-            
-            if (files.length === 0) {
-                filesList.innerHTML = '<div class="empty-state">No files in workspace</div>';
-                return;
-            }
-            
-            filesList.innerHTML = files.map(file => `
-                <div class="task-card" style="cursor: pointer; margin-bottom: 0.5rem;" onclick="downloadFile('${file.name}')">
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <div>
-                            <strong>${file.name}</strong>
-                            <div style="font-size: 0.75rem; color: #666;">
-                                ${formatFileSize(file.size)} • ${new Date(file.modified).toLocaleDateString()}
-                            </div>
-                        </div>
-                        <button class="btn" onclick="event.stopPropagation(); downloadFile('${file.name}')" style="font-size: 0.75rem;">📥 Download</button>
-                    </div>
-                </div>
-            `).join('');
-        }
-        
-        function formatFileSize(bytes) {
-            if (bytes === 0) return '0 B';
-            const k = 1024;
-            const sizes = ['B', 'KB', 'MB', 'GB'];
-            const i = Math.floor(Math.log(bytes) / Math.log(k));
-            return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
-        }
-        
-        async function downloadFile(filename) {
-            try {
-                const response = await fetch(`/api/download/${encodeURIComponent(filename)}`);
-                if (response.ok) {
-                    const blob = await response.blob();
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = filename;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    window.URL.revokeObjectURL(url);
-                    showToast('File downloaded: ' + filename, 'success');
-                } else {
-                    showToast('Error downloading file', 'error');
-                }
-            } catch (error) {
-                showToast('Download failed: ' + error.message, 'error');
-            }
-        }
-        
-        async function downloadWorkspace() {
-            try {
-                const response = await fetch('/api/download/workspace.zip');
-                if (response.ok) {
-                    const blob = await response.blob();
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = 'workspace.zip';
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    window.URL.revokeObjectURL(url);
-                    showToast('Workspace downloaded', 'success');
-                } else {
-                    showToast('Error downloading workspace', 'error');
-                }
-            } catch (error) {
-                showToast('Download failed: ' + error.message, 'error');
-            }
-        }
-
-        // Cluster Status Functions
-        async function refreshClusterStatus() {
-            try {
-                const response = await fetch('/api/cluster/status');
-                if (response.ok) {
-                    const status = await response.json();
-                    displayClusterStatus(status);
-                    showToast('Cluster status updated', 'success');
-                } else {
-                    showToast('Error loading cluster status', 'error');
-                }
-            } catch (error) {
-                console.error('Error loading cluster status:', error);
-                showToast('Error loading cluster status', 'error');
-            }
-        }
-
-        function displayClusterStatus(status) {
-            const content = document.getElementById('cluster-status-content');
-
-            const statusIcon = status.connected ? '✅' : '❌';
-            const statusText = status.connected ? 'Connected' : 'Disconnected';
-            const statusColor = status.connected ? '#10b981' : '#ef4444';
-
-            const html = `
-                <div style="padding: 1rem;">
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 1rem;">
-                        <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
-                            <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Status</div>
-                            <div style="font-size: 1.25rem; font-weight: bold; color: ${statusColor};">
-                                ${statusIcon} ${statusText}
-                            </div>
-                        </div>
-                        <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
-                            <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Model</div>
-                            <div style="font-size: 1.25rem; font-weight: bold;">${status.model || 'N/A'}</div>
-                        </div>
-                        <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
-                            <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Active Nodes</div>
-                            <div style="font-size: 1.25rem; font-weight: bold;">${status.nodes || 0}</div>
-                        </div>
-                        <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
-                            <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Cluster Host</div>
-                            <div style="font-size: 1rem; font-weight: bold;">${status.host || 'N/A'}:${status.port || 'N/A'}</div>
-                        </div>
-                    </div>
-                    <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
-                        <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.5rem;">Parallax SDK Status</div>
-                        <div style="font-size: 0.875rem;">
-                            ${status.parallax_available ? '✅ Parallax SDK Available' : '⚠️  Parallax SDK Not Available (Using Ollama fallback)'}
-                        </div>
-                        ${status.last_check ? `
-                        <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-top: 0.5rem;">
-                            Last checked: ${new Date(status.last_check).toLocaleString()}
-                        </div>
-                        ` : ''}
-                    </div>
-                    ${!status.connected && status.parallax_available ? `
-                    <div style="margin-top: 1rem; padding: 1rem; background: #fef3c7; border-left: 4px solid #f59e0b; border-radius: 0.5rem; color: #92400e;">
-                        <strong>⚠️  Connection Issue</strong>
-                        <p style="margin: 0.5rem 0 0 0; font-size: 0.875rem;">
-                            Make sure Parallax is running: <code style="background: #fff; padding: 0.125rem 0.25rem; border-radius: 0.25rem;">parallax serve</code>
-                        </p>
+                            <option value="en-US">English (US)</option>
+                            <option value="en-GB">English (UK)</option>
+                            <option value="es-ES">Spanish (Spain)</option>
+                            <option value="es-MX">Spanish (Mexico)</option>
+                            <option value="fr-FR">French</option>
+                            <option value="de-DE">German</option>
+                            <option value="it-IT">Italian</option>
+                            <option value="pt-BR">Portuguese (Brazil)</option>
+                            <option value="ja-JP">Japanese</option>
+                            <option value="zh-CN">Chinese (Simplified)</option>
+                            <option value="ko-KR">Korean</option>
+                        </select>
                     </div>
-                    ` : ''}
                 </div>
-            `;
-
-            content.innerHTML = html;
-        }
-
-        // Auto-refresh cluster status when tab is opened
-        function onClusterTabOpen() {
-            refreshClusterStatus();
-        }
-
-        // Enhanced task display with progress
-        function displayEnhancedTask(task) {
-            const results = typeof task.results === 'string' ? JSON.parse(task.results || '{}') : (task.results || {});
-            const steps = Object.keys(results);
-            
-            let progressHtml = '';
-            if (task.status === 'processing' && steps.length > 0) {
-                progressHtml = `
-                    <div style="margin: 0.5rem 0; font-size: 0.75rem;">
-                        <strong>Progress:</strong> ${steps.map(step => 
-                            `<span style="background: #10b981; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem; margin: 0 0.25rem;">${step}</span>`
-                        ).join('')}
-                        <span style="background: #f59e0b; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem;">Processing...</span>
+                
+                <div id="confirmation-area" style="display: none; margin-top: 2rem; padding: 1.5rem; background: var(--secondary); border-radius: var(--radius);">
+                    <h3 style="margin-bottom: 1rem;">Task Interpretation</h3>
+                    
+                    <div style="margin-bottom: 1rem;">
+                        <strong>Type:</strong>
+                        <span id="interpreted-type" class="badge badge-default" style="margin-left: 0.5rem;"></span>
                     </div>
-                `;
-            }
-            
-            // Show web search indicator
-            let searchIndicator = '';
-            if (results.web_search || results.search_docs || results.research) {
-                searchIndicator = '<span style="background: #3b82f6; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.75rem;">🔍 Web Search</span>';
-            }
-            
-            return progressHtml + searchIndicator;
-        }
-        
-        // Track current tab for refresh
-        let currentTab = 'queue';
-        
-        // Load completed tasks for results tab
-        async function loadCompletedTasks() {
-            try {
-                const response = await fetch('/api/tasks');
-                if (response.ok) {
-                    const data = await response.json();
-                    const tasks = data.tasks || data;
-                    const completedTasks = tasks.filter(t => t.status === 'completed');
                     
-                    const resultsDiv = document.getElementById('results-list');
-                    if (completedTasks.length === 0) {
-                        resultsDiv.innerHTML = '<div class="empty-state">No completed tasks</div>';
-                        return;
-                    }
+                    <div style="margin-bottom: 1rem;">
+                        <strong>Content:</strong>
+                        <div id="interpreted-content" style="margin-top: 0.5rem; padding: 0.75rem; background: var(--background); border-radius: calc(var(--radius) - 2px); font-size: 0.875rem;"></div>
+                    </div>
                     
-                    resultsDiv.innerHTML = completedTasks.map(task => `
-                        <div class="task-item" style="margin-bottom: 1rem; padding: 1rem; border: 1px solid #ddd; border-radius: 0.5rem;">
-                            <div style="display: flex; justify-content: between; margin-bottom: 0.5rem;">
-                                <strong>${task.type}</strong>
-                                <small>${new Date(task.created_at).toLocaleString()}</small>
-                            </div>
-                            <div style="margin-bottom: 0.5rem; font-size: 0.875rem;">
-                                ${task.content.substring(0, 150)}...
-                            </div>
-                            <button onclick="viewTaskResults('${task.id}')" class="btn" style="font-size: 0.75rem;">View Results</button>
-                        </div>
-                    `).join('');
-                }
-            } catch (error) {
-                console.error('Error loading completed tasks:', error);
-            }
-        }
-        
-        // Delete a task
-        async function deleteTask(taskId) {
-            if (!confirm('Are you sure you want to delete this task?')) {
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/delete_task/${taskId}`, {method: 'DELETE'});
-                if (response.ok) {
-                    showToast('Task deleted successfully');
-                    updateStatus();
-                    loadTasks();
-                } else {
-                    const error = await response.json();
-                    showToast(error.error || 'Failed to delete task', 'error');
-                }
-            } catch (error) {
-                showToast('Error deleting task', 'error');
-            }
-        }
-        
-        // Edit a task
-        async function editTask(taskId) {
-            const task = allTasks ? allTasks.find(t => t.id === taskId) : null;
-            if (!task) {
-                showToast('Task not found', 'error');
-                return;
-            }
-            
-            if (task.status !== 'pending') {
-                showToast('Can only edit pending tasks', 'error');
-                return;
-            }
-            
-            // Create a modal for editing
-            const modal = document.getElementById('task-modal');
-            const modalTitle = document.getElementById('modal-title');
-            const modalBody = document.getElementById('modal-body');
-            
-            modalTitle.textContent = `Edit Task ${task.id}`;
+                    <div style="margin-bottom: 1.5rem;">
+                        <strong>Metadata:</strong>
+                        <div id="interpreted-metadata" style="margin-top: 0.5rem; padding: 0.75rem; background: var(--background); border-radius: calc(var(--radius) - 2px); font-family: monospace; font-size: 0.75rem;"></div>
+                    </div>
+                    
+                    <div class="button-group">
+                        <button class="button button-primary" onclick="confirmAndQueue()">Add to Queue</button>
+                        <button class="button button-secondary" onclick="clearConfirmation()">Clear</button>
+                    </div>
+                </div>
+            </div>
             
-            modalBody.innerHTML = `
-                <div class="form-group">
-                    <label for="edit-content">Task Content:</label>
-                    <textarea id="edit-content" style="width: 100%; min-height: 100px;">${task.content}</textarea>
+            <div class="card">
+                <div class="card-header">
+                    <h2 class="card-title">Processing Controls</h2>
+                    <p class="card-description">Manage task processing</p>
                 </div>
                 
-                <div class="form-group">
-                    <label>Metadata (Optional):</label>
-                    <div id="edit-metadata-container"></div>
-                    <button type="button" class="button button-secondary" onclick="addEditMetadataRow()">+ Add Metadata</button>
+                <div class="button-group">
+                    <button id="process-btn" class="button button-primary" onclick="startProcessing()">
+                        Start Processing
+                    </button>
+                    <button class="button button-destructive" onclick="stopProcessing()">Stop</button>
+                    <button class="button button-secondary" onclick="clearCompleted()">Clear Completed</button>
+                    <button class="button button-secondary" onclick="resetFailed()">Reset Failed</button>
                 </div>
                 
-                <div style="display: flex; gap: 1rem; margin-top: 1.5rem;">
-                    <button class="button button-primary" onclick="saveTaskEdit('${task.id}')">Save Changes</button>
-                    <button class="button button-secondary" onclick="closeModal()">Cancel</button>
+                <div style="margin-top: 1rem;">
+                    <label for="auto-refresh">
+                        <input type="checkbox" id="auto-refresh" checked> Auto-refresh (5s)
+                    </label>
                 </div>
-            `;
-            
-            // Populate existing metadata
-            const metadataContainer = document.getElementById('edit-metadata-container');
-            if (task.metadata && Object.keys(task.metadata).length > 0) {
-                Object.entries(task.metadata).forEach(([key, value]) => {
-                    const row = document.createElement('div');
-                    row.className = 'metadata-row';
-                    row.innerHTML = `
-                        <input type="text" placeholder="Key" class="meta-key" value="${key}">
-                        <input type="text" placeholder="Value" class="meta-value" value="${value}">
-                        <button type="button" class="button button-ghost icon-button" onclick="removeMetadataRow(this)">×</button>
-                    `;
-                    metadataContainer.appendChild(row);
-                });
-            } else {
-                addEditMetadataRow();
-            }
-            
-            modal.classList.add('active');
-        }
-        
-        function addEditMetadataRow() {
-            const container = document.getElementById('edit-metadata-container');
-            const row = document.createElement('div');
-            row.className = 'metadata-row';
-            row.innerHTML = `
-                <input type="text" placeholder="Key" class="meta-key">
-                <input type="text" placeholder="Value" class="meta-value">
-                <button type="button" class="button button-ghost icon-button" onclick="removeMetadataRow(this)">×</button>
-            `;
-            container.appendChild(row);
-        }
+            </div>
+        </div>
         
-        async function saveTaskEdit(taskId) {
-            const content = document.getElementById('edit-content').value.trim();
-            if (!content) {
-                showToast('Task content cannot be empty', 'error');
-                return;
-            }
+        <div class="card">
+            <div class="tabs">
+                <div class="tab-list">
+                    <button class="tab-trigger active" onclick="switchTab('queue')">Task Queue</button>
+                    <button class="tab-trigger" onclick="switchTab('results')">Results</button>
+                    <button class="tab-trigger" onclick="switchTab('cluster')">🖥️  Cluster</button>
+                    <button class="tab-trigger" onclick="switchTab('logs')">Logs</button>
+                    <button class="tab-trigger" onclick="switchTab('files')">Files 📁</button>
+                    <a href="/gallery" target="_blank" class="tab-trigger" style="text-decoration: none;">Gallery View 🎨</a>
+                </div>
+            </div>
             
-            const metadata = {};
-            document.querySelectorAll('#edit-metadata-container .metadata-row').forEach(row => {
-                const key = row.querySelector('.meta-key').value.trim();
-                const value = row.querySelector('.meta-value').value.trim();
-                if (key && value) {
-                    metadata[key] = value;
-                }
-            });
+            <div class="tab-content active" id="tab-queue">
+                <div id="task-list">
+                    <div class="empty-state">No tasks in queue</div>
+                </div>
+            </div>
             
-            try {
-                const response = await fetch(`/api/update_task/${taskId}`, {
-                    method: 'PUT',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({content, metadata})
-                });
-                
-                if (response.ok) {
-                    showToast('Task updated successfully');
-                    closeModal();
-                    updateStatus();
-                    loadTasks();
-                } else {
-                    const error = await response.json();
-                    showToast(error.error || 'Failed to update task', 'error');
-                }
-            } catch (error) {
-                showToast('Error updating task', 'error');
-            }
-        }
-        
-        // Store tasks globally for edit/delete operations  
-        let allTasks = [];
-        
-        // Update loadTasks to store tasks globally
-        async function loadTasks() {
-            try {
-                const response = await fetch('/api/tasks');
-                if (response.ok) {
-                    const data = await response.json();
-                    allTasks = data.tasks || data; // Store globally and handle both formats
-                    renderTasks(allTasks);
-                }
-            } catch (error) {
-                console.error('Error loading tasks:', error);
-            }
-        }
+            <div class="tab-content" id="tab-results">
+                <div id="results-list">
+                    <div class="empty-state">No completed tasks</div>
+                </div>
+            </div>
+            
+            <div class="tab-content" id="tab-cluster">
+                <div style="margin-bottom: 1rem;">
+                    <button onclick="refreshClusterStatus()" class="button button-primary">🔄 Refresh Cluster Status</button>
+                </div>
+                <div id="cluster-info" class="result-viewer">
+                    <div class="cluster-status-card">
+                        <h3>Parallax Cluster Status</h3>
+                        <div id="cluster-status-content">
+                            <p>Loading cluster information...</p>
+                        </div>
+                    </div>
+                </div>
+            </div>
 
-        // View individual task results
-        async function viewTaskResults(taskId) {
-            try {
-                const response = await fetch(`/api/task/${taskId}`);
-                if (response.ok) {
-                    const task = await response.json();
-                    const resultsDiv = document.getElementById('results-list');
-                    
-                    let resultsHtml = '<div class="result-viewer">';
-                    resultsHtml += `<h3>Task: ${task.type}</h3>`;
-                    resultsHtml += `<p><strong>Content:</strong> ${task.content}</p>`;
-                    resultsHtml += `<p><strong>Processing Time:</strong> ${task.processing_time}s</p>`;
-                    resultsHtml += '<h4>Results:</h4>';
-                    
-                    if (task.results && typeof task.results === 'object') {
-                        Object.entries(task.results).forEach(([key, value]) => {
-                            resultsHtml += `<div style="margin-bottom: 1rem;">`;
-                            resultsHtml += `<h5>${key.replace(/_/g, ' ').toUpperCase()}</h5>`;
-                            resultsHtml += `<pre style="background: #f5f5f5; padding: 1rem; border-radius: 0.25rem; white-space: pre-wrap; font-size: 0.875rem;">${typeof value === 'string' ? value : JSON.stringify(value, null, 2)}</pre>`;
-                            resultsHtml += `</div>`;
-                        });
-                    }
-                    
-                    resultsHtml += `<button onclick="loadCompletedTasks()" class="btn" style="margin-top: 1rem;">← Back to Results</button>`;
-                    resultsHtml += '</div>';
-                    
-                    resultsDiv.innerHTML = resultsHtml;
-                }
-            } catch (error) {
-                console.error('Error loading task results:', error);
-            }
-        }
-        
-        
-        // Form submission
-        document.getElementById('task-form').addEventListener('submit', submitTask);
-
-        // Initial load
-        updateStatus();
-        loadTasks();
-
-        // Initialize voice recognition
-        loadVoiceSettings();
-        initVoiceRecognition();
-
-        // Start auto-refresh
-        refreshInterval = setInterval(() => {
-            updateStatus();
-            loadTasks();
-        }, 5000);
-    </script>
+            <div class="tab-content" id="tab-logs">
+                <div class="result-viewer" id="logs-viewer">
+                    Logs will appear here...
+                </div>
+            </div>
+
+            <div class="tab-content" id="tab-files">
+                <div style="margin-bottom: 1rem;">
+                    <button onclick="refreshFiles()" class="btn">🔄 Refresh Files</button>
+                    <button onclick="downloadWorkspace()" class="btn">📦 Download Workspace</button>
+                </div>
+                <div id="files-list">
+                    <div class="empty-state">Click refresh to load workspace files</div>
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    <div class="toast" id="toast"></div>
+    
+    <script src="{{ url_for('static', filename='app.js', v=asset_version) }}"></script>
 </body>
 </html>
 '''
 
+# Markdown code fence the model sometimes wraps its task JSON in
+FENCED_JSON_RE = re.compile(r'```(?:json)?(.*?)(?:```|$)', re.DOTALL)
+
 def create_ai_router_prompt():
     """Create a system prompt for the AI to interpret user commands into task JSON"""
     return """You are a Task Interpreter for Parallax Voice Office, a voice-first AI assistant. Your role is to analyze user commands (spoken or typed) and convert them into structured task JSON objects.
@@ -2158,6 +543,52 @@ User: "Write a Python script to analyze CSV files with documentation and tests"
 
 Do not include any explanation, markdown formatting, or additional text. Only return the JSON object."""
 
+# SQLite tuning for the task store: WAL lets the status polls read while a
+# task is being saved, and NORMAL sync is safe under WAL
+SQLITE_BUSY_TIMEOUT = 5000  # ms
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',  # ~20 MB page cache per connection
+    'PRAGMA mmap_size=268435456',
+    f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}',
+)
+
+# Ollama generations are streamed: connecting must succeed within 5s, but a
+# long generation may take as long as it needs. Partial text is pushed to the
+# page at most every OLLAMA_STREAM_NOTIFY_INTERVAL seconds
+OLLAMA_TIMEOUT = (5, None)
+OLLAMA_STREAM_NOTIFY_INTERVAL = 0.5
+
+# Tasks processed at once. They mostly wait on the LLM, so threads overlap
+# even with the GIL; without it (free-threaded 3.13t builds) default to one
+# per core
+if hasattr(sys, '_is_gil_enabled') and not sys._is_gil_enabled():
+    DEFAULT_PARALLEL_TASKS = os.cpu_count() or 1
+else:
+    DEFAULT_PARALLEL_TASKS = 1
+
+# Task rows are buffered and written together, at most DB_FLUSH_INTERVAL
+# seconds (or DB_FLUSH_MAX_ROWS rows) after save_to_db()
+DB_FLUSH_INTERVAL = 0.1
+DB_FLUSH_MAX_ROWS = 100
+TASK_UPSERT_SQL = '''
+    INSERT OR REPLACE INTO tasks
+    (id, type, content, status, results, metadata, error, retry_count, created_at, updated_at,
+     processing_time, priority, tags, scheduled_time, parent_task_id, recurring, progress,
+     current_step, in_queue)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# The queue is every row still flagged in_queue; cleared and deleted tasks
+# keep their row for history and search
+QUEUE_SELECT_SQL = '''
+    SELECT id, type, content, status, results, metadata, error, retry_count, created_at,
+           processing_time, priority, tags, scheduled_time, parent_task_id, recurring,
+           progress, current_step
+    FROM tasks WHERE in_queue = 1 ORDER BY created_at
+'''
+
 # Processor class (simplified for single file)
 class TaskProcessor:
     def __init__(self):
@@ -2167,17 +598,37 @@ class TaskProcessor:
             self.db_path = data_dir / "task_processor.db"
         else:
             self.db_path = Path("task_processor.db")
-        self.queue_file = Path("task_queue.json")
         self.results_dir = Path("results")
         self.results_dir.mkdir(exist_ok=True)
 
         # Load configuration from YAML file
         self.load_config()
-
-        self.queue = []
+        self.parallel_tasks = max(1, int(self.config.get('parallel_tasks', DEFAULT_PARALLEL_TASKS)))
+
+        # Keep-alive pool so each Ollama call reuses its connection. Sized
+        # for every task worker with headroom for interpret requests; only failed
+        # connects are retried, since a generation POST is never re-sent
+        self.session = requests.Session()
+        ollama_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(16, self.parallel_tasks + 8),
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('http://', ollama_adapter)
+        self.session.mount('https://', ollama_adapter)
+
+        # Tasks by id in queue order; the source of truth for every lookup.
+        # Writers hold queue_lock; readers iterate the self.queue snapshot
+        self.tasks: Dict[str, Task] = {}
+        self.queue_lock = threading.RLock()
+        self._id_stamp, self._id_seq = '', 0
         self.processing = False
         self.processing_thread = None
 
+        # Bumped on every queue/processing change; /api/events waits on it
+        self.state_version = 0
+        self.state_changed = threading.Condition()
+
         # Initialize Parallax client
         self.parallax_client = None
         self.cluster_nodes = []
@@ -2192,15 +643,34 @@ class TaskProcessor:
         self.mcp_manager = None
         self.init_mcp()
 
+        self._db_local = threading.local()
+        self._task_configs = {}
         self.init_database()
         self.load_queue()
 
+        # save_to_db() only buffers rows; they are written in batches
+        self._pending_saves: Dict[str, tuple] = {}
+        self._db_lock = threading.Lock()
+        self._db_wake = threading.Event()
+        threading.Thread(target=self._flush_db_loop, name='db-flush', daemon=True).start()
+        atexit.register(self.flush_db)
+
+    def get_db(self) -> sqlite3.Connection:
+        """Return this thread's connection to the task store, opening it on first use"""
+        conn = getattr(self._db_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT / 1000)
+            for pragma in SQLITE_PRAGMAS:
+                conn.execute(pragma)
+            self._db_local.conn = conn
+        return conn
+
     def load_config(self):
         """Load configuration from processor_config.yaml"""
         config_file = Path("processor_config.yaml")
         if config_file.exists():
             with open(config_file, 'r') as f:
-                yaml_config = yaml.safe_load(f)
+                yaml_config = yaml.load(f, Loader=YAML_LOADER)
 
             # Extract Parallax configuration
             parallax_config = yaml_config.get('parallax', {})
@@ -2214,6 +684,7 @@ class TaskProcessor:
                 'parallax_max_workers': parallax_config.get('max_workers', 4),
                 'top_p': yaml_config.get('top_p', 0.9),
                 'max_tokens': yaml_config.get('max_tokens', -1),
+                'parallel_tasks': yaml_config.get('parallel_tasks', DEFAULT_PARALLEL_TASKS),
                 'cluster_config': yaml_config.get('cluster', {})
             }
 
@@ -2322,7 +793,7 @@ class TaskProcessor:
         }
     
     def init_database(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_db()
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS tasks (
@@ -2343,7 +814,8 @@ class TaskProcessor:
                 parent_task_id TEXT,
                 recurring TEXT,
                 progress REAL DEFAULT 0.0,
-                current_step TEXT DEFAULT ''
+                current_step TEXT DEFAULT '',
+                in_queue INTEGER DEFAULT 1
             )
         ''')
 
@@ -2382,80 +854,161 @@ class TaskProcessor:
             cursor.execute("ALTER TABLE tasks ADD COLUMN current_step TEXT DEFAULT ''")
         except:
             pass
+        try:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN in_queue INTEGER DEFAULT 1")
+            self._migrate_queue_file(cursor)
+        except sqlite3.OperationalError:
+            pass
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_in_queue ON tasks(in_queue)')
 
         conn.commit()
-        conn.close()
+
+    def _migrate_queue_file(self, cursor: sqlite3.Cursor):
+        """Flag the tasks of an old task_queue.json as queued, and only those"""
+        queued_ids = []
+        queue_file = Path("task_queue.json")
+        if queue_file.exists():
+            try:
+                with open(queue_file, 'r') as f:
+                    queued_ids = [item['id'] for item in json.load(f)]
+            except Exception as e:
+                logger.warning(f"Could not read {queue_file} for migration: {e}")
+        cursor.execute(
+            f"UPDATE tasks SET in_queue = 0 WHERE id NOT IN ({','.join('?' * len(queued_ids))})",
+            queued_ids
+        )
     
     def load_queue(self):
-        if self.queue_file.exists():
+        """Rebuild the in-memory queue from the tasks table"""
+        tasks = {}
+        for row in self.get_db().execute(QUEUE_SELECT_SQL):
             try:
-                with open(self.queue_file, 'r') as f:
-                    data = json.load(f)
-                    self.queue = []
-                    for item in data:
-                        if 'type' in item and isinstance(item['type'], str):
-                            item['type'] = TaskType(item['type'])
-                        if 'status' in item and isinstance(item['status'], str):
-                            item['status'] = TaskStatus(item['status'])
-                        self.queue.append(Task(**item))
-            except:
-                self.queue = []
+                task = Task(
+                    id=row[0],
+                    type=TaskType(row[1]),
+                    content=row[2],
+                    status=TaskStatus(row[3]),
+                    results=_json_loads(row[4]) if row[4] else {},
+                    metadata=_json_loads(row[5]) if row[5] else {},
+                    error=row[6],
+                    retry_count=row[7] or 0,
+                    created_at=row[8] or "",
+                    processing_time=row[9] or 0,
+                    priority=row[10] or "medium",
+                    tags=_json_loads(row[11]) if row[11] else [],
+                    scheduled_time=row[12],
+                    parent_task_id=row[13],
+                    recurring=_json_loads(row[14]) if row[14] else None,
+                    progress=row[15] or 0.0,
+                    current_step=row[16] or ""
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping unreadable task {row[0]}: {e}")
+                continue
+            tasks[task.id] = task
+        self.tasks = tasks
+
+    @property
+    def queue(self) -> List[Task]:
+        """Snapshot of the tasks in queue order, safe to iterate while others add or remove"""
+        return list(self.tasks.values())
+
+    def new_task_id(self, task_type: str) -> str:
+        """Timestamp-based id; later ids in the same 0.1s get a _2, _3, ... suffix
+
+        Callers hold queue_lock. Ids never repeat within the process, so a new
+        task can't replace the history row of a cleared or deleted one.
+        """
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:17]
+        if stamp == self._id_stamp:
+            self._id_seq += 1
+        else:
+            self._id_stamp, self._id_seq = stamp, 1
+        task_id = f"{task_type}_{stamp}"
+        return task_id if self._id_seq == 1 else f"{task_id}_{self._id_seq}"
     
-    def save_queue(self):
-        queue_data = []
-        for task in self.queue:
-            task_dict = asdict(task)
-            task_dict['type'] = task.type.value
-            task_dict['status'] = task.status.value
-            queue_data.append(task_dict)
-        
-        with open(self.queue_file, 'w') as f:
-            json.dump(queue_data, f, indent=2)
+    def notify_change(self):
+        """Wake the /api/events streams so they push the new state"""
+        with self.state_changed:
+            self.state_version += 1
+            self.state_changed.notify_all()
+
+    def wait_for_change(self, seen_version: int, timeout: float) -> int:
+        """Block until state_version moves past seen_version or timeout expires"""
+        with self.state_changed:
+            self.state_changed.wait_for(lambda: self.state_version != seen_version, timeout)
+            return self.state_version
     
     def add_task(self, task_type: str, content: str, metadata: dict = None) -> str:
-        task_id = f"{task_type}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:17]}"
-        task = Task(
-            id=task_id,
-            type=TaskType(task_type),
-            content=content,
-            metadata=metadata or {}
-        )
-        self.queue.append(task)
-        self.save_queue()
+        with self.queue_lock:
+            task_id = self.new_task_id(task_type)
+            task = Task(
+                id=task_id,
+                type=TaskType(task_type),
+                content=content,
+                metadata=metadata or {}
+            )
+            self.tasks[task_id] = task
         self.save_to_db(task)
+        self.notify_change()
         return task_id
     
     def save_to_db(self, task: Task):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT OR REPLACE INTO tasks
-            (id, type, content, status, results, metadata, error, retry_count, updated_at, processing_time,
-             priority, tags, scheduled_time, parent_task_id, recurring, progress, current_step)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        """Buffer the task's row; the db-flush thread writes it within DB_FLUSH_INTERVAL"""
+        row = (
             task.id,
             task.type.value,
             task.content,
             task.status.value,
-            json.dumps(task.results),
-            json.dumps(task.metadata),
+            _json_dumps(task.results),
+            _json_dumps(task.metadata),
             task.error,
             task.retry_count,
+            task.created_at,
             datetime.now().isoformat(),
             task.processing_time,
             task.priority,
-            json.dumps(task.tags) if task.tags else None,
+            _json_dumps(task.tags) if task.tags else None,
             task.scheduled_time,
             task.parent_task_id,
-            json.dumps(task.recurring) if task.recurring else None,
+            _json_dumps(task.recurring) if task.recurring else None,
             task.progress,
-            task.current_step
-        ))
-        conn.commit()
-        conn.close()
+            task.current_step,
+            int(task.id in self.tasks)
+        )
+        with self._db_lock:
+            self._pending_saves[task.id] = row
+            if len(self._pending_saves) >= DB_FLUSH_MAX_ROWS:
+                self._db_wake.set()
+
+    def flush_db(self):
+        """Write all buffered task rows in a single transaction"""
+        with self._db_lock:
+            if not self._pending_saves:
+                return
+            rows = list(self._pending_saves.values())
+            self._pending_saves.clear()
+
+            conn = self.get_db()
+            try:
+                with conn:
+                    conn.executemany(TASK_UPSERT_SQL, rows)
+            except Exception:
+                # Keep the rows for the next attempt unless a newer save replaced them
+                for row in rows:
+                    self._pending_saves.setdefault(row[0], row)
+                raise
+
+    def _flush_db_loop(self):
+        while True:
+            self._db_wake.wait(DB_FLUSH_INTERVAL)
+            self._db_wake.clear()
+            try:
+                self.flush_db()
+            except Exception as e:
+                logger.error(f"Failed to flush task rows to database: {e}")
     
-    def process_with_parallax(self, prompt: str) -> str:
+    def process_with_parallax(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """Process a prompt using Parallax distributed computing"""
         if self.parallax_client and PARALLAX_AVAILABLE:
             try:
@@ -2481,13 +1034,17 @@ class TaskProcessor:
             except Exception as e:
                 logger.error(f"Parallax error: {e}")
                 logger.warning("Falling back to Ollama")
-                return self.process_with_ollama_fallback(prompt)
+                return self.process_with_ollama_fallback(prompt, on_chunk)
         else:
             # Fallback to Ollama if Parallax not available
-            return self.process_with_ollama_fallback(prompt)
+            return self.process_with_ollama_fallback(prompt, on_chunk)
 
-    def process_with_ollama_fallback(self, prompt: str) -> str:
-        """Fallback to Ollama API for backward compatibility"""
+    def process_with_ollama_fallback(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """Fallback to Ollama API for backward compatibility
+
+        The response is streamed; on_chunk, if given, is called with each
+        piece of text as Ollama produces it.
+        """
         try:
             if 'ollama_host' not in self.config:
                 return "Error: Neither Parallax nor Ollama is configured"
@@ -2496,29 +1053,63 @@ class TaskProcessor:
             payload = {
                 'model': self.config['model'],
                 'prompt': prompt,
-                'stream': False,
+                'stream': True,
                 'options': {
                     'temperature': self.config.get('temperature', 0.7),
                 }
             }
 
-            response = requests.post(
+            with self.session.post(
                 f"{self.config['ollama_host']}/api/generate",
-                json=payload,
-                timeout=None
-            )
-
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            return "Error: Failed to get response from Ollama"
+                data=_json_dumps_bytes(payload),
+                headers={'Content-Type': 'application/json'},
+                stream=True,
+                timeout=OLLAMA_TIMEOUT
+            ) as response:
+                if response.status_code != 200:
+                    return "Error: Failed to get response from Ollama"
+
+                parts = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    if 'error' in chunk:
+                        return f"Error: {chunk['error']}"
+                    piece = chunk.get('response', '')
+                    if piece:
+                        parts.append(piece)
+                        if on_chunk:
+                            on_chunk(piece)
+                    if chunk.get('done'):
+                        return ''.join(parts)
+                # Connection closed mid-generation; don't pass partial text off as the result
+                return "Error: Ollama stream ended before the generation finished"
         except Exception as e:
             logger.error(f"Ollama fallback error: {e}")
             return f"Error: {str(e)}"
 
     # Alias for backward compatibility
-    def process_with_ollama(self, prompt: str) -> str:
+    def process_with_ollama(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
         """Backward compatibility alias - redirects to process_with_parallax"""
-        return self.process_with_parallax(prompt)
+        return self.process_with_parallax(prompt, on_chunk)
+
+    def _stream_into(self, task: Task, key: str) -> Callable[[str], None]:
+        """on_chunk callback that shows the text generated so far as task.results[key]"""
+        parts = []
+        last_notify = 0.0
+
+        def on_chunk(piece: str):
+            nonlocal last_notify
+            parts.append(piece)
+            now = time.monotonic()
+            if now - last_notify >= OLLAMA_STREAM_NOTIFY_INTERVAL:
+                last_notify = now
+                task.results[key] = ''.join(parts)
+                task.updated_at = datetime.now().isoformat()
+                self.notify_change()
+
+        return on_chunk
 
     def load_task_config(self, task_type: str) -> Optional[Dict[str, Any]]:
         """Load task configuration from YAML file"""
@@ -2529,8 +1120,14 @@ class TaskProcessor:
             return None
 
         try:
+            # Parsed once per file version; steps are only read, never mutated
+            mtime = config_file.stat().st_mtime_ns
+            cached = self._task_configs.get(task_type)
+            if cached and cached[0] == mtime:
+                return cached[1]
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER)
+            self._task_configs[task_type] = (mtime, config)
             return config
         except Exception as e:
             logger.error(f"Failed to load task config: {e}")
@@ -2577,7 +1174,7 @@ class TaskProcessor:
                             prompt = prompt.replace(placeholder, value_str)
 
                     # Process with Parallax
-                    response = self.process_with_parallax(prompt)
+                    response = self.process_with_parallax(prompt, self._stream_into(task, step_name))
                     results[step_name] = response
                     context[step_name] = response
 
@@ -2658,6 +1255,7 @@ class TaskProcessor:
     def process_task(self, task: Task):
         task.status = TaskStatus.PROCESSING
         task.updated_at = datetime.now().isoformat()
+        self.notify_change()
         start_time = time.time()
 
         try:
@@ -2685,26 +1283,26 @@ class TaskProcessor:
                         task.results['search'] = f"Search results for: {task.content[:50]}"
 
                     prompt = f"Summarize this search query and create a report: {task.content}"
-                    task.results['report'] = self.process_with_ollama(prompt)
+                    task.results['report'] = self.process_with_ollama(prompt, self._stream_into(task, 'report'))
 
                 elif task.type == TaskType.PROCESS:
                     prompt = f"Process and improve this content: {task.content}"
-                    task.results['processed'] = self.process_with_ollama(prompt)
+                    task.results['processed'] = self.process_with_ollama(prompt, self._stream_into(task, 'processed'))
 
                 elif task.type == TaskType.CREATE:
                     prompt = f"Create content based on: {task.content}"
-                    task.results['created'] = self.process_with_ollama(prompt)
+                    task.results['created'] = self.process_with_ollama(prompt, self._stream_into(task, 'created'))
 
                 elif task.type == TaskType.CODE:
                     prompt = f"Write code for: {task.content}"
-                    task.results['code'] = self.process_with_ollama(prompt)
+                    task.results['code'] = self.process_with_ollama(prompt, self._stream_into(task, 'code'))
 
                 elif task.type == TaskType.CHAIN:
                     # Multi-step processing
                     steps = ["analyze", "expand", "finalize"]
                     for step in steps:
                         prompt = f"{step.capitalize()} this: {task.content}"
-                        task.results[step] = self.process_with_ollama(prompt)
+                        task.results[step] = self.process_with_ollama(prompt, self._stream_into(task, step))
 
             # Save content to file if filename is specified in metadata
             self._save_results_to_file(task)
@@ -2721,7 +1319,7 @@ class TaskProcessor:
 
         task.updated_at = datetime.now().isoformat()
         self.save_to_db(task)
-        self.save_queue()
+        self.notify_change()
     
     def start_processing(self):
         if not self.processing:
@@ -2729,35 +1327,61 @@ class TaskProcessor:
             self.processing_thread = threading.Thread(target=self._process_loop)
             self.processing_thread.daemon = True
             self.processing_thread.start()
+            self.notify_change()
     
     def stop_processing(self):
         self.processing = False
+        self.notify_change()
     
+    def _claim_next_task(self) -> Optional[Task]:
+        """Mark the first pending task as processing and return it"""
+        with self.queue_lock:
+            task = next((t for t in self.tasks.values() if t.status == TaskStatus.PENDING), None)
+            if task:
+                task.status = TaskStatus.PROCESSING
+            return task
+
     def _process_loop(self):
-        while self.processing:
-            pending_tasks = [t for t in self.queue if t.status == TaskStatus.PENDING]
-            if pending_tasks:
-                task = pending_tasks[0]
-                self.process_task(task)
+        # Up to parallel_tasks tasks run at once; with the default of 1 this
+        # is the original one-at-a-time loop
+        with ThreadPoolExecutor(max_workers=self.parallel_tasks,
+                                thread_name_prefix='task') as pool:
+            running = set()
+            while self.processing:
+                while len(running) < self.parallel_tasks:
+                    task = self._claim_next_task()
+                    if task is None:
+                        break
+                    running.add(pool.submit(self.process_task, task))
+
+                if not running:
+                    # No more pending tasks, stop processing
+                    logger.info("No more pending tasks, stopping processing")
+                    self.processing = False
+                    self.notify_change()
+                    break
+
+                _, running = wait(running, return_when=FIRST_COMPLETED)
                 time.sleep(2)  # Delay between tasks
-            else:
-                # No more pending tasks, stop processing
-                logger.info("No more pending tasks, stopping processing")
-                self.processing = False
-                break
     
     def get_stats(self):
+        tasks = self.queue
+        counts = Counter(t.status for t in tasks)
         return {
-            'total': len(self.queue),
-            'pending': sum(1 for t in self.queue if t.status == TaskStatus.PENDING),
-            'processing': sum(1 for t in self.queue if t.status == TaskStatus.PROCESSING),
-            'completed': sum(1 for t in self.queue if t.status == TaskStatus.COMPLETED),
-            'failed': sum(1 for t in self.queue if t.status == TaskStatus.FAILED),
+            'total': len(tasks),
+            'pending': counts[TaskStatus.PENDING],
+            'processing': counts[TaskStatus.PROCESSING],
+            'completed': counts[TaskStatus.COMPLETED],
+            'failed': counts[TaskStatus.FAILED],
         }
     
     def clear_completed(self):
-        self.queue = [t for t in self.queue if t.status != TaskStatus.COMPLETED]
-        self.save_queue()
+        with self.queue_lock:
+            completed = [t for t in self.tasks.values() if t.status == TaskStatus.COMPLETED]
+            self.tasks = {tid: t for tid, t in self.tasks.items() if t.status != TaskStatus.COMPLETED}
+        for task in completed:
+            self.save_to_db(task)
+        self.notify_change()
     
     def reset_failed(self):
         for task in self.queue:
@@ -2765,50 +1389,50 @@ class TaskProcessor:
                 task.status = TaskStatus.PENDING
                 task.retry_count = 0
                 task.error = None
-        self.save_queue()
+                self.save_to_db(task)
+        self.notify_change()
     
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from the queue"""
-        initial_len = len(self.queue)
-        self.queue = [t for t in self.queue if t.id != task_id]
-        if len(self.queue) < initial_len:
-            self.save_queue()
+        with self.queue_lock:
+            removed = self.tasks.pop(task_id, None)
+        if removed is not None:
+            self.save_to_db(removed)
+            self.notify_change()
             return True
         return False
     
     def update_task(self, task_id: str, content: str = None, metadata: dict = None) -> bool:
         """Update a task's content and/or metadata (only if pending)"""
-        task = next((t for t in self.queue if t.id == task_id), None)
+        task = self.tasks.get(task_id)
         if task and task.status == TaskStatus.PENDING:
             if content is not None:
                 task.content = content
             if metadata is not None:
                 task.metadata = metadata
             task.updated_at = datetime.now().isoformat()
-            self.save_queue()
             self.save_to_db(task)
+            self.notify_change()
             return True
         return False
 
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a task by ID and return as dictionary"""
-        task = next((t for t in self.queue if t.id == task_id), None)
+        task = self.tasks.get(task_id)
         if task:
-            task_dict = asdict(task)
-            task_dict['type'] = task.type.value
-            task_dict['status'] = task.status.value
-            return task_dict
+            return task.to_dict()
         return None
 
     def update_progress(self, task_id: str, progress: float, current_step: str = ""):
         """Update task progress (0-100) and current step"""
-        task = next((t for t in self.queue if t.id == task_id), None)
+        task = self.tasks.get(task_id)
         if task:
             task.progress = max(0.0, min(100.0, progress))  # Clamp between 0 and 100
             if current_step:
                 task.current_step = current_step
             task.updated_at = datetime.now().isoformat()
             self.save_to_db(task)
+            self.notify_change()
 
     def _save_results_to_file(self, task: Task):
         """Save task results to a file in the workspace directory"""
@@ -2864,8 +1488,57 @@ class TaskProcessor:
             task.results['save_document'] = f"Error saving file: {str(e)}"
 
 # Flask application
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() through orjson; falls back to Flask's encoder for other types"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+# app.css / app.js are referenced with ?v=<content hash>, so browsers may
+# cache them for a year and still pick up edits on the next page load
+STATIC_MAX_AGE = 31536000
+
+class AssetCachingFlask(Flask):
+    """Long-lived caching for /static only; send_file responses (workspace
+    downloads, the gallery, exports) keep Flask's default revalidation, since
+    tasks overwrite those files under the same names"""
+
+    def send_static_file(self, filename: str):
+        return send_from_directory(self.static_folder, filename, max_age=STATIC_MAX_AGE)
+
+app = AssetCachingFlask(__name__)
 CORS(app)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIMETYPES'] = [
+        'text/html', 'text/css', 'application/javascript',
+        'text/javascript', 'application/json'
+    ]
+    Compress(app)
+
+def compute_asset_version():
+    """Short content hash of the static assets, used to bust browser caches"""
+    digest = hashlib.blake2b(digest_size=6)
+    for name in ('app.css', 'app.js'):
+        try:
+            digest.update((Path(app.static_folder) / name).read_bytes())
+        except OSError as e:
+            logger.warning(f"Static asset {name} not readable: {e}")
+    return digest.hexdigest()
+
+ASSET_VERSION = compute_asset_version()
+
+# Request threads, so status polls don't queue behind slow API calls. Every
+# open /api/events stream holds one of them for as long as the page is open,
+# so only SSE_MAX_STREAMS may stream at once; later clients get a 503 and
+# fall back to polling, leaving the rest of the pool for ordinary requests
+WEB_THREADS = 16
+SSE_MAX_STREAMS = WEB_THREADS // 2
 
 # Initialize processor
 processor = TaskProcessor()
@@ -2948,23 +1621,73 @@ def generate_qr_code_ascii(url):
         pass
     return False
 
+# HTML_TEMPLATE compiled once on first use; render_template_string would re-parse it per request
+_index_template = None
+
+def get_index_template():
+    global _index_template
+    if _index_template is None:
+        _index_template = app.jinja_env.from_string(HTML_TEMPLATE)
+    return _index_template
+
+_server_info = None
+
+def get_server_info():
+    """LAN address shown on the index page; resolved once per process"""
+    global _server_info
+    if _server_info is None:
+        _server_info = f"{get_local_ip()}:5001"
+    return _server_info
+
 @app.route('/')
 def index():
-    server_info = f"{get_local_ip()}:5001"
-    return render_template_string(HTML_TEMPLATE, 
-                                 server_info=server_info,
-                                 model=processor.config['model'])
+    return get_index_template().render(server_info=get_server_info(),
+                                       model=processor.config['model'],
+                                       asset_version=ASSET_VERSION)
+
+# LLM interpretations run here so a slow model never ties up a request
+# thread; clients poll /api/interpret_status/<job_id> for the result
+INTERPRET_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='interpret')
+INTERPRET_JOB_TTL = 600  # seconds an unclaimed result is kept
+interpret_jobs: Dict[str, tuple] = {}
+interpret_jobs_lock = threading.Lock()
 
 @app.route('/api/interpret_task', methods=['POST'])
 def interpret_task():
+    """Queue interpretation of a natural language command; returns a job id"""
+    data = request.json
+    user_command = data.get('command', '').strip()
+
+    if not user_command:
+        return jsonify({'error': 'No command provided'}), 400
+
+    job_id = secrets.token_hex(8)
+    now = time.time()
+    with interpret_jobs_lock:
+        for stale_id in [jid for jid, (created, _) in interpret_jobs.items()
+                         if now - created > INTERPRET_JOB_TTL]:
+            del interpret_jobs[stale_id]
+        interpret_jobs[job_id] = (now, INTERPRET_POOL.submit(interpret_command, user_command))
+    return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+
+@app.route('/api/interpret_status/<job_id>')
+def interpret_status(job_id):
+    """Result of an /api/interpret_task job, or 202 while it is still running"""
+    with interpret_jobs_lock:
+        job = interpret_jobs.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown interpretation job'}), 404
+        future = job[1]
+        if not future.done():
+            return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+        del interpret_jobs[job_id]
+
+    body, status_code = future.result()
+    return jsonify(body), status_code
+
+def interpret_command(user_command: str):
     """Interpret user's natural language command into structured task JSON"""
     try:
-        data = request.json
-        user_command = data.get('command', '').strip()
-        
-        if not user_command:
-            return jsonify({'error': 'No command provided'}), 400
-        
         # Create the prompt for the AI
         system_prompt = create_ai_router_prompt()
         
@@ -2978,13 +1701,11 @@ def interpret_task():
         try:
             # Clean the response - remove any markdown formatting
             cleaned = interpretation.strip()
-            if cleaned.startswith('```'):
-                # Remove markdown code blocks
-                cleaned = cleaned.split('```')[1]
-                if cleaned.startswith('json'):
-                    cleaned = cleaned[4:]
+            fenced = FENCED_JSON_RE.match(cleaned)
+            if fenced:
+                cleaned = fenced.group(1)
             
-            task_json = json.loads(cleaned)
+            task_json = _json_loads(cleaned)
             
             # Validate the structure
             if 'type' not in task_json or 'content' not in task_json:
@@ -2994,21 +1715,21 @@ def interpret_task():
             if 'metadata' not in task_json:
                 task_json['metadata'] = {}
             
-            return jsonify(task_json)
+            return task_json, 200
             
         except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"Failed to parse AI interpretation: {e}")
             # Fallback: try to extract meaningful parts
-            return jsonify({
+            return {
                 'type': 'process',
                 'content': user_command,
                 'metadata': {},
                 'error': 'Could not fully interpret command, using defaults'
-            })
+            }, 200
             
     except Exception as e:
         logger.error(f"Error in interpret_task: {e}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
 @app.route('/api/add_task', methods=['POST'])
 def add_task():
@@ -3028,22 +1749,37 @@ def status():
 
 @app.route('/api/tasks')
 def get_tasks():
-    tasks_data = []
-    for task in processor.queue:
-        task_dict = asdict(task)
-        task_dict['type'] = task.type.value
-        task_dict['status'] = task.status.value
-        tasks_data.append(task_dict)
-    return jsonify({'tasks': tasks_data})
+    # state_version moves on every queue change, so an unchanged ETag means
+    # the browser's cached list is current; the pid guards against a restart
+    # reusing version numbers
+    etag = f"{os.getpid()}-{processor.state_version}"
+
+    # ?fields=id,status,... trims each task to what the caller renders
+    fields = [f for f in request.args.get('fields', '').split(',') if f in TASK_FIELDS]
+    if fields:
+        etag += '-' + '.'.join(fields)
+
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    elif fields:
+        tasks_data = []
+        for task in processor.queue:
+            task_dict = task.to_dict()
+            tasks_data.append({f: task_dict[f] for f in fields})
+        response = jsonify({'tasks': tasks_data})
+    else:
+        tasks_data = [task.to_dict() for task in processor.queue]
+        response = jsonify({'tasks': tasks_data})
+    response.set_etag(etag)
+    # Revalidate on every poll instead of heuristically caching
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/api/task/<task_id>')
 def get_task(task_id):
-    task = next((t for t in processor.queue if t.id == task_id), None)
+    task = processor.tasks.get(task_id)
     if task:
-        task_dict = asdict(task)
-        task_dict['type'] = task.type.value
-        task_dict['status'] = task.status.value
-        return jsonify(task_dict)
+        return jsonify(task.to_dict())
     return jsonify({'error': 'Task not found'}), 404
 
 @app.route('/api/start_processing', methods=['POST'])
@@ -3137,6 +1873,16 @@ def gallery():
     else:
         return "Gallery template not found", 404
 
+@app.route('/api/export')
+def export_queue():
+    """Export the whole queue as a JSON file"""
+    return app.response_class(
+        _json_dumps([task.to_dict() for task in processor.queue]),
+        mimetype='application/json',
+        headers={'Content-Disposition':
+                 f'attachment; filename=task_queue_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'}
+    )
+
 @app.route('/api/export/<task_id>')
 def export_task(task_id):
     """Export a single task result"""
@@ -3202,21 +1948,35 @@ def upload_file():
     
     return jsonify({'message': 'File uploaded successfully', 'filename': file.filename})
 
+_cli_db_local = threading.local()
+
+def get_cli_db() -> Optional[sqlite3.Connection]:
+    """Return this thread's connection to the CLI database, or None if it doesn't exist yet"""
+    # Use data directory for database in Docker, current dir otherwise
+    data_dir = Path("data")
+    if data_dir.exists():
+        cli_db_path = data_dir / "universal_processor.db"
+    else:
+        cli_db_path = Path("universal_processor.db")
+
+    if not cli_db_path.exists():
+        return None
+
+    conn = getattr(_cli_db_local, 'conn', None)
+    if conn is None or getattr(_cli_db_local, 'path', None) != cli_db_path:
+        # The CLI owns this file and already runs it in WAL mode
+        conn = sqlite3.connect(cli_db_path, timeout=SQLITE_BUSY_TIMEOUT / 1000)
+        _cli_db_local.conn, _cli_db_local.path = conn, cli_db_path
+    return conn
+
 @app.route('/api/cli_tasks')
 def get_cli_tasks():
     """Get tasks from CLI database (universal_processor.db)"""
     try:
-        # Use data directory for database in Docker, current dir otherwise
-        data_dir = Path("data")
-        if data_dir.exists():
-            cli_db_path = data_dir / "universal_processor.db"
-        else:
-            cli_db_path = Path("universal_processor.db")
-        
-        if not cli_db_path.exists():
+        conn = get_cli_db()
+        if conn is None:
             return jsonify({'tasks': []})
         
-        conn = sqlite3.connect(cli_db_path)
         cursor = conn.cursor()
         cursor.execute('''
             SELECT id, type, content, config_name, status, results, metadata, error, 
@@ -3233,8 +1993,8 @@ def get_cli_tasks():
                 'content': row[2],
                 'config_name': row[3],
                 'status': row[4],
-                'results': json.loads(row[5]) if row[5] else {},
-                'metadata': json.loads(row[6]) if row[6] else {},
+                'results': _json_loads(row[5]) if row[5] else {},
+                'metadata': _json_loads(row[6]) if row[6] else {},
                 'error': row[7],
                 'retry_count': row[8],
                 'created_at': row[9],
@@ -3243,7 +2003,6 @@ def get_cli_tasks():
             }
             tasks_data.append(task)
         
-        conn.close()
         return jsonify({'tasks': tasks_data})
         
     except Exception as e:
@@ -3254,17 +2013,10 @@ def get_cli_tasks():
 def get_cli_task(task_id):
     """Get single CLI task with steps"""
     try:
-        # Use data directory for database in Docker, current dir otherwise
-        data_dir = Path("data")
-        if data_dir.exists():
-            cli_db_path = data_dir / "universal_processor.db"
-        else:
-            cli_db_path = Path("universal_processor.db")
-        
-        if not cli_db_path.exists():
+        conn = get_cli_db()
+        if conn is None:
             return jsonify({'error': 'CLI database not found'}), 404
         
-        conn = sqlite3.connect(cli_db_path)
         cursor = conn.cursor()
         
         # Get task details
@@ -3276,7 +2028,6 @@ def get_cli_task(task_id):
         
         row = cursor.fetchone()
         if not row:
-            conn.close()
             return jsonify({'error': 'Task not found'}), 404
         
         task = {
@@ -3285,8 +2036,8 @@ def get_cli_task(task_id):
             'content': row[2],
             'config_name': row[3],
             'status': row[4],
-            'results': json.loads(row[5]) if row[5] else {},
-            'metadata': json.loads(row[6]) if row[6] else {},
+            'results': _json_loads(row[5]) if row[5] else {},
+            'metadata': _json_loads(row[6]) if row[6] else {},
             'error': row[7],
             'retry_count': row[8],
             'created_at': row[9],
@@ -3310,7 +2061,6 @@ def get_cli_task(task_id):
             }
             task['steps'].append(step)
         
-        conn.close()
         return jsonify(task)
         
     except Exception as e:
@@ -3350,7 +2100,7 @@ def get_gallery_tasks():
         end_date = request.args.get('end_date', '')
 
         # Build query
-        conn = sqlite3.connect(processor.db_path)
+        conn = processor.get_db()
         cursor = conn.cursor()
 
         query = "SELECT id, type, content, status, results, metadata, error, retry_count, created_at, updated_at, processing_time, priority, tags, scheduled_time, parent_task_id, recurring, progress, current_step FROM tasks WHERE 1=1"
@@ -3409,25 +2159,23 @@ def get_gallery_tasks():
                 'type': row[1],
                 'content': row[2],
                 'status': row[3],
-                'results': json.loads(row[4]) if row[4] else {},
-                'metadata': json.loads(row[5]) if row[5] else {},
+                'results': _json_loads(row[4]) if row[4] else {},
+                'metadata': _json_loads(row[5]) if row[5] else {},
                 'error': row[6],
                 'retry_count': row[7],
                 'created_at': row[8],
                 'updated_at': row[9],
                 'processing_time': row[10],
                 'priority': row[11] if row[11] else 'medium',
-                'tags': json.loads(row[12]) if row[12] else [],
+                'tags': _json_loads(row[12]) if row[12] else [],
                 'scheduled_time': row[13],
                 'parent_task_id': row[14],
-                'recurring': json.loads(row[15]) if row[15] else None,
+                'recurring': _json_loads(row[15]) if row[15] else None,
                 'progress': row[16] if row[16] else 0.0,
                 'current_step': row[17] if row[17] else ''
             }
             tasks_data.append(task)
 
-        conn.close()
-
         return jsonify({
             'tasks': tasks_data,
             'pagination': {
@@ -3444,30 +2192,31 @@ def get_gallery_tasks():
 @app.route('/api/task/<task_id>/duplicate', methods=['POST'])
 def duplicate_task(task_id):
     """Duplicate a task"""
-    task = next((t for t in processor.queue if t.id == task_id), None)
+    task = processor.tasks.get(task_id)
     if not task:
         return jsonify({'error': 'Task not found'}), 404
 
-    # Create new task ID
-    new_id = f"{task.type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:17]}"
-
-    # Create duplicate task
-    new_task = Task(
-        id=new_id,
-        type=task.type,
-        content=task.content,
-        config_name=task.config_name,
-        status=TaskStatus.PENDING,
-        metadata=task.metadata.copy(),
-        priority=task.priority,
-        tags=task.tags.copy() if task.tags else [],
-        parent_task_id=task.parent_task_id,
-        recurring=task.recurring.copy() if task.recurring else None
-    )
+    with processor.queue_lock:
+        # Create new task ID
+        new_id = processor.new_task_id(task.type.value)
+
+        # Create duplicate task
+        new_task = Task(
+            id=new_id,
+            type=task.type,
+            content=task.content,
+            config_name=task.config_name,
+            status=TaskStatus.PENDING,
+            metadata=task.metadata.copy(),
+            priority=task.priority,
+            tags=task.tags.copy() if task.tags else [],
+            parent_task_id=task.parent_task_id,
+            recurring=task.recurring.copy() if task.recurring else None
+        )
+        processor.tasks[new_id] = new_task
 
-    processor.queue.append(new_task)
-    processor.save_queue()
     processor.save_to_db(new_task)
+    processor.notify_change()
 
     return jsonify({'message': 'Task duplicated successfully', 'new_task_id': new_id})
 
@@ -3480,14 +2229,14 @@ def update_task_priority(task_id):
     if priority not in ['high', 'medium', 'low']:
         return jsonify({'error': 'Invalid priority. Must be high, medium, or low'}), 400
 
-    task = next((t for t in processor.queue if t.id == task_id), None)
+    task = processor.tasks.get(task_id)
     if not task:
         return jsonify({'error': 'Task not found'}), 404
 
     task.priority = priority
     task.updated_at = datetime.now().isoformat()
-    processor.save_queue()
     processor.save_to_db(task)
+    processor.notify_change()
 
     return jsonify({'message': 'Priority updated successfully'})
 
@@ -3500,14 +2249,14 @@ def update_task_tags(task_id):
     if not isinstance(tags, list):
         return jsonify({'error': 'Tags must be a list'}), 400
 
-    task = next((t for t in processor.queue if t.id == task_id), None)
+    task = processor.tasks.get(task_id)
     if not task:
         return jsonify({'error': 'Task not found'}), 404
 
     task.tags = tags
     task.updated_at = datetime.now().isoformat()
-    processor.save_queue()
     processor.save_to_db(task)
+    processor.notify_change()
 
     return jsonify({'message': 'Tags updated successfully'})
 
@@ -3540,29 +2289,29 @@ def bulk_task_operations():
         if value not in ['high', 'medium', 'low']:
             return jsonify({'error': 'Invalid priority'}), 400
         for task_id in task_ids:
-            task = next((t for t in processor.queue if t.id == task_id), None)
+            task = processor.tasks.get(task_id)
             if task:
                 task.priority = value
                 task.updated_at = datetime.now().isoformat()
                 processor.save_to_db(task)
                 affected_count += 1
-        processor.save_queue()
+        processor.notify_change()
 
     elif operation == 'update_tags':
         if not isinstance(value, list):
             return jsonify({'error': 'Tags must be a list'}), 400
         for task_id in task_ids:
-            task = next((t for t in processor.queue if t.id == task_id), None)
+            task = processor.tasks.get(task_id)
             if task:
                 task.tags = value
                 task.updated_at = datetime.now().isoformat()
                 processor.save_to_db(task)
                 affected_count += 1
-        processor.save_queue()
+        processor.notify_change()
 
     elif operation == 'update_status':
         for task_id in task_ids:
-            task = next((t for t in processor.queue if t.id == task_id), None)
+            task = processor.tasks.get(task_id)
             if task:
                 try:
                     task.status = TaskStatus(value)
@@ -3571,7 +2320,7 @@ def bulk_task_operations():
                     affected_count += 1
                 except ValueError:
                     pass
-        processor.save_queue()
+        processor.notify_change()
 
     else:
         return jsonify({'error': 'Unknown operation'}), 400
@@ -3594,12 +2343,9 @@ def bulk_export_tasks():
     zip_buffer = BytesIO()
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         for task_id in task_ids:
-            task = next((t for t in processor.queue if t.id == task_id), None)
+            task = processor.tasks.get(task_id)
             if task:
-                task_dict = asdict(task)
-                task_dict['type'] = task.type.value
-                task_dict['status'] = task.status.value
-                json_data = json.dumps(task_dict, indent=2)
+                json_data = json.dumps(task.to_dict(), indent=2)
                 zip_file.writestr(f'{task_id}.json', json_data)
 
     zip_buffer.seek(0)
@@ -3611,40 +2357,68 @@ def bulk_export_tasks():
     )
 
 # Server-Sent Events for real-time updates
+SSE_KEEPALIVE_SECONDS = 15
+sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+def sse_event(name: str, data: Any) -> str:
+    return f"event: {name}\ndata: {_json_dumps(data)}\n\n"
+
+def _task_signature(task: Task) -> tuple:
+    """Fields whose change is pushed to the page as a task_updated event"""
+    return (task.status, task.progress, task.current_step, task.updated_at,
+            task.processing_time, task.content, task.error, task.priority)
+
+def _task_summary(task: Task) -> Dict[str, Any]:
+    """Task for the live list; results are left out and fetched on demand"""
+    summary = task.to_dict()
+    del summary['results']
+    return summary
+
 @app.route('/api/events')
 def sse_events():
     """Server-Sent Events endpoint for real-time task updates"""
+    if not sse_slots.acquire(blocking=False):
+        return jsonify({'error': 'Too many live update streams, poll instead'}), 503
+
     def event_stream():
-        last_update = datetime.now()
+        # Named events: 'tasks' (the whole list, once on connect), then only
+        # 'task_added' / 'task_updated' / 'task_deleted' patches, and 'status'
+        # with the counters after every change
+        sent = None
+        version = processor.state_version
         while True:
-            # Check for updates every second
-            time.sleep(1)
-
-            # Get current tasks state
-            tasks_data = []
-            for task in processor.queue:
-                task_dict = {
-                    'id': task.id,
-                    'status': task.status.value,
-                    'progress': task.progress,
-                    'current_step': task.current_step,
-                    'updated_at': task.updated_at
-                }
-                tasks_data.append(task_dict)
+            tasks = processor.queue
+            current = {task.id: _task_signature(task) for task in tasks}
 
-            # Get processing status
-            stats = processor.get_stats()
-
-            event_data = {
-                'tasks': tasks_data,
-                'stats': stats,
+            if sent is None:
+                yield sse_event('tasks', [_task_summary(t) for t in tasks])
+            else:
+                added = [_task_summary(t) for t in tasks if t.id not in sent]
+                updated = [_task_summary(t) for t in tasks
+                           if t.id in sent and sent[t.id] != current[t.id]]
+                deleted = [tid for tid in sent if tid not in current]
+                if added:
+                    yield sse_event('task_added', added)
+                if updated:
+                    yield sse_event('task_updated', updated)
+                if deleted:
+                    yield sse_event('task_deleted', deleted)
+            sent = current
+
+            yield sse_event('status', {
+                'stats': processor.get_stats(),
                 'processing': processor.processing,
                 'timestamp': datetime.now().isoformat()
-            }
+            })
 
-            yield f"data: {json.dumps(event_data)}\n\n"
+            while processor.wait_for_change(version, SSE_KEEPALIVE_SECONDS) == version:
+                # Comment line keeps proxies and the browser from timing out
+                yield ": keepalive\n\n"
+            # Read before the next snapshot, so a change made while it is
+            # being built still triggers another event
+            version = processor.state_version
 
-    return app.response_class(
+    response = app.response_class(
         event_stream(),
         mimetype='text/event-stream',
         headers={
@@ -3652,6 +2426,9 @@ def sse_events():
             'X-Accel-Buffering': 'no'
         }
     )
+    # The server closes the response when the client goes away
+    response.call_on_close(sse_slots.release)
+    return response
 
 @app.route('/api/metadata/templates')
 def get_metadata_templates():
@@ -3780,7 +2557,11 @@ if __name__ == '__main__':
     print("="*70 + "\n")
     
     try:
-        app.run(host='0.0.0.0', port=5001, debug=False)
+        if WAITRESS_AVAILABLE:
+            logger.info(f"Serving with waitress ({WEB_THREADS} threads)")
+            waitress_serve(app, host='0.0.0.0', port=5001, threads=WEB_THREADS)
+        else:
+            app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
     except OSError as e:
         if "Address already in use" in str(e):
             print("❌ ERROR: Port 5001 is already in use!")
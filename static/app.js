@@ -0,0 +1,1205 @@
+let processingInterval = null;
+let refreshInterval = null;
+let eventSource = null;
+let interpretedTask = null;
+
+// Elements touched on every refresh, looked up once (the script loads at the
+// end of <body>, so they already exist)
+const els = {
+    total: document.getElementById('stat-total'),
+    pending: document.getElementById('stat-pending'),
+    processing: document.getElementById('stat-processing'),
+    completed: document.getElementById('stat-completed'),
+    failed: document.getElementById('stat-failed'),
+    processBtn: document.getElementById('process-btn'),
+    taskList: document.getElementById('task-list'),
+    filesList: document.getElementById('files-list'),
+    resultsList: document.getElementById('results-list'),
+    toast: document.getElementById('toast'),
+    autoRefresh: document.getElementById('auto-refresh')
+};
+
+// Calls made while a previous one is still in flight share its promise
+// instead of issuing a duplicate request
+function coalesced(fn) {
+    let inFlight = null;
+    return function (...args) {
+        if (!inFlight) {
+            inFlight = fn.apply(this, args).finally(() => { inFlight = null; });
+        }
+        return inFlight;
+    };
+}
+
+// Voice Recognition Variables
+let recognition = null;
+let isListening = false;
+let voiceSettings = {
+    voiceFeedback: false,
+    autoDetect: true,
+    continuousMode: false,
+    language: 'en-US'
+};
+let speechSynthesis = window.speechSynthesis;
+let voiceTimeout = null;
+
+// Initialize Voice Recognition
+function initVoiceRecognition() {
+    // Check browser compatibility
+    const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
+
+    if (!SpeechRecognition) {
+        document.getElementById('voice-compatibility-alert').style.display = 'block';
+        document.getElementById('mic-button').disabled = true;
+        document.getElementById('mic-button').style.opacity = '0.5';
+        document.getElementById('mic-button').style.cursor = 'not-allowed';
+        return false;
+    }
+
+    recognition = new SpeechRecognition();
+    recognition.continuous = voiceSettings.continuousMode;
+    recognition.interimResults = true;
+    recognition.lang = voiceSettings.language;
+    recognition.maxAlternatives = 1;
+
+    recognition.onstart = function() {
+        isListening = true;
+        updateVoiceUI('listening');
+        document.getElementById('voice-status-text').textContent = 'Listening... Speak now';
+
+        // Set timeout for auto-stop (30 seconds)
+        voiceTimeout = setTimeout(() => {
+            if (isListening) {
+                stopVoiceRecording();
+                speakFeedback('Voice input timed out');
+            }
+        }, 30000);
+    };
+
+    recognition.onresult = function(event) {
+        let interimTranscript = '';
+        let finalTranscript = '';
+
+        for (let i = event.resultIndex; i < event.results.length; i++) {
+            const transcript = event.results[i][0].transcript;
+            if (event.results[i].isFinal) {
+                finalTranscript += transcript + ' ';
+            } else {
+                interimTranscript += transcript;
+            }
+        }
+
+        // Update live transcript display
+        document.getElementById('voice-transcript').innerHTML =
+            '<span style="color: #10b981;">' + finalTranscript + '</span>' +
+            '<span style="color: #6b7280;">' + interimTranscript + '</span>';
+
+        // Update the textarea with final transcript
+        if (finalTranscript) {
+            const currentText = document.getElementById('command').value;
+            document.getElementById('command').value = currentText + finalTranscript;
+        }
+    };
+
+    recognition.onerror = function(event) {
+        console.error('Speech recognition error:', event.error);
+
+        if (event.error === 'not-allowed' || event.error === 'permission-denied') {
+            document.getElementById('voice-permission-alert').style.display = 'block';
+            speakFeedback('Microphone permission denied');
+        } else if (event.error === 'no-speech') {
+            speakFeedback('No speech detected. Please try again.');
+        } else if (event.error === 'network') {
+            speakFeedback('Network error. Please check your connection.');
+        } else {
+            speakFeedback('Voice recognition error: ' + event.error);
+        }
+
+        stopVoiceRecording();
+    };
+
+    recognition.onend = function() {
+        if (voiceSettings.continuousMode && isListening) {
+            // Restart if in continuous mode
+            try {
+                recognition.start();
+            } catch (e) {
+                console.error('Failed to restart recognition:', e);
+                stopVoiceRecording();
+            }
+        } else {
+            stopVoiceRecording();
+        }
+    };
+
+    return true;
+}
+
+function toggleVoiceRecording() {
+    if (isListening) {
+        stopVoiceRecording();
+    } else {
+        startVoiceRecording();
+    }
+}
+
+function startVoiceRecording() {
+    if (!recognition) {
+        if (!initVoiceRecognition()) {
+            return;
+        }
+    }
+
+    try {
+        recognition.lang = voiceSettings.language;
+        recognition.continuous = voiceSettings.continuousMode;
+        recognition.start();
+        speakFeedback('Listening');
+    } catch (e) {
+        console.error('Failed to start recognition:', e);
+        speakFeedback('Failed to start voice recognition');
+    }
+}
+
+function stopVoiceRecording() {
+    if (recognition && isListening) {
+        recognition.stop();
+    }
+
+    isListening = false;
+    updateVoiceUI('idle');
+    document.getElementById('voice-status-text').textContent = 'Click the microphone to speak your task';
+
+    if (voiceTimeout) {
+        clearTimeout(voiceTimeout);
+        voiceTimeout = null;
+    }
+
+    // If there's text, offer to interpret it
+    const commandText = document.getElementById('command').value.trim();
+    if (commandText && voiceSettings.autoDetect) {
+        setTimeout(() => {
+            speakFeedback('Task captured. Click interpret to process.');
+        }, 500);
+    }
+}
+
+function updateVoiceUI(state) {
+    const micButton = document.getElementById('mic-button');
+    const micIcon = document.getElementById('mic-icon');
+
+    micButton.classList.remove('listening', 'processing');
+
+    if (state === 'listening') {
+        micButton.classList.add('listening');
+        micIcon.textContent = '⏸️';
+    } else if (state === 'processing') {
+        micButton.classList.add('processing');
+        micIcon.textContent = '⏳';
+    } else {
+        micIcon.textContent = '🎤';
+    }
+}
+
+function speakFeedback(text) {
+    if (!voiceSettings.voiceFeedback || !speechSynthesis) {
+        return;
+    }
+
+    // Cancel any ongoing speech
+    speechSynthesis.cancel();
+
+    const utterance = new SpeechSynthesisUtterance(text);
+    utterance.rate = 1.0;
+    utterance.pitch = 1.0;
+    utterance.volume = 0.8;
+
+    // Try to use a voice matching the selected language
+    const voices = speechSynthesis.getVoices();
+    const langPrefix = voiceSettings.language.substring(0, 2);
+    const matchingVoice = voices.find(voice => voice.lang.startsWith(langPrefix));
+    if (matchingVoice) {
+        utterance.voice = matchingVoice;
+    }
+
+    speechSynthesis.speak(utterance);
+}
+
+function toggleVoiceSettings() {
+    const panel = document.getElementById('voice-settings-panel');
+    panel.style.display = panel.style.display === 'none' ? 'block' : 'none';
+}
+
+function saveVoiceSettings() {
+    voiceSettings.voiceFeedback = document.getElementById('voice-feedback-toggle').checked;
+    voiceSettings.autoDetect = document.getElementById('auto-detect-toggle').checked;
+    voiceSettings.continuousMode = document.getElementById('continuous-mode-toggle').checked;
+    voiceSettings.language = document.getElementById('voice-language-select').value;
+
+    // Save to localStorage
+    localStorage.setItem('voiceSettings', JSON.stringify(voiceSettings));
+
+    // Update recognition if active
+    if (recognition) {
+        recognition.lang = voiceSettings.language;
+        recognition.continuous = voiceSettings.continuousMode;
+    }
+
+    speakFeedback('Settings saved');
+}
+
+function loadVoiceSettings() {
+    const saved = localStorage.getItem('voiceSettings');
+    if (saved) {
+        voiceSettings = JSON.parse(saved);
+
+        document.getElementById('voice-feedback-toggle').checked = voiceSettings.voiceFeedback;
+        document.getElementById('auto-detect-toggle').checked = voiceSettings.autoDetect;
+        document.getElementById('continuous-mode-toggle').checked = voiceSettings.continuousMode;
+        document.getElementById('voice-language-select').value = voiceSettings.language;
+    }
+}
+
+// Load voices when available
+if (speechSynthesis) {
+    speechSynthesis.onvoiceschanged = function() {
+        speechSynthesis.getVoices();
+    };
+}
+
+
+async function interpretTask() {
+    const command = document.getElementById('command').value.trim();
+    if (!command) {
+        showToast('Please enter a task description', 'error');
+        speakFeedback('Please enter a task description');
+        return;
+    }
+
+    // Update voice UI to show processing
+    updateVoiceUI('processing');
+    speakFeedback('Interpreting your task');
+
+    // Show loading state
+    const button = event.target;
+    const originalText = button.textContent;
+    button.disabled = true;
+    button.textContent = 'Interpreting...';
+
+    try {
+        let response = await fetch('/api/interpret_task', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({command: command, voice_input: true})
+        });
+
+        // The model runs in a background job; poll until it finishes
+        if (response.status === 202) {
+            const job = await response.json();
+            do {
+                await new Promise(resolve => setTimeout(resolve, 500));
+                response = await fetch(`/api/interpret_status/${job.job_id}`);
+            } while (response.status === 202);
+        }
+
+        if (response.ok) {
+            interpretedTask = await response.json();
+            displayInterpretation(interpretedTask);
+            speakFeedback('Task interpreted as ' + interpretedTask.type);
+        } else {
+            const error = await response.json();
+            showToast('Failed to interpret task: ' + (error.error || 'Unknown error'), 'error');
+            speakFeedback('Failed to interpret task');
+        }
+    } catch (error) {
+        showToast('Error: ' + error.message, 'error');
+        speakFeedback('Error interpreting task');
+    } finally {
+        button.disabled = false;
+        button.textContent = originalText;
+        updateVoiceUI('idle');
+    }
+}
+
+function displayInterpretation(task) {
+    // Show the confirmation area
+    document.getElementById('confirmation-area').style.display = 'block';
+
+    // Display task type
+    const typeSpan = document.getElementById('interpreted-type');
+    typeSpan.textContent = task.type.toUpperCase();
+    typeSpan.className = 'badge badge-default';
+
+    // Display content
+    document.getElementById('interpreted-content').textContent = task.content;
+
+    // Display metadata
+    const metadataDiv = document.getElementById('interpreted-metadata');
+    if (task.metadata && Object.keys(task.metadata).length > 0) {
+        metadataDiv.textContent = JSON.stringify(task.metadata, null, 2);
+    } else {
+        metadataDiv.textContent = 'No metadata specified';
+    }
+
+    // Scroll to confirmation area
+    document.getElementById('confirmation-area').scrollIntoView({ behavior: 'smooth' });
+}
+
+async function confirmAndQueue() {
+    if (!interpretedTask) {
+        showToast('No task to queue', 'error');
+        speakFeedback('No task to queue');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/add_task', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(interpretedTask)
+        });
+
+        if (response.ok) {
+            const result = await response.json();
+            showToast(`Task queued: ${result.task_id}`);
+            speakFeedback('Task queued successfully');
+            clearAll();
+            updateStatus();
+            loadTasks();
+        } else {
+            showToast('Failed to queue task', 'error');
+            speakFeedback('Failed to queue task');
+        }
+    } catch (error) {
+        showToast('Error: ' + error.message, 'error');
+        speakFeedback('Error queuing task');
+    }
+}
+
+function clearConfirmation() {
+    document.getElementById('confirmation-area').style.display = 'none';
+    interpretedTask = null;
+}
+
+function clearAll() {
+    document.getElementById('command').value = '';
+    clearConfirmation();
+}
+
+function clearForm() {
+    clearAll();
+}
+
+// Keep for backward compatibility but won't be used with new flow
+async function submitTask(event) {
+    event.preventDefault();
+    // This form submission is now handled through the interpret flow
+    interpretTask();
+}
+
+async function startProcessing() {
+    const processBtn = els.processBtn;
+    processBtn.disabled = true;
+    processBtn.innerHTML = 'Processing... <span class="loader" style="display: inline-block;"></span>';
+
+    try {
+        const response = await fetch('/api/start_processing', {method: 'POST'});
+        if (response.ok) {
+            showToast('Processing started');
+            speakFeedback('Processing started');
+            if (!eventSource) {
+                processingInterval = setInterval(updateStatus, 2000);
+            }
+            processBtn.classList.add('processing');
+        }
+    } catch (error) {
+        showToast('Error starting processing', 'error');
+        speakFeedback('Error starting processing');
+        processBtn.innerHTML = 'Start Processing';
+        processBtn.disabled = false;
+    }
+}
+
+async function stopProcessing() {
+    const processBtn = els.processBtn;
+
+    try {
+        const response = await fetch('/api/stop_processing', {method: 'POST'});
+        if (response.ok) {
+            showToast('Processing stopped');
+            if (processingInterval) {
+                clearInterval(processingInterval);
+                processingInterval = null;
+            }
+            processBtn.innerHTML = 'Start Processing';
+            processBtn.classList.remove('processing');
+            processBtn.disabled = false;
+        }
+    } catch (error) {
+        showToast('Error stopping processing', 'error');
+    }
+}
+
+async function clearCompleted() {
+    try {
+        const response = await fetch('/api/clear_completed', {method: 'POST'});
+        if (response.ok) {
+            showToast('Completed tasks cleared');
+            updateStatus();
+            loadTasks();
+        }
+    } catch (error) {
+        showToast('Error clearing tasks', 'error');
+    }
+}
+
+async function resetFailed() {
+    try {
+        const response = await fetch('/api/reset_failed', {method: 'POST'});
+        if (response.ok) {
+            showToast('Failed tasks reset');
+            updateStatus();
+            loadTasks();
+        }
+    } catch (error) {
+        showToast('Error resetting tasks', 'error');
+    }
+}
+
+async function updateStatus() {
+    try {
+        const response = await fetch('/api/status');
+        if (response.ok) {
+            const stats = await response.json();
+            applyStatus(stats, stats.processing === true);
+        }
+    } catch (error) {
+        console.error('Status update error:', error);
+    }
+}
+updateStatus = coalesced(updateStatus);
+
+function applyStatus(stats, isProcessing) {
+    els.total.textContent = stats.total || 0;
+    els.pending.textContent = stats.pending || 0;
+    els.processing.textContent = stats.processing || 0;
+    els.completed.textContent = stats.completed || 0;
+    els.failed.textContent = stats.failed || 0;
+
+    // Update button state based on actual processing status
+    const processBtn = els.processBtn;
+
+    if (isProcessing) {
+        processBtn.innerHTML = 'Processing... <span class="loader" style="display: inline-block;"></span>';
+        processBtn.classList.add('processing');
+        processBtn.disabled = true;
+    } else {
+        processBtn.innerHTML = 'Start Processing';
+        processBtn.classList.remove('processing');
+        processBtn.disabled = false;
+
+        // Clear processing interval when processing stops
+        if (processingInterval) {
+            clearInterval(processingInterval);
+            processingInterval = null;
+        }
+    }
+}
+
+// /api/events handlers: the full list once on connect, then patches
+const TASK_EVENT_HANDLERS = {
+    tasks(tasks) {
+        allTasks = tasks;
+    },
+    task_added(tasks) {
+        allTasks = allTasks.concat(tasks);
+    },
+    task_updated(changes) {
+        const known = new Map(allTasks.map(task => [task.id, task]));
+        changes.forEach(change => {
+            const task = known.get(change.id);
+            if (task) Object.assign(task, change);
+        });
+        if (viewedTaskId && changes.some(change => change.id === viewedTaskId)) {
+            viewResults(viewedTaskId);
+        }
+    },
+    task_deleted(ids) {
+        const gone = new Set(ids);
+        allTasks = allTasks.filter(task => !gone.has(task.id));
+    }
+};
+
+function applyTaskEvent(name, data) {
+    TASK_EVENT_HANDLERS[name](data);
+    renderTasks(allTasks);
+    if (currentTab === 'files') refreshFiles();
+}
+
+function pollUpdates() {
+    updateStatus();
+    loadTasks();
+    if (currentTab === 'files') refreshFiles();
+}
+
+// Live updates are pushed over Server-Sent Events; browsers without
+// EventSource fall back to polling every 5 seconds
+function startLiveUpdates() {
+    if (window.EventSource) {
+        eventSource = new EventSource('/api/events');
+        eventSource.addEventListener('status', (e) => {
+            const status = JSON.parse(e.data);
+            applyStatus(status.stats, status.processing);
+        });
+        Object.keys(TASK_EVENT_HANDLERS).forEach(name => {
+            eventSource.addEventListener(name, (e) => applyTaskEvent(name, JSON.parse(e.data)));
+        });
+        eventSource.onerror = () => {
+            // CLOSED means the server refused the stream (all SSE slots
+            // taken); dropped connections reconnect on their own
+            if (eventSource.readyState === EventSource.CLOSED) {
+                eventSource = null;
+                refreshInterval = setInterval(pollUpdates, 5000);
+            }
+        };
+    } else {
+        refreshInterval = setInterval(pollUpdates, 5000);
+    }
+}
+
+function stopLiveUpdates() {
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+    if (refreshInterval) {
+        clearInterval(refreshInterval);
+        refreshInterval = null;
+    }
+}
+
+
+// Status badge classes; retrying has no style of its own and shows as pending
+const BADGE_CLASSES = Object.freeze({
+    pending: 'badge badge-pending',
+    processing: 'badge badge-processing',
+    completed: 'badge badge-completed',
+    failed: 'badge badge-failed',
+    retrying: 'badge badge-pending'
+});
+
+// Rendered task rows by id, so a refresh only rebuilds rows that changed
+const taskRows = new Map();
+
+function taskRowKey(task) {
+    return [task.status, task.updated_at, task.progress, task.processing_time, task.content].join('|');
+}
+
+function taskRowHtml(task) {
+    return `
+        <div class="task-info">
+            <div class="task-id">${task.id}</div>
+            <div class="task-content">${task.content.substring(0, 100)}${task.content.length > 100 ? '...' : ''}</div>
+            <div class="task-meta">
+                <span class="badge badge-default">${task.type}</span>
+                <span class="${BADGE_CLASSES[task.status] || 'badge badge-default'}">${task.status}</span>
+                ${task.processing_time ? `<span class="badge badge-default">${task.processing_time.toFixed(1)}s</span>` : ''}
+            </div>
+        </div>
+        <div class="task-actions" style="display: flex; gap: 0.5rem;">
+            ${task.status === 'completed' || task.status === 'processing' ? 
+                `<button class="button button-ghost" onclick="viewResults('${task.id}')">View</button>` : 
+                ''}
+            ${task.status === 'pending' ? 
+                `<button class="button button-ghost" onclick="editTask('${task.id}')">Edit</button>` : 
+                ''}
+            <button class="button button-ghost" onclick="deleteTask('${task.id}')" style="color: #ef4444;">Delete</button>
+        </div>
+    `;
+}
+
+function renderTasks(tasks) {
+    const container = els.taskList;
+
+    if (tasks.length === 0) {
+        container.innerHTML = '<div class="empty-state">No tasks in queue</div>';
+        taskRows.clear();
+        return;
+    }
+
+    let list = container.querySelector(':scope > .task-list');
+    if (!list) {
+        container.innerHTML = '<div class="task-list"></div>';
+        list = container.firstChild;
+        taskRows.clear();
+    }
+
+    // Patch rows in place: create new ones, rebuild changed ones, keep order
+    const seen = new Set();
+    let previous = null;
+    tasks.forEach(task => {
+        seen.add(task.id);
+        const key = taskRowKey(task);
+        let row = taskRows.get(task.id);
+        if (!row) {
+            const node = document.createElement('div');
+            node.className = 'task-item';
+            node.innerHTML = taskRowHtml(task);
+            row = {node, key};
+            taskRows.set(task.id, row);
+        } else if (row.key !== key) {
+            row.node.innerHTML = taskRowHtml(task);
+            row.key = key;
+        }
+
+        const expected = previous ? previous.nextSibling : list.firstChild;
+        if (row.node !== expected) {
+            list.insertBefore(row.node, expected);
+        }
+        previous = row.node;
+    });
+
+    for (const [id, row] of taskRows) {
+        if (!seen.has(id)) {
+            row.node.remove();
+            taskRows.delete(id);
+        }
+    }
+}
+
+// Task opened with View; its results are refetched as it streams in
+let viewedTaskId = null;
+
+async function viewResults(taskId) {
+    try {
+        const response = await fetch(`/api/task/${taskId}`);
+        if (response.ok) {
+            const task = await response.json();
+            if (viewedTaskId !== taskId) {
+                switchTab('results');
+                viewedTaskId = taskId;
+            }
+            els.resultsList.innerHTML = 
+                `<div class="result-viewer">${JSON.stringify(task.results, null, 2)}</div>`;
+        }
+    } catch (error) {
+        showToast('Error loading results', 'error');
+    }
+}
+
+function switchTab(tabName) {
+    // Update current tab tracker
+    currentTab = tabName;
+    viewedTaskId = null;
+
+    // Update tab buttons
+    document.querySelectorAll('.tab-trigger').forEach(tab => {
+        tab.classList.remove('active');
+    });
+    document.querySelectorAll('.tab-content').forEach(content => {
+        content.classList.remove('active');
+    });
+
+    // Find the clicked button and activate it
+    const clickedButton = Array.from(document.querySelectorAll('.tab-trigger'))
+        .find(btn => btn.textContent.toLowerCase().includes(tabName) || btn.onclick?.toString().includes(tabName));
+    if (clickedButton) {
+        clickedButton.classList.add('active');
+    }
+
+    // Show the correct tab content
+    const tabContent = document.getElementById(`tab-${tabName}`);
+    if (tabContent) {
+        tabContent.classList.add('active');
+
+        // Load content based on tab
+        if (tabName === 'files') {
+            refreshFiles();
+        } else if (tabName === 'results') {
+            loadCompletedTasks();
+        } else if (tabName === 'cluster') {
+            onClusterTabOpen();
+        }
+    }
+}
+
+function showToast(message, type = 'success') {
+    const toast = els.toast;
+    toast.textContent = message;
+    toast.className = 'toast show' + (type === 'error' ? ' error' : '');
+
+    setTimeout(() => {
+        toast.classList.remove('show');
+    }, 3000);
+}
+
+// Auto-refresh
+els.autoRefresh.addEventListener('change', function() {
+    if (this.checked) {
+        startLiveUpdates();
+    } else {
+        stopLiveUpdates();
+    }
+});
+
+// File management functions
+async function refreshFiles() {
+    try {
+        const response = await fetch('/api/files');
+        if (response.ok) {
+            const files = await response.json();
+            displayFiles(files);
+        } else {
+            showToast('Error loading files', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading files:', error);
+        showToast('Error loading files', 'error');
+    }
+}
+refreshFiles = coalesced(refreshFiles);
+
+function displayFiles(files) {
+    const filesList = els.filesList;
+
+    if (files.length === 0) {
+        filesList.innerHTML = '<div class="empty-state">No files in workspace</div>';
+        return;
+    }
+
+    filesList.innerHTML = files.map(file => `
+        <div class="task-card" style="cursor: pointer; margin-bottom: 0.5rem;" onclick="downloadFile('${file.name}')">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div>
+                    <strong>${file.name}</strong>
+                    <div style="font-size: 0.75rem; color: #666;">
+                        ${formatFileSize(file.size)} • ${new Date(file.modified).toLocaleDateString()}
+                    </div>
+                </div>
+                <button class="btn" onclick="event.stopPropagation(); downloadFile('${file.name}')" style="font-size: 0.75rem;">📥 Download</button>
+            </div>
+        </div>
+    `).join('');
+}
+
+function formatFileSize(bytes) {
+    if (bytes === 0) return '0 B';
+    const k = 1024;
+    const sizes = ['B', 'KB', 'MB', 'GB'];
+    const i = Math.floor(Math.log(bytes) / Math.log(k));
+    return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
+}
+
+async function downloadFile(filename) {
+    try {
+        const response = await fetch(`/api/download/${encodeURIComponent(filename)}`);
+        if (response.ok) {
+            const blob = await response.blob();
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = filename;
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            window.URL.revokeObjectURL(url);
+            showToast('File downloaded: ' + filename, 'success');
+        } else {
+            showToast('Error downloading file', 'error');
+        }
+    } catch (error) {
+        showToast('Download failed: ' + error.message, 'error');
+    }
+}
+
+async function downloadWorkspace() {
+    try {
+        const response = await fetch('/api/download/workspace.zip');
+        if (response.ok) {
+            const blob = await response.blob();
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = 'workspace.zip';
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            window.URL.revokeObjectURL(url);
+            showToast('Workspace downloaded', 'success');
+        } else {
+            showToast('Error downloading workspace', 'error');
+        }
+    } catch (error) {
+        showToast('Download failed: ' + error.message, 'error');
+    }
+}
+
+// Cluster Status Functions
+async function refreshClusterStatus() {
+    try {
+        const response = await fetch('/api/cluster/status');
+        if (response.ok) {
+            const status = await response.json();
+            displayClusterStatus(status);
+            showToast('Cluster status updated', 'success');
+        } else {
+            showToast('Error loading cluster status', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading cluster status:', error);
+        showToast('Error loading cluster status', 'error');
+    }
+}
+
+function displayClusterStatus(status) {
+    const content = document.getElementById('cluster-status-content');
+
+    const statusIcon = status.connected ? '✅' : '❌';
+    const statusText = status.connected ? 'Connected' : 'Disconnected';
+    const statusColor = status.connected ? '#10b981' : '#ef4444';
+
+    const html = `
+        <div style="padding: 1rem;">
+            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 1rem;">
+                <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
+                    <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Status</div>
+                    <div style="font-size: 1.25rem; font-weight: bold; color: ${statusColor};">
+                        ${statusIcon} ${statusText}
+                    </div>
+                </div>
+                <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
+                    <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Model</div>
+                    <div style="font-size: 1.25rem; font-weight: bold;">${status.model || 'N/A'}</div>
+                </div>
+                <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
+                    <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Active Nodes</div>
+                    <div style="font-size: 1.25rem; font-weight: bold;">${status.nodes || 0}</div>
+                </div>
+                <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
+                    <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.25rem;">Cluster Host</div>
+                    <div style="font-size: 1rem; font-weight: bold;">${status.host || 'N/A'}:${status.port || 'N/A'}</div>
+                </div>
+            </div>
+            <div style="padding: 1rem; background: var(--muted); border-radius: 0.5rem;">
+                <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-bottom: 0.5rem;">Parallax SDK Status</div>
+                <div style="font-size: 0.875rem;">
+                    ${status.parallax_available ? '✅ Parallax SDK Available' : '⚠️  Parallax SDK Not Available (Using Ollama fallback)'}
+                </div>
+                ${status.last_check ? `
+                <div style="font-size: 0.75rem; color: var(--muted-foreground); margin-top: 0.5rem;">
+                    Last checked: ${new Date(status.last_check).toLocaleString()}
+                </div>
+                ` : ''}
+            </div>
+            ${!status.connected && status.parallax_available ? `
+            <div style="margin-top: 1rem; padding: 1rem; background: #fef3c7; border-left: 4px solid #f59e0b; border-radius: 0.5rem; color: #92400e;">
+                <strong>⚠️  Connection Issue</strong>
+                <p style="margin: 0.5rem 0 0 0; font-size: 0.875rem;">
+                    Make sure Parallax is running: <code style="background: #fff; padding: 0.125rem 0.25rem; border-radius: 0.25rem;">parallax serve</code>
+                </p>
+            </div>
+            ` : ''}
+        </div>
+    `;
+
+    content.innerHTML = html;
+}
+
+// Auto-refresh cluster status when tab is opened
+function onClusterTabOpen() {
+    refreshClusterStatus();
+}
+
+// Enhanced task display with progress
+function displayEnhancedTask(task) {
+    const results = typeof task.results === 'string' ? JSON.parse(task.results || '{}') : (task.results || {});
+    const steps = Object.keys(results);
+
+    let progressHtml = '';
+    if (task.status === 'processing' && steps.length > 0) {
+        progressHtml = `
+            <div style="margin: 0.5rem 0; font-size: 0.75rem;">
+                <strong>Progress:</strong> ${steps.map(step => 
+                    `<span style="background: #10b981; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem; margin: 0 0.25rem;">${step}</span>`
+                ).join('')}
+                <span style="background: #f59e0b; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem;">Processing...</span>
+            </div>
+        `;
+    }
+
+    // Show web search indicator
+    let searchIndicator = '';
+    if (results.web_search || results.search_docs || results.research) {
+        searchIndicator = '<span style="background: #3b82f6; color: white; padding: 0.25rem 0.5rem; border-radius: 0.25rem; font-size: 0.75rem;">🔍 Web Search</span>';
+    }
+
+    return progressHtml + searchIndicator;
+}
+
+// Track current tab for refresh
+let currentTab = 'queue';
+
+// Load completed tasks for results tab
+async function loadCompletedTasks() {
+    try {
+        const response = await fetch('/api/tasks');
+        if (response.ok) {
+            const data = await response.json();
+            const tasks = data.tasks || data;
+            const completedTasks = tasks.filter(t => t.status === 'completed');
+
+            // A task opened with View has replaced the list meanwhile
+            if (viewedTaskId) return;
+
+            const resultsDiv = els.resultsList;
+            if (completedTasks.length === 0) {
+                resultsDiv.innerHTML = '<div class="empty-state">No completed tasks</div>';
+                return;
+            }
+
+            resultsDiv.innerHTML = completedTasks.map(task => `
+                <div class="task-item" style="margin-bottom: 1rem; padding: 1rem; border: 1px solid #ddd; border-radius: 0.5rem;">
+                    <div style="display: flex; justify-content: between; margin-bottom: 0.5rem;">
+                        <strong>${task.type}</strong>
+                        <small>${new Date(task.created_at).toLocaleString()}</small>
+                    </div>
+                    <div style="margin-bottom: 0.5rem; font-size: 0.875rem;">
+                        ${task.content.substring(0, 150)}...
+                    </div>
+                    <button onclick="viewTaskResults('${task.id}')" class="btn" style="font-size: 0.75rem;">View Results</button>
+                </div>
+            `).join('');
+        }
+    } catch (error) {
+        console.error('Error loading completed tasks:', error);
+    }
+}
+loadCompletedTasks = coalesced(loadCompletedTasks);
+
+// Delete a task
+async function deleteTask(taskId) {
+    if (!confirm('Are you sure you want to delete this task?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/delete_task/${taskId}`, {method: 'DELETE'});
+        if (response.ok) {
+            showToast('Task deleted successfully');
+            updateStatus();
+            loadTasks();
+        } else {
+            const error = await response.json();
+            showToast(error.error || 'Failed to delete task', 'error');
+        }
+    } catch (error) {
+        showToast('Error deleting task', 'error');
+    }
+}
+
+// Edit a task
+async function editTask(taskId) {
+    // The list holds a trimmed copy; load the full task for its metadata
+    let task = null;
+    try {
+        const response = await fetch(`/api/task/${taskId}`);
+        if (response.ok) task = await response.json();
+    } catch (error) {
+        console.error('Error loading task:', error);
+    }
+    if (!task) {
+        showToast('Task not found', 'error');
+        return;
+    }
+
+    if (task.status !== 'pending') {
+        showToast('Can only edit pending tasks', 'error');
+        return;
+    }
+
+    // Create a modal for editing
+    const modal = document.getElementById('task-modal');
+    const modalTitle = document.getElementById('modal-title');
+    const modalBody = document.getElementById('modal-body');
+
+    modalTitle.textContent = `Edit Task ${task.id}`;
+
+    modalBody.innerHTML = `
+        <div class="form-group">
+            <label for="edit-content">Task Content:</label>
+            <textarea id="edit-content" style="width: 100%; min-height: 100px;">${task.content}</textarea>
+        </div>
+
+        <div class="form-group">
+            <label>Metadata (Optional):</label>
+            <div id="edit-metadata-container"></div>
+            <button type="button" class="button button-secondary" onclick="addEditMetadataRow()">+ Add Metadata</button>
+        </div>
+
+        <div style="display: flex; gap: 1rem; margin-top: 1.5rem;">
+            <button class="button button-primary" onclick="saveTaskEdit('${task.id}')">Save Changes</button>
+            <button class="button button-secondary" onclick="closeModal()">Cancel</button>
+        </div>
+    `;
+
+    // Populate existing metadata
+    const metadataContainer = document.getElementById('edit-metadata-container');
+    if (task.metadata && Object.keys(task.metadata).length > 0) {
+        Object.entries(task.metadata).forEach(([key, value]) => {
+            const row = document.createElement('div');
+            row.className = 'metadata-row';
+            row.innerHTML = `
+                <input type="text" placeholder="Key" class="meta-key" value="${key}">
+                <input type="text" placeholder="Value" class="meta-value" value="${value}">
+                <button type="button" class="button button-ghost icon-button" onclick="removeMetadataRow(this)">×</button>
+            `;
+            metadataContainer.appendChild(row);
+        });
+    } else {
+        addEditMetadataRow();
+    }
+
+    modal.classList.add('active');
+}
+
+function addEditMetadataRow() {
+    const container = document.getElementById('edit-metadata-container');
+    const row = document.createElement('div');
+    row.className = 'metadata-row';
+    row.innerHTML = `
+        <input type="text" placeholder="Key" class="meta-key">
+        <input type="text" placeholder="Value" class="meta-value">
+        <button type="button" class="button button-ghost icon-button" onclick="removeMetadataRow(this)">×</button>
+    `;
+    container.appendChild(row);
+}
+
+async function saveTaskEdit(taskId) {
+    const content = document.getElementById('edit-content').value.trim();
+    if (!content) {
+        showToast('Task content cannot be empty', 'error');
+        return;
+    }
+
+    const metadata = {};
+    document.querySelectorAll('#edit-metadata-container .metadata-row').forEach(row => {
+        const key = row.querySelector('.meta-key').value.trim();
+        const value = row.querySelector('.meta-value').value.trim();
+        if (key && value) {
+            metadata[key] = value;
+        }
+    });
+
+    try {
+        const response = await fetch(`/api/update_task/${taskId}`, {
+            method: 'PUT',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({content, metadata})
+        });
+
+        if (response.ok) {
+            showToast('Task updated successfully');
+            closeModal();
+            updateStatus();
+            loadTasks();
+        } else {
+            const error = await response.json();
+            showToast(error.error || 'Failed to update task', 'error');
+        }
+    } catch (error) {
+        showToast('Error updating task', 'error');
+    }
+}
+
+// Store tasks globally for edit/delete operations  
+let allTasks = [];
+
+// The list only needs these; results and metadata are fetched per task
+const TASK_LIST_FIELDS = 'id,type,content,status,processing_time,updated_at,progress,current_step,priority,error';
+let tasksEtag = null;
+
+// Update loadTasks to store tasks globally
+async function loadTasks() {
+    try {
+        const headers = tasksEtag ? {'If-None-Match': tasksEtag} : {};
+        const response = await fetch(`/api/tasks?fields=${TASK_LIST_FIELDS}`, {headers, cache: 'no-store'});
+        if (response.status === 304) {
+            return;  // Nothing changed since the last load
+        }
+        if (response.ok) {
+            tasksEtag = response.headers.get('ETag');
+            const data = await response.json();
+            allTasks = data.tasks || data; // Store globally and handle both formats
+            renderTasks(allTasks);
+        }
+    } catch (error) {
+        console.error('Error loading tasks:', error);
+    }
+}
+loadTasks = coalesced(loadTasks);
+
+// View individual task results
+async function viewTaskResults(taskId) {
+    try {
+        const response = await fetch(`/api/task/${taskId}`);
+        if (response.ok) {
+            const task = await response.json();
+            const resultsDiv = els.resultsList;
+
+            let resultsHtml = '<div class="result-viewer">';
+            resultsHtml += `<h3>Task: ${task.type}</h3>`;
+            resultsHtml += `<p><strong>Content:</strong> ${task.content}</p>`;
+            resultsHtml += `<p><strong>Processing Time:</strong> ${task.processing_time}s</p>`;
+            resultsHtml += '<h4>Results:</h4>';
+
+            if (task.results && typeof task.results === 'object') {
+                Object.entries(task.results).forEach(([key, value]) => {
+                    resultsHtml += `<div style="margin-bottom: 1rem;">`;
+                    resultsHtml += `<h5>${key.replace(/_/g, ' ').toUpperCase()}</h5>`;
+                    resultsHtml += `<pre style="background: #f5f5f5; padding: 1rem; border-radius: 0.25rem; white-space: pre-wrap; font-size: 0.875rem;">${typeof value === 'string' ? value : JSON.stringify(value, null, 2)}</pre>`;
+                    resultsHtml += `</div>`;
+                });
+            }
+
+            resultsHtml += `<button onclick="loadCompletedTasks()" class="btn" style="margin-top: 1rem;">← Back to Results</button>`;
+            resultsHtml += '</div>';
+
+            resultsDiv.innerHTML = resultsHtml;
+        }
+    } catch (error) {
+        console.error('Error loading task results:', error);
+    }
+}
+
+
+// Form submission
+document.getElementById('task-form').addEventListener('submit', submitTask);
+
+// Initial load
+updateStatus();
+loadTasks();
+
+// Initialize voice recognition
+loadVoiceSettings();
+initVoiceRecognition();
+
+// Start auto-refresh
+startLiveUpdates();
+
+// Hidden tabs drop the event stream and polling; on return, reconnect
+// (the stream resends the full list) and catch up on status
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        stopLiveUpdates();
+        if (processingInterval) {
+            clearInterval(processingInterval);
+            processingInterval = null;
+        }
+    } else {
+        if (els.autoRefresh.checked) {
+            startLiveUpdates();
+        }
+        updateStatus();
+        loadTasks();
+    }
+});
@@ -0,0 +1,50 @@
+"""Shared fixtures: obp-CLI.py isn't importable by name, so it is loaded from its path"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def cli(tmp_path_factory):
+    """The obp-CLI module, imported from a scratch directory (it opens its log file in the cwd)"""
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("cli"))
+    try:
+        spec = importlib.util.spec_from_file_location("obp_cli", REPO_ROOT / "obp-CLI.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test in an empty directory; the CLI keeps its queue, db and configs in the cwd"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def open_processor(cli, workdir):
+    """Factory for UniversalTaskProcessors in workdir, all shut down before the cwd is restored"""
+    instances = []
+
+    def factory():
+        instances.append(cli.UniversalTaskProcessor())
+        return instances[-1]
+
+    yield factory
+    for instance in instances:
+        instance.close_queue_writer()
+        instance.close_database()
+
+
+@pytest.fixture
+def processor(open_processor):
+    return open_processor()
@@ -0,0 +1,56 @@
+"""Behavior of the code execution plugin in obp-CLI.py"""
+
+import os
+import shutil
+
+import pytest
+
+needs_node = pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+
+
+@pytest.fixture
+def plugin(cli):
+    return cli.CodeExecutionPlugin()
+
+
+def test_python_output_and_errors(plugin):
+    assert plugin.execute_python("print(sum(range(10)))") == "45\n"
+    assert "ZeroDivisionError" in plugin.execute_python("1/0")
+
+
+def test_python_tasks_are_isolated(plugin, workdir):
+    plugin.execute_python("import os, sys; os.chdir('/'); sys.path.insert(0, '/nowhere'); import json; json.x = 1")
+    assert plugin.execute_python("import os; print(os.getcwd())") == f"{os.getcwd()}\n"
+    assert plugin.execute_python("import sys; print('/nowhere' in sys.path)") == "False\n"
+    assert plugin.execute_python("import json; print(hasattr(json, 'x'))") == "False\n"
+
+
+def test_python_output_from_child_processes_is_captured(plugin):
+    code = "import os, sys; os.system(f'{sys.executable} -c \"print(1)\"'); os.write(1, b'fd\\n')"
+    assert plugin.execute_python(code) == "1\nfd\n"
+
+
+def test_python_timeout(plugin, cli, monkeypatch):
+    monkeypatch.setattr(cli, "CODE_TIMEOUT", 1)
+    assert "timed out" in plugin.execute_python("while True: pass")
+    assert plugin.execute_python("print('next')") == "next\n"
+
+
+@needs_node
+def test_javascript_async_output_is_kept(plugin):
+    code = ("setTimeout(() => console.log('later'), 50); "
+            "Promise.resolve().then(() => console.log('async')); "
+            "console.log('now')")
+    assert plugin.execute_javascript(code) == "now\nasync\nlater\n"
+
+
+@needs_node
+def test_javascript_process_exit_only_ends_that_task(plugin):
+    assert plugin.execute_javascript("console.log('bye'); process.exit(3)") == "bye\n"
+    assert plugin.execute_javascript("console.log(1 + 1)") == "2\n"
+
+
+@needs_node
+def test_javascript_tasks_are_isolated(plugin):
+    plugin.execute_javascript("globalThis.leak = 1; process.chdir('/')")
+    assert plugin.execute_javascript("console.log(typeof leak, process.cwd())") == f"undefined {os.getcwd()}\n"
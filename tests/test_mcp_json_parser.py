@@ -0,0 +1,37 @@
+"""Tests for the JSON -> YAML conversion paths in mcp_json_parser"""
+
+import json
+
+import pytest
+
+import mcp_json_parser
+from mcp_json_parser import MCPJSONParser
+
+pytest.importorskip("ijson")
+
+DOCUMENTS = [
+    {"zeta": 1, "alpha": [1.5, 0.1, 1e20, -0, True, None, "x"], "mid": {"z": {}, "y": []}},
+    {"b": {"d": 1, "c": 2}, "a": "ü", "yes": "yes", "num_str": "1.0", "small": 2.5e-7},
+    {"big": 123456789012345678901234567890, "trailing_zero": 1.10, "text": "word " * 40},
+    [{"b": 1, "a": 2}, [], {}],
+]
+
+
+@pytest.mark.parametrize("doc", DOCUMENTS)
+def test_streaming_and_tree_paths_agree(doc, monkeypatch):
+    """The same document converts to the same YAML whichever side of STREAM_THRESHOLD it falls"""
+    json_string = json.dumps(doc)
+    parser = MCPJSONParser()
+
+    monkeypatch.setattr(mcp_json_parser, "STREAM_THRESHOLD", len(json_string) + 1)
+    tree = parser.json_to_yaml(json_string)
+    monkeypatch.setattr(mcp_json_parser, "STREAM_THRESHOLD", 0)
+    streamed = parser.json_to_yaml(json_string)
+
+    assert tree["status"] == streamed["status"] == "success"
+    assert streamed["yaml_string"] == tree["yaml_string"]
+
+
+def test_key_order_is_preserved():
+    result = MCPJSONParser().json_to_yaml(json.dumps({"b": 1, "a": 2}))
+    assert result["yaml_string"] == "b: 1\na: 2\n"
@@ -0,0 +1,19 @@
+"""Prompt cache bounds in obp-CLI.py"""
+
+import hashlib
+
+
+def test_periodic_purge_trims_the_table(cli, processor, monkeypatch):
+    monkeypatch.setattr(cli, "PROMPT_CACHE_PURGE_EVERY", 10)
+    monkeypatch.setattr(cli, "PROMPT_CACHE_MAX_ROWS", 5)
+    for i in range(30):
+        processor.cache_response(f"{i:032x}", str(i))
+    assert processor.db_conn.execute("SELECT count(*) FROM prompt_cache").fetchone()[0] == 5
+
+
+def test_purge_drops_sha256_keyed_rows(processor):
+    processor.db_conn.execute("INSERT INTO prompt_cache (key, response) VALUES (?, 'old')",
+                              (hashlib.sha256(b"prompt").hexdigest(),))
+    processor.cache_response(hashlib.blake2b(b"prompt", digest_size=16).hexdigest(), "new")
+    processor.purge_prompt_cache()
+    assert processor.db_conn.execute("SELECT response FROM prompt_cache").fetchall() == [("new",)]
@@ -0,0 +1,87 @@
+"""Queue journal replay and compaction in obp-CLI.py"""
+
+import json
+import time
+
+
+def make_task(cli, task_id):
+    return cli.Task(id=task_id, type=cli.TaskType.PROCESS, content=f"content of {task_id}",
+                    config_name="process_tasks")
+
+
+def journal_add(processor, task, flush=True):
+    processor._append_journal({"op": "add", "task": task.to_dict()}, flush=flush)
+
+
+def test_adds_and_updates_are_replayed(cli, processor, open_processor):
+    task = make_task(cli, "t1")
+    journal_add(processor, task, flush=False)
+    task.status = cli.TaskStatus.COMPLETED
+    task.results = {"1": "answer"}
+    task.processing_time = 1.5
+    processor._journal_update(task)
+
+    [replayed] = open_processor().queue
+    assert replayed.id == "t1"
+    assert replayed.status == cli.TaskStatus.COMPLETED
+    assert replayed.results == {"1": "answer"}
+    assert replayed.processing_time == 1.5
+
+
+def test_batched_lines_are_flushed_after_a_delay(cli, processor, open_processor, monkeypatch):
+    monkeypatch.setattr(cli, "JOURNAL_FLUSH_DELAY", 0.01)
+    journal_add(processor, make_task(cli, "t1"), flush=False)
+    deadline = time.monotonic() + 5
+    while not processor.journal_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [t.id for t in open_processor().queue] == ["t1"]
+
+
+def test_torn_last_line_is_ignored(cli, processor, open_processor):
+    journal_add(processor, make_task(cli, "t1"))
+    with open(processor.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "task": {"id": "t2"')
+    assert [t.id for t in open_processor().queue] == ["t1"]
+
+
+def test_save_compacts_the_journal(cli, processor, open_processor):
+    task = make_task(cli, "t1")
+    processor.queue.append(task)
+    journal_add(processor, task)
+    processor.save_queue(wait=True)
+
+    assert not processor.journal_file.exists()
+    assert [t["id"] for t in json.loads(processor.queue_file.read_text())] == ["t1"]
+    assert [t.id for t in open_processor().queue] == ["t1"]
+
+
+def test_adds_already_in_the_snapshot_are_not_duplicated(cli, processor, open_processor):
+    task = make_task(cli, "t1")
+    processor.queue.append(task)
+    processor.save_queue(wait=True)
+    # A journal left behind by a process that died after the snapshot was written
+    journal_add(processor, task)
+    assert [t.id for t in open_processor().queue] == ["t1"]
+
+
+def test_journal_removed_by_another_process_is_reopened(cli, processor, open_processor):
+    other = open_processor()
+    journal_add(processor, make_task(cli, "t1"))
+    other.save_queue(wait=True)
+    assert not processor.journal_file.exists()
+
+    journal_add(processor, make_task(cli, "t2"))
+    assert [t.id for t in open_processor().queue] == ["t2"]
+
+
+def test_stats_sidecar_is_only_trusted_next_to_its_snapshot(cli, processor):
+    assert cli.read_queue_stats() is None
+    processor.queue.append(make_task(cli, "t1"))
+    processor.save_queue(wait=True)
+    assert cli.read_queue_stats()["total"] == 1
+
+    journal_add(processor, make_task(cli, "t2"))
+    assert cli.read_queue_stats() is None
+    processor.queue_file.unlink()
+    processor.journal_file.unlink()
+    assert cli.read_queue_stats() is None